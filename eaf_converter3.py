@@ -1,9 +1,13 @@
 # Jupyter Lab用 EAFファイル変換コード（完全版：音声切り出し機能付き、デスクトップ保存対応）
 import xml.etree.ElementTree as ET
+import functools
+import io
+import operator
 import os
 import re
-import shutil
+import unicodedata
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 import time
@@ -13,6 +17,7 @@ AUDIO_LIBRARY = None
 try:
     import librosa
     import soundfile as sf
+    import numpy as np
     AUDIO_LIBRARY = 'librosa'
     print("✅ librosa + soundfile を使用します")
 except ImportError:
@@ -30,6 +35,247 @@ except ImportError:
             AUDIO_LIBRARY = None
             print("⚠️ 音声処理ライブラリなし（テキスト変換のみ利用可能）")
 
+# NumPy（任意）: 長い行の単語幅をまとめて計算するために使用
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# IPA文字とtipaコマンドの対応表（{}を追加して区切りを明確化）
+# キーが全て1文字なので、str.translate用の変換表として読み込み時に一度だけ作成
+_IPA_TO_TIPA = str.maketrans({
+    'ɨ': '\\textbari{}',
+    'ɯ': '\\textturnm{}',
+    'ɛ': '\\textepsilon{}',
+    'ɔ': '\\textopeno{}',
+    'æ': '\\textae{}',
+    'ɑ': '\\textscripta{}',
+    'ɒ': '\\textturnscripta{}',
+    'ə': '\\textschwa{}',
+    'ɪ': '\\textsci{}',
+    'ʊ': '\\textupsilon{}',
+    'ʃ': '\\textesh{}',
+    'ʒ': '\\textyogh{}',
+    'θ': '\\texttheta{}',
+    'ð': '\\texteth{}',
+    'ŋ': '\\texteng{}',
+    'ɲ': '\\textltailn{}',
+    'ɳ': '\\textrtailn{}',
+    'ɱ': '\\textltailm{}',
+    'ɾ': '\\textfishhookr{}',
+    'ɽ': '\\textrtailr{}',
+    'ɻ': '\\textturnr{}',
+    'ɭ': '\\textrtaill{}',
+    'ʎ': '\\textturny{}',
+    'ʈ': '\\textrtailt{}',
+    'ɖ': '\\textrtaild{}',
+    'ʂ': '\\textrtails{}',
+    'ʐ': '\\textrtailz{}',
+    'ɕ': '\\textctc{}',
+    'ʑ': '\\textctj{}',
+    'ç': '\\textccedilla{}',
+    'ʝ': '\\textctj{}',
+    'ɣ': '\\textgamma{}',
+    'χ': '\\textchi{}',
+    'ʁ': '\\textinvscr{}',
+    'ħ': '\\textcrh{}',
+    'ʕ': '\\textrevglotstop{}',
+    'ʔ': '\\textglotstop{}',
+    'ɸ': '\\textphi{}',
+    'β': '\\textbeta{}',
+    'ʋ': '\\textscriptv{}',
+    'ɹ': '\\textturnr{}',
+    'ɰ': '\\textturnmrleg{}',
+    'ɺ': '\\textlhti{}',
+    'ɢ': '\\textscg{}',
+    'ʛ': '\\texthtg{}',
+    'ʄ': '\\texthtbardotlessjdotlessj{}',
+    'ɠ': '\\texthtg{}',
+    'ɡ': '\\textscg{}',
+    'ː': '\\textlengthmark{}',
+    'ˈ': '\\textprimstress{}',
+    'ˌ': '\\textsecstress{}',
+    'ʲ': '\\textpal{}',
+    'ʷ': '\\textlab{}',
+    'ʰ': '\\textsuperscript{h}',
+    'ⁿ': '\\textsuperscript{n}',
+    'ʼ': '\\textglotstop{}',
+})
+
+# tipaコマンドからIPA文字への対応表（_IPA_TO_TIPAの逆変換）
+_TIPA_TO_IPA = {
+    '\\textbari{}': 'ɨ',
+    '\\textturnm{}': 'ɯ',
+    '\\textepsilon{}': 'ɛ',
+    '\\textopeno{}': 'ɔ',
+    '\\textae{}': 'æ',
+    '\\textscripta{}': 'ɑ',
+    '\\textturnscripta{}': 'ɒ',
+    '\\textschwa{}': 'ə',
+    '\\textsci{}': 'ɪ',
+    '\\textupsilon{}': 'ʊ',
+    '\\textesh{}': 'ʃ',
+    '\\textyogh{}': 'ʒ',
+    '\\texttheta{}': 'θ',
+    '\\texteth{}': 'ð',
+    '\\texteng{}': 'ŋ',
+    '\\textltailn{}': 'ɲ',
+    '\\textrtailn{}': 'ɳ',
+    '\\textltailm{}': 'ɱ',
+    '\\textfishhookr{}': 'ɾ',
+    '\\textrtailr{}': 'ɽ',
+    '\\textturnr{}': 'ɻ',
+    '\\textrtaill{}': 'ɭ',
+    '\\textturny{}': 'ʎ',
+    '\\textrtailt{}': 'ʈ',
+    '\\textrtaild{}': 'ɖ',
+    '\\textrtails{}': 'ʂ',
+    '\\textrtailz{}': 'ʐ',
+    '\\textctc{}': 'ɕ',
+    '\\textctj{}': 'ʑ',
+    '\\textccedilla{}': 'ç',
+    '\\textgamma{}': 'ɣ',
+    '\\textchi{}': 'χ',
+    '\\textinvscr{}': 'ʁ',
+    '\\textcrh{}': 'ħ',
+    '\\textrevglotstop{}': 'ʕ',
+    '\\textglotstop{}': 'ʔ',
+    '\\textphi{}': 'ɸ',
+    '\\textbeta{}': 'β',
+    '\\textscriptv{}': 'ʋ',
+    '\\textturnmrleg{}': 'ɰ',
+    '\\textlhti{}': 'ɺ',
+    '\\textscg{}': 'ɢ',
+    '\\texthtg{}': 'ʛ',
+    '\\texthtbardotlessjdotlessj{}': 'ʄ',
+    '\\textbardotlessj{}': 'ɟ',
+    '\\textlengthmark{}': 'ː',
+    '\\textprimstress{}': 'ˈ',
+    '\\textsecstress{}': 'ˌ',
+    '\\textpal{}': 'ʲ',
+    '\\textlab{}': 'ʷ',
+    '\\textsuperscript{h}': 'ʰ',
+    '\\textsuperscript{n}': 'ⁿ',
+}
+# 共通の接頭辞（\text）を一度だけ照合し、続く部分を長いキーから順に照合
+# （短いコマンドが長いコマンドの一部に一致しないように）
+_TIPA_PREFIX = os.path.commonprefix(list(_TIPA_TO_IPA))
+_TIPA_RE = re.compile(re.escape(_TIPA_PREFIX) + '(?:' + '|'.join(
+    re.escape(k[len(_TIPA_PREFIX):]) for k in sorted(_TIPA_TO_IPA, key=len, reverse=True)) + ')')
+# _TIPA_REの一致箇所の置換関数（呼び出しごとにクロージャを作らないようモジュールレベルで定義）
+def _tipa_match_to_ipa(match):
+    return _TIPA_TO_IPA[match.group()]
+
+# tipaコマンドに変換して戻すと別の文字になるIPA文字（例: ɹ → \textturnr{} → ɻ）
+# この表でのstr.translateは、IPAテキストのIPA→tipa→IPAの往復変換と同じ結果になる
+_IPA_NORMALIZE = {cp: _TIPA_TO_IPA.get(cmd, cmd) for cp, cmd in _IPA_TO_TIPA.items()
+                  if _TIPA_TO_IPA.get(cmd) != chr(cp)}
+
+# 文末記号（.?!）を一度のstr.translateで削除（文字数・単語数の計算用）
+_STRIP_SENTENCE_PUNCT = str.maketrans('', '', '.?!')
+
+# 音声セグメントの並列書き出し数（ディスク律速なのでこれ以上スレッドを増やしても競合するだけ）
+_SEGMENT_WRITE_WORKERS = min(8, os.cpu_count() or 1)
+
+# 分割音声のファイル名用（使えない文字の削除・空白の置換）
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# \textsc{...}の中身 → Unicodeの小型大文字
+_SMALLCAP_MAPPING = {
+    'nom': 'ɴᴏᴍ', 'acc': 'ᴀᴄᴄ', 'gen': 'ɢᴇɴ',
+    'dat': 'ᴅᴀᴛ', 'abl': 'ᴀʙʟ', 'loc': 'ʟᴏᴄ',
+    'pst': 'ᴘsᴛ', 'prs': 'ᴘʀs', 'fut': 'ꜰᴜᴛ',
+    'npst': 'ɴᴘsᴛ', 'pfv': 'ᴘꜰᴠ', 'ipfv': 'ɪᴘꜰᴠ',
+    'sg': 'sɢ', 'pl': 'ᴘʟ', 'du': 'ᴅᴜ',
+    'cop': 'ᴄᴏᴘ', 'aux': 'ᴀᴜx', 'neg': 'ɴᴇɢ',
+    'foc': 'ꜰᴏᴄ', 'top': 'ᴛᴏᴘ', 'emph': 'ᴇᴍᴘʜ',
+    'hs': 'ʜs', 'evid': 'ᴇᴠɪᴅ', 'quot': 'Qᴜᴏᴛ',
+    'sfp': 'sꜰᴘ', 'cas': 'ᴄᴀs', 'part': 'ᴘᴀʀᴛ',
+    'caus': 'ᴄᴀᴜs', 'pass': 'ᴘᴀss', 'refl': 'ʀᴇꜰʟ',
+    'q': 'Q', 'clf': 'ᴄʟꜰ', 'det': 'ᴅᴇᴛ',
+    'def': 'ᴅᴇꜰ', 'indef': 'ɪɴᴅᴇꜰ', 'com': 'ᴄᴏᴍ'
+}
+# 大文字1文字ごとの小型大文字（str.translate用、小型大文字のない文字はそのまま）
+_SMALLCAPS_TRANS = str.maketrans({
+    'A': 'ᴀ', 'B': 'ʙ', 'C': 'ᴄ', 'D': 'ᴅ', 'E': 'ᴇ', 'F': 'ꜰ',
+    'G': 'ɢ', 'H': 'ʜ', 'I': 'ɪ', 'J': 'ᴊ', 'K': 'ᴋ', 'L': 'ʟ',
+    'M': 'ᴍ', 'N': 'ɴ', 'O': 'ᴏ', 'P': 'ᴘ', 'R': 'ʀ', 'S': 's',
+    'T': 'ᴛ', 'U': 'ᴜ', 'V': 'ᴠ', 'W': 'ᴡ', 'X': 'x', 'Y': 'ʏ',
+    'Z': 'ᴢ'
+})
+
+# Leipzig.sty変換の置換関数（呼び出しごとに関数や対応表を作らないようモジュールレベルで定義）
+def _unknown_caps_to_textsc(match):
+    return f'\\\\textsc{{{match.group(0).lower()}}}'
+
+def _textsc_to_smallcaps(match):
+    content = match.group(1)
+    return _SMALLCAP_MAPPING.get(content.lower(), content.upper())
+
+def _caps_to_smallcaps(match):
+    return match.group(0).translate(_SMALLCAPS_TRANS)
+
+# 表示幅が2になるEast Asian Widthの分類（Fullwidth, Wide）
+_WIDE_EAST_ASIAN_WIDTHS = frozenset('FW')
+
+@functools.lru_cache(maxsize=4096)
+def _char_width(char):
+    """1文字の表示幅（全角・広い文字は2、それ以外は1）"""
+    if char.isascii():
+        # ASCII文字は全て幅1（unicodedataを呼ばない）
+        return 1
+    return 2 if unicodedata.east_asian_width(char) in _WIDE_EAST_ASIAN_WIDTHS else 1
+
+def _str_width(s):
+    """doc形式の位置揃え用の文字列の表示幅"""
+    if s.isascii():
+        # ASCII文字は全て幅1
+        return len(s)
+    return sum(map(_char_width, s))
+
+# この文字数以上の行は単語幅をNumPyで一括計算（短い行ではNumPyの呼び出しコストの方が大きい）
+_NUMPY_WIDTH_MIN_CHARS = 256
+_WIDTH_LUT = None  # コードポイント → 表示幅（0は未計算）
+
+def _word_widths(words):
+    """単語リスト（str.split()の結果のような空でない単語）の表示幅"""
+    global _WIDTH_LUT
+    joined = ''.join(words)
+    if joined.isascii():
+        # ASCIIだけの行（ローマ字表記のコーパスではこれが普通）は幅 = 文字数
+        return list(map(len, words))
+    if not HAS_NUMPY or len(joined) < _NUMPY_WIDTH_MIN_CHARS:
+        return [_str_width(word) for word in words]
+    
+    if _WIDTH_LUT is None:
+        _WIDTH_LUT = np.zeros(0x110000, dtype=np.uint8)
+    codepoints = np.frombuffer(joined.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    # この行で初めて出てきた文字の幅だけを表に追加
+    unique_codepoints = np.unique(codepoints)
+    for cp in unique_codepoints[_WIDTH_LUT[unique_codepoints] == 0].tolist():
+        _WIDTH_LUT[cp] = _char_width(chr(cp))
+    # 単語ごとの幅の合計を一度に計算
+    offsets = np.cumsum([0] + [len(word) for word in words[:-1]])
+    return np.add.reduceat(_WIDTH_LUT[codepoints].astype(np.int64), offsets).tolist()
+
+# gb4e出力の固定部分（ヘッダーと例文の開始・終了）
+_GB4E_HEADER = (
+    "% UTF-8エンコーディング用設定\n"
+    "% \\usepackage[utf8]{inputenc}\n"
+    "% \\usepackage{CJKutf8}\n"
+    "% \\usepackage{gb4e}\n"
+    "% \\usepackage{tipa}\n"
+    "% \\usepackage{leipzig}  % Leipzig.styパッケージ\n"
+    "\n"
+    "% Leipzig.styの使用により、大文字の文法記号が自動的に小文字のスモールキャップスに変換されます\n"
+    "% IPA文字は自動的にtipaコマンドに変換されます\n"
+    "\n"
+)
+_GB4E_EXAMPLE_BEGIN = "\\begin{exe}\n\\ex\n"
+_GB4E_EXAMPLE_END = "\\end{exe}\n\n"
+
 def get_desktop_path():
     """デスクトップのパスを取得（OS別対応）"""
     import platform
@@ -49,12 +295,60 @@ def get_desktop_path():
     
     return desktop
 
+def _annotation_value(annotation):
+    """アノテーション要素のANNOTATION_VALUE（前後の空白を除去、なければ空文字）"""
+    value_elem = annotation.find('ANNOTATION_VALUE')
+    value = value_elem.text if value_elem is not None else ""
+    return value.strip() if value else ""
+
+def _stream_eaf(path):
+    """EAFファイルを逐次解析し、読み終えたTIERの部分木はその都度破棄する
+    
+    戻り値は (time_slots, tiers, align_slots, ref_parent):
+    - time_slots: {TIME_SLOT_ID: ミリ秒}
+    - tiers: ティアごとの (tier_id, [(slot_ref1, slot_ref2, value), ...], [(annotation_ref, value), ...])（ファイル順）
+    - align_slots: ALIGNABLE_ANNOTATIONの {ANNOTATION_ID: (slot_ref1, slot_ref2)}
+    - ref_parent: REF_ANNOTATIONの {ANNOTATION_ID: ANNOTATION_REF}
+    """
+    time_slots = {}
+    tiers = []
+    align_slots = {}
+    ref_parent = {}
+    
+    for _, elem in ET.iterparse(path):
+        if elem.tag == 'TIME_SLOT':
+            time_value = elem.get('TIME_VALUE')
+            time_slots[elem.get('TIME_SLOT_ID')] = int(time_value) if time_value else 0
+        elif elem.tag == 'TIER':
+            alignable = elem.findall('.//ALIGNABLE_ANNOTATION')
+            refs = elem.findall('.//REF_ANNOTATION')
+            
+            # 以前の検索順（ティア順、ALIGNABLE→REF）で最初に見つかったIDを優先
+            for annotation in alignable:
+                annotation_id = annotation.get('ANNOTATION_ID')
+                if annotation_id not in align_slots and annotation_id not in ref_parent:
+                    align_slots[annotation_id] = (annotation.get('TIME_SLOT_REF1'), annotation.get('TIME_SLOT_REF2'))
+            for annotation in refs:
+                annotation_id = annotation.get('ANNOTATION_ID')
+                nested_ref_id = annotation.get('ANNOTATION_REF')
+                if nested_ref_id and annotation_id not in align_slots and annotation_id not in ref_parent:
+                    ref_parent[annotation_id] = nested_ref_id
+            
+            tiers.append((
+                elem.get('TIER_ID'),
+                [(a.get('TIME_SLOT_REF1'), a.get('TIME_SLOT_REF2'), _annotation_value(a)) for a in alignable],
+                [(a.get('ANNOTATION_REF'), _annotation_value(a)) for a in refs]
+            ))
+            elem.clear()  # 読み終えたティアのアノテーション要素を解放
+    
+    return time_slots, tiers, align_slots, ref_parent
+
 class EAFConverter:
     def __init__(self, eaf_file_path: str, wav_file_path: str = None):
         self.eaf_file_path = eaf_file_path
         self.wav_file_path = wav_file_path
-        self.tree = None
-        self.root = None
+        self._align_index = {}  # ALIGNABLE_ANNOTATIONのID → (開始ms, 終了ms)
+        self._ref_parent = {}   # REF_ANNOTATIONのID → 参照先ID
         self.time_slots = {}
         self.tiers = {}
         
@@ -79,7 +373,9 @@ class EAFConverter:
             
         try:
             if AUDIO_LIBRARY == 'librosa':
-                self.audio_data, self.sample_rate = librosa.load(self.wav_file_path, sr=None)
+                audio, self.sample_rate = librosa.load(self.wav_file_path, sr=None)
+                # 16bit PCMへの変換（sf.writeと同じスケーリング・クリッピング）を読み込み時に一度だけ行う
+                self.audio_data = np.clip(np.floor(audio * 32768), -32768, 32767).astype(np.int16)
                 print(f"音声ファイルを読み込みました: {self.wav_file_path}")
                 print(f"サンプリング周波数: {self.sample_rate}Hz, 長さ: {len(self.audio_data)/self.sample_rate:.2f}秒")
                 
@@ -112,8 +408,8 @@ class EAFConverter:
     def parse_eaf(self):
         """EAFファイルを解析する"""
         try:
-            self.tree = ET.parse(self.eaf_file_path)
-            self.root = self.tree.getroot()
+            # DOM全体を保持せず、ティア単位で逐次解析
+            time_slots, tiers, align_slots, self._ref_parent = _stream_eaf(self.eaf_file_path)
             print(f"EAFファイルを正常に読み込みました: {self.eaf_file_path}")
         except ET.ParseError as e:
             print(f"XMLパースエラー: {e}")
@@ -123,77 +419,64 @@ class EAFConverter:
             return False
             
         # タイムスロットを取得
-        time_order = self.root.find('TIME_ORDER')
-        if time_order is not None:
-            for time_slot in time_order.findall('TIME_SLOT'):
-                slot_id = time_slot.get('TIME_SLOT_ID')
-                time_value = time_slot.get('TIME_VALUE')
-                self.time_slots[slot_id] = int(time_value) if time_value else 0
+        self.time_slots.update(time_slots)
         
         print(f"タイムスロット数: {len(self.time_slots)}")
         
         # ティア情報を表示
         print("\n利用可能なティア:")
-        for tier in self.root.findall('TIER'):
-            tier_id = tier.get('TIER_ID')
+        for tier_id, _, _ in tiers:
             print(f"  - {tier_id}")
             
+        # REF_ANNOTATIONの参照解決用に、ALIGNABLE_ANNOTATIONのID → 時間の索引を作成
+        self._align_index = {
+            annotation_id: (self.time_slots.get(start_id, 0), self.time_slots.get(end_id, 0))
+            for annotation_id, (start_id, end_id) in align_slots.items()
+        }
+        
         # ティアを取得
-        for tier in self.root.findall('TIER'):
-            tier_id = tier.get('TIER_ID')
+        for tier_id, alignable, refs in tiers:
             self.tiers[tier_id] = []
             
             # ALIGNABLE_ANNOTATIONをチェック
-            for annotation in tier.findall('.//ALIGNABLE_ANNOTATION'):
-                start_id = annotation.get('TIME_SLOT_REF1')
-                end_id = annotation.get('TIME_SLOT_REF2')
-                value_elem = annotation.find('ANNOTATION_VALUE')
-                value = value_elem.text if value_elem is not None else ""
-                
+            for start_id, end_id, value in alignable:
                 self.tiers[tier_id].append({
                     'start_time': self.time_slots.get(start_id, 0),
                     'end_time': self.time_slots.get(end_id, 0),
-                    'value': value.strip() if value else "",
+                    'value': value,
                     'type': 'ALIGNABLE'
                 })
             
             # REF_ANNOTATIONもチェック
-            for annotation in tier.findall('.//REF_ANNOTATION'):
-                ref_id = annotation.get('ANNOTATION_REF')
-                value_elem = annotation.find('ANNOTATION_VALUE')
-                value = value_elem.text if value_elem is not None else ""
-                
+            for ref_id, value in refs:
                 # 参照先のアノテーションの時間を取得
                 ref_start, ref_end = self._get_ref_time(ref_id)
                 
                 self.tiers[tier_id].append({
                     'start_time': ref_start,
                     'end_time': ref_end,
-                    'value': value.strip() if value else "",
+                    'value': value,
                     'type': 'REF',
                     'ref_id': ref_id
                 })
             
             # 開始時間でソート
-            self.tiers[tier_id].sort(key=lambda x: x['start_time'])
+            self.tiers[tier_id].sort(key=operator.itemgetter('start_time'))
             print(f"  {tier_id}: {len(self.tiers[tier_id])} アノテーション")
         
         return True
     
     def _get_ref_time(self, ref_id: str) -> tuple:
         """REF_ANNOTATIONの参照先の時間を取得"""
-        for tier in self.root.findall('TIER'):
-            for annotation in tier.findall('.//ALIGNABLE_ANNOTATION'):
-                if annotation.get('ANNOTATION_ID') == ref_id:
-                    start_id = annotation.get('TIME_SLOT_REF1')
-                    end_id = annotation.get('TIME_SLOT_REF2')
-                    return (self.time_slots.get(start_id, 0), self.time_slots.get(end_id, 0))
-            
-            for annotation in tier.findall('.//REF_ANNOTATION'):
-                if annotation.get('ANNOTATION_ID') == ref_id:
-                    nested_ref_id = annotation.get('ANNOTATION_REF')
-                    if nested_ref_id:
-                        return self._get_ref_time(nested_ref_id)
+        # REF→REFの参照をALIGNABLE_ANNOTATIONに到達するまでループでたどる
+        # （連鎖の長さは最大でlen(self._ref_parent)、それを超えるものは循環参照）
+        for _ in range(len(self._ref_parent) + 1):
+            times = self._align_index.get(ref_id)
+            if times is not None:
+                return times
+            ref_id = self._ref_parent.get(ref_id)
+            if not ref_id:
+                break
         
         return (0, 0)
     
@@ -211,7 +494,7 @@ class EAFConverter:
         morph_idx = 0
         gloss_idx = 0
         
-        total_chars = len(text.replace('.', '').replace('?', '').replace('!', ''))
+        total_chars = len(text.translate(_STRIP_SENTENCE_PUNCT))
         current_chars = 0
         
         for part in text_parts:
@@ -221,7 +504,7 @@ class EAFConverter:
                 current_text += part
                 
                 if current_text.strip():
-                    clean_text = current_text.replace('.', '').replace('?', '').replace('!', '')
+                    clean_text = current_text.translate(_STRIP_SENTENCE_PUNCT)
                     text_words = clean_text.split()
                     num_morphs = 0
                     for word in text_words:
@@ -262,7 +545,7 @@ class EAFConverter:
             remaining_morphs = morph_words[morph_idx:] if morph_idx < len(morph_words) else []
             remaining_glosses = gloss_words[gloss_idx:] if gloss_idx < len(gloss_words) else []
             
-            sentence_chars = len(current_text.replace('.', '').replace('?', '').replace('!', ''))
+            sentence_chars = len(current_text.translate(_STRIP_SENTENCE_PUNCT))
             if total_chars > 0 and start_time != end_time:
                 char_ratio = sentence_chars / total_chars
                 duration = end_time - start_time
@@ -344,7 +627,7 @@ class EAFConverter:
             if overlap_start < overlap_end or (annotation['start_time'] == start_time and annotation['end_time'] == end_time):
                 matching_annotations.append(annotation)
         
-        matching_annotations.sort(key=lambda x: x['start_time'])
+        matching_annotations.sort(key=operator.itemgetter('start_time'))
         return ' '.join([ann['value'] for ann in matching_annotations if ann['value']])
     
     def save_audio_segment(self, start_ms: int, end_ms: int, output_path: str, padding_ms: int = 100):
@@ -361,7 +644,7 @@ class EAFConverter:
                 padded_end_sample = min(len(self.audio_data), end_sample + int((padding_ms / 1000.0) * self.sample_rate))
                 
                 audio_segment = self.audio_data[start_sample:padded_end_sample]
-                sf.write(output_path, audio_segment, self.sample_rate)
+                sf.write(output_path, audio_segment, self.sample_rate, subtype='PCM_16')
                 
             elif AUDIO_LIBRARY == 'pydub':
                 padded_end = end_ms + padding_ms
@@ -402,11 +685,13 @@ class EAFConverter:
             folder_name = f"{base_name}_sentences"
         
         output_path = Path(desktop_path) / folder_name
-        if output_path.exists():
-            timestamp = int(time.time())
-            backup_path = Path(desktop_path) / f"{folder_name}_backup_{timestamp}"
-            shutil.move(str(output_path), str(backup_path))
+        # 既存フォルダのバックアップ（同じ場所での名前変更なので、exists()で確認せず1回のシステムコールで済む）
+        backup_path = Path(desktop_path) / f"{folder_name}_backup_{int(time.time())}"
+        try:
+            os.rename(output_path, backup_path)
             print(f"📦 既存フォルダをバックアップ: {backup_path}")
+        except FileNotFoundError:
+            pass  # 既存フォルダなし
         
         output_path.mkdir(parents=True, exist_ok=True)
         
@@ -416,23 +701,28 @@ class EAFConverter:
         
         saved_files = []
         
+        # 時間情報のある文を先に集める（番号は全体での位置）
+        jobs = []
         for i, sentence in enumerate(sentences, 1):
             if not sentence.get('start_time') or not sentence.get('end_time'):
                 print(f"⚠️ 文 {i} に時間情報がありません。スキップします。")
                 continue
                 
-            safe_text = re.sub(r'[^\w\s-]', '', sentence['text'][:30])
-            safe_text = re.sub(r'\s+', '_', safe_text.strip())
+            safe_text = _UNSAFE_FILENAME_RE.sub('', sentence['text'][:30])
+            safe_text = _WHITESPACE_RE.sub('_', safe_text.strip())
             filename = f"{i:03d}_{safe_text}.wav"
-            output_file = output_path / filename
-            
-            success = self.save_audio_segment(
-                sentence['start_time'], 
-                sentence['end_time'], 
-                str(output_file),
-                padding_ms
-            )
-            
+            jobs.append((i, sentence, filename, output_path / filename))
+        
+        # 各文の音声は別々のファイルなので並列に書き出す（書き込み中はGILが解放される）
+        def save_job(job):
+            i, sentence, filename, output_file = job
+            return self.save_audio_segment(sentence['start_time'], sentence['end_time'], str(output_file), padding_ms)
+        
+        with ThreadPoolExecutor(max_workers=_SEGMENT_WRITE_WORKERS) as executor:
+            results = list(executor.map(save_job, jobs))
+        
+        # 結果は文の順に表示
+        for (i, sentence, filename, output_file), success in zip(jobs, results):
             if success:
                 saved_files.append({
                     'number': i,
@@ -463,18 +753,19 @@ class EAFConverter:
         print(f"✅ DOC形式保存: {doc_file.name}")
         
         # 結果をまとめたテキストファイルを作成
+        file_count = len(saved_files)
         summary_file = output_path / 'audio_summary.txt'
         with open(summary_file, 'w', encoding='utf-8') as f:
             f.write("音声ファイル分割結果\n")
             f.write("="*50 + "\n\n")
             f.write(f"元ファイル: {self.eaf_file_path}\n")
             f.write(f"音声ファイル: {self.wav_file_path}\n")
-            f.write(f"総文数: {len(saved_files)}\n")
+            f.write(f"総文数: {file_count}\n")
             f.write(f"保存場所: {output_path}\n\n")
             f.write("📁 生成ファイル:\n")
             f.write(f"  - GB4E形式（Leipzig.sty対応）: {gb4e_file.name}\n")
             f.write(f"  - DOC形式: {doc_file.name}\n")
-            f.write(f"  - 音声ファイル: {len(saved_files)}個\n\n")
+            f.write(f"  - 音声ファイル: {file_count}個\n\n")
             
             for file_info in saved_files:
                 f.write(f"{file_info['number']:03d}. {file_info['text']}\n")
@@ -489,7 +780,7 @@ class EAFConverter:
             f.write("="*40 + "\n\n")
             f.write("📁 このフォルダには以下のファイルが含まれています:\n\n")
             f.write("🎵 音声ファイル:\n")
-            f.write(f"  - {len(saved_files)}個の分割された音声ファイル (001_*.wav ～ {len(saved_files):03d}_*.wav)\n")
+            f.write(f"  - {file_count}個の分割された音声ファイル (001_*.wav ～ {file_count:03d}_*.wav)\n")
             f.write("  - 各ファイルは文単位で分割されています\n\n")
             f.write("📝 テキストファイル:\n")
             f.write(f"  - {gb4e_file.name}: LaTeX用gb4e形式の例文集（Leipzig.sty対応）\n")
@@ -509,11 +800,15 @@ class EAFConverter:
         if create_zip and saved_files:
             zip_file_path = Path(desktop_path) / f"{folder_name}.zip"
             try:
+                # WAV（無圧縮PCM）はほとんど縮まないので圧縮せずに格納し、テキストファイルだけ圧縮する
                 with zipfile.ZipFile(zip_file_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file_path in output_path.rglob('*'):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(output_path)
-                            zipf.write(file_path, arcname)
+                    # os.walk（scandir）はエントリごとにstatせずにファイルとディレクトリを区別できる
+                    for dirpath, dirnames, filenames in os.walk(output_path):
+                        for filename in filenames:
+                            file_path = os.path.join(dirpath, filename)
+                            arcname = os.path.relpath(file_path, output_path)
+                            compress_type = zipfile.ZIP_STORED if filename.endswith('.wav') else zipfile.ZIP_DEFLATED
+                            zipf.write(file_path, arcname, compress_type=compress_type)
                 
                 print(f"📦 ZIPファイル作成完了: {zip_file_path}")
             except Exception as e:
@@ -522,7 +817,7 @@ class EAFConverter:
         
         if saved_files:
             print(f"\n🎉 音声分割完了!")
-            print(f"🎵 保存された音声ファイル数: {len(saved_files)}")
+            print(f"🎵 保存された音声ファイル数: {file_count}")
             print(f"📝 GB4E形式ファイル（Leipzig.sty対応）: {gb4e_file.name}")
             print(f"📄 DOC形式ファイル: {doc_file.name}")
             print(f"📁 保存場所: {output_path}")
@@ -539,142 +834,34 @@ class EAFConverter:
             'summary_file': str(summary_file),
             'readme_file': str(readme_file),
             'zip_file': str(zip_file_path) if zip_file_path else None,
-            'total_files': len(saved_files)
+            'total_files': file_count
         }
     
-    def _convert_ipa_to_tipa(self, text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _convert_ipa_to_tipa(text: str) -> str:
         """IPA文字をtipaパッケージの形式に変換"""
-        if not text:
+        if not text or text.isascii():
+            # IPA側は全て非ASCII文字なので、ASCIIのみのテキストは変換不要
             return text
             
-        # IPA文字とtipaコマンドの対応表（{}を追加して区切りを明確化）
-        ipa_to_tipa = {
-            'ɨ': '\\textbari{}',
-            'ɯ': '\\textturnm{}',
-            'ɛ': '\\textepsilon{}',
-            'ɔ': '\\textopeno{}',
-            'æ': '\\textae{}',
-            'ɑ': '\\textscripta{}',
-            'ɒ': '\\textturnscripta{}',
-            'ə': '\\textschwa{}',
-            'ɪ': '\\textsci{}',
-            'ʊ': '\\textupsilon{}',
-            'ʃ': '\\textesh{}',
-            'ʒ': '\\textyogh{}',
-            'θ': '\\texttheta{}',
-            'ð': '\\texteth{}',
-            'ŋ': '\\texteng{}',
-            'ɲ': '\\textltailn{}',
-            'ɳ': '\\textrtailn{}',
-            'ɱ': '\\textltailm{}',
-            'ɾ': '\\textfishhookr{}',
-            'ɽ': '\\textrtailr{}',
-            'ɻ': '\\textturnr{}',
-            'ɭ': '\\textrtaill{}',
-            'ʎ': '\\textturny{}',
-            'ʈ': '\\textrtailt{}',
-            'ɖ': '\\textrtaild{}',
-            'ʂ': '\\textrtails{}',
-            'ʐ': '\\textrtailz{}',
-            'ɕ': '\\textctc{}',
-            'ʑ': '\\textctj{}',
-            'ç': '\\textccedilla{}',
-            'ʝ': '\\textctj{}',
-            'ɣ': '\\textgamma{}',
-            'χ': '\\textchi{}',
-            'ʁ': '\\textinvscr{}',
-            'ħ': '\\textcrh{}',
-            'ʕ': '\\textrevglotstop{}',
-            'ʔ': '\\textglotstop{}',
-            'ɸ': '\\textphi{}',
-            'β': '\\textbeta{}',
-            'ʋ': '\\textscriptv{}',
-            'ɹ': '\\textturnr{}',
-            'ɰ': '\\textturnmrleg{}',
-            'ɺ': '\\textlhti{}',
-            'ɢ': '\\textscg{}',
-            'ʛ': '\\texthtg{}',
-            'ʄ': '\\texthtbardotlessjdotlessj{}',
-            'ɠ': '\\texthtg{}',
-            'ɡ': '\\textscg{}',
-            'ː': '\\textlengthmark{}',
-            'ˈ': '\\textprimstress{}',
-            'ˌ': '\\textsecstress{}',
-            'ʲ': '\\textpal{}',
-            'ʷ': '\\textlab{}',
-            'ʰ': '\\textsuperscript{h}',
-            'ⁿ': '\\textsuperscript{n}',
-            'ʼ': '\\textglotstop{}',
-        }
-        
-        result = text
-        for ipa_char, tipa_command in ipa_to_tipa.items():
-            result = result.replace(ipa_char, tipa_command)
-        
-        return result
+        # str.translateで1回の走査で変換（IPA側は全て1文字）
+        return text.translate(_IPA_TO_TIPA)
     
-    def _convert_tipa_back_to_ipa(self, text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _convert_tipa_back_to_ipa(text: str) -> str:
         """tipaコマンドを元のIPA文字に戻す"""
-        if not text:
+        if not text or _TIPA_PREFIX not in text:
+            # tipaコマンドを含まないテキストは走査不要
             return text
             
-        result = text
-        result = result.replace('\\textbari{}', 'ɨ')
-        result = result.replace('\\textturnm{}', 'ɯ')
-        result = result.replace('\\textepsilon{}', 'ɛ')
-        result = result.replace('\\textopeno{}', 'ɔ')
-        result = result.replace('\\textae{}', 'æ')
-        result = result.replace('\\textscripta{}', 'ɑ')
-        result = result.replace('\\textturnscripta{}', 'ɒ')
-        result = result.replace('\\textschwa{}', 'ə')
-        result = result.replace('\\textsci{}', 'ɪ')
-        result = result.replace('\\textupsilon{}', 'ʊ')
-        result = result.replace('\\textesh{}', 'ʃ')
-        result = result.replace('\\textyogh{}', 'ʒ')
-        result = result.replace('\\texttheta{}', 'θ')
-        result = result.replace('\\texteth{}', 'ð')
-        result = result.replace('\\texteng{}', 'ŋ')
-        result = result.replace('\\textltailn{}', 'ɲ')
-        result = result.replace('\\textrtailn{}', 'ɳ')
-        result = result.replace('\\textltailm{}', 'ɱ')
-        result = result.replace('\\textfishhookr{}', 'ɾ')
-        result = result.replace('\\textrtailr{}', 'ɽ')
-        result = result.replace('\\textturnr{}', 'ɻ')
-        result = result.replace('\\textrtaill{}', 'ɭ')
-        result = result.replace('\\textturny{}', 'ʎ')
-        result = result.replace('\\textrtailt{}', 'ʈ')
-        result = result.replace('\\textrtaild{}', 'ɖ')
-        result = result.replace('\\textrtails{}', 'ʂ')
-        result = result.replace('\\textrtailz{}', 'ʐ')
-        result = result.replace('\\textctc{}', 'ɕ')
-        result = result.replace('\\textctj{}', 'ʑ')
-        result = result.replace('\\textccedilla{}', 'ç')
-        result = result.replace('\\textgamma{}', 'ɣ')
-        result = result.replace('\\textchi{}', 'χ')
-        result = result.replace('\\textinvscr{}', 'ʁ')
-        result = result.replace('\\textcrh{}', 'ħ')
-        result = result.replace('\\textrevglotstop{}', 'ʕ')
-        result = result.replace('\\textglotstop{}', 'ʔ')
-        result = result.replace('\\textphi{}', 'ɸ')
-        result = result.replace('\\textbeta{}', 'β')
-        result = result.replace('\\textscriptv{}', 'ʋ')
-        result = result.replace('\\textturnmrleg{}', 'ɰ')
-        result = result.replace('\\textlhti{}', 'ɺ')
-        result = result.replace('\\textscg{}', 'ɢ')
-        result = result.replace('\\texthtg{}', 'ʛ')
-        result = result.replace('\\texthtbardotlessjdotlessj{}', 'ʄ')
-        result = result.replace('\\textbardotlessj{}', 'ɟ')
-        result = result.replace('\\textlengthmark{}', 'ː')
-        result = result.replace('\\textprimstress{}', 'ˈ')
-        result = result.replace('\\textsecstress{}', 'ˌ')
-        result = result.replace('\\textpal{}', 'ʲ')
-        result = result.replace('\\textlab{}', 'ʷ')
-        result = result.replace('\\textsuperscript{h}', 'ʰ')
-        result = result.replace('\\textsuperscript{n}', 'ⁿ')
-        
-        return result
+        # 1回の走査で、一致したtipaコマンドだけを置換
+        return _TIPA_RE.sub(_tipa_match_to_ipa, text)
     
-    def _align_morphs_with_text(self, text: str, morph: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _align_morphs_with_text(text: str, morph: str) -> str:
         """text層の区切り文字（=や-）に基づいてmorph層を再配置"""
         if not text or not morph:
             return morph
@@ -684,6 +871,11 @@ class EAFConverter:
             return morph
         
         text_words = text.split()
+        
+        # 区切り文字がなければ各単語に形態素が1つずつ対応する
+        if '=' not in text and '-' not in text:
+            return ' '.join(morph_list[:len(text_words)])
+        
         result_parts = []
         morph_idx = 0
         
@@ -722,43 +914,23 @@ class EAFConverter:
         text_words = text_line.split()
         gloss_words = gloss_line.split()
         
-        def char_width(s):
-            import unicodedata
-            width = 0
-            for char in s:
-                if unicodedata.east_asian_width(char) in ('F', 'W'):
-                    width += 2
-                elif unicodedata.east_asian_width(char) in ('H', 'Na', 'N'):
-                    width += 1
-                else:
-                    width += 1
-            return width
-        
         min_len = min(len(text_words), len(gloss_words))
         if len(text_words) != len(gloss_words):
             print(f"警告: 単語数が一致しません (text: {len(text_words)}, gloss: {len(gloss_words)})")
         
-        aligned_text_parts = []
-        aligned_gloss_parts = []
+        text_widths = _word_widths(text_words[:min_len])
+        gloss_widths = _word_widths(gloss_words[:min_len])
         
-        for i in range(min_len):
-            text_word = text_words[i]
-            gloss_word = gloss_words[i]
-            
-            text_width = char_width(text_word)
-            gloss_width = char_width(gloss_word)
-            
-            max_width = max(text_width, gloss_width) + 2
-            
-            text_padding = max_width - text_width
-            gloss_padding = max_width - gloss_width
-            
-            if i < min_len - 1:
-                aligned_text_parts.append(text_word + ' ' * text_padding)
-                aligned_gloss_parts.append(gloss_word + ' ' * gloss_padding)
-            else:
-                aligned_text_parts.append(text_word)
-                aligned_gloss_parts.append(gloss_word)
+        # 列幅（最低2文字分の間隔）は両層で共通なので一度だけ計算
+        column_widths = [max(widths) + 2 for widths in zip(text_widths, gloss_widths)]
+        
+        # 最後の単語以外を列幅まで埋める（ljustは文字数で埋めるので、目標の長さは文字数 + 表示幅での余白）
+        last = min_len - 1
+        aligned_text_parts = [text_words[i].ljust(len(text_words[i]) + column_widths[i] - text_widths[i]) for i in range(last)]
+        aligned_gloss_parts = [gloss_words[i].ljust(len(gloss_words[i]) + column_widths[i] - gloss_widths[i]) for i in range(last)]
+        if min_len:
+            aligned_text_parts.append(text_words[last])
+            aligned_gloss_parts.append(gloss_words[last])
         
         if len(text_words) > min_len:
             remaining_text = ' '.join(text_words[min_len:])
@@ -770,7 +942,9 @@ class EAFConverter:
         
         return ''.join(aligned_text_parts), ''.join(aligned_gloss_parts)
 
-    def _convert_leipzig_glosses(self, gloss_text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _convert_leipzig_glosses(gloss_text: str) -> str:
         """Leipzig.styの規則に従って大文字英字の文法形態素記号を変換"""
         if not gloss_text:
             return gloss_text
@@ -799,11 +973,7 @@ class EAFConverter:
             result = re.sub(pattern, replacement, result)
         
         # 残った連続する大文字を自動変換（前後に英数字がない場合のみ）
-        def convert_unknown_caps(match):
-            caps_text = match.group(0)
-            return f'\\\\textsc{{{caps_text.lower()}}}'
-        
-        result = re.sub(r'(?<![A-Za-z])[A-Z]{2,}(?![A-Za-z])', convert_unknown_caps, result)
+        result = re.sub(r'(?<![A-Za-z])[A-Z]{2,}(?![A-Za-z])', _unknown_caps_to_textsc, result)
         
         return result
     
@@ -812,75 +982,29 @@ class EAFConverter:
         if not text:
             return text
         
-        def convert_textsc_to_smallcaps(match):
-            content = match.group(1)
-            # 小型大文字に変換（実際にはUnicodeの小型大文字文字を使用）
-            smallcap_mapping = {
-                'nom': 'ɴᴏᴍ', 'acc': 'ᴀᴄᴄ', 'gen': 'ɢᴇɴ',
-                'dat': 'ᴅᴀᴛ', 'abl': 'ᴀʙʟ', 'loc': 'ʟᴏᴄ',
-                'pst': 'ᴘsᴛ', 'prs': 'ᴘʀs', 'fut': 'ꜰᴜᴛ',
-                'npst': 'ɴᴘsᴛ', 'pfv': 'ᴘꜰᴠ', 'ipfv': 'ɪᴘꜰᴠ',
-                'sg': 'sɢ', 'pl': 'ᴘʟ', 'du': 'ᴅᴜ',
-                'cop': 'ᴄᴏᴘ', 'aux': 'ᴀᴜx', 'neg': 'ɴᴇɢ',
-                'foc': 'ꜰᴏᴄ', 'top': 'ᴛᴏᴘ', 'emph': 'ᴇᴍᴘʜ',
-                'hs': 'ʜs', 'evid': 'ᴇᴠɪᴅ', 'quot': 'Qᴜᴏᴛ',
-                'sfp': 'sꜰᴘ', 'cas': 'ᴄᴀs', 'part': 'ᴘᴀʀᴛ',
-                'caus': 'ᴄᴀᴜs', 'pass': 'ᴘᴀss', 'refl': 'ʀᴇꜰʟ',
-                'q': 'Q', 'clf': 'ᴄʟꜰ', 'det': 'ᴅᴇᴛ',
-                'def': 'ᴅᴇꜰ', 'indef': 'ɪɴᴅᴇꜰ', 'com': 'ᴄᴏᴍ'
-            }
-            
-            return smallcap_mapping.get(content.lower(), content.upper())
-        
         # \\textsc{...} を小型大文字に変換
-        result = re.sub(r'\\textsc\{([^}]+)\}', convert_textsc_to_smallcaps, text)
-        
-        # 通常の大文字（2文字以上）も小型大文字に変換
-        def convert_caps_to_smallcaps(match):
-            caps_text = match.group(0)
-            result_chars = []
-            for char in caps_text:
-                # 個別文字のマッピング
-                char_mapping = {
-                    'A': 'ᴀ', 'B': 'ʙ', 'C': 'ᴄ', 'D': 'ᴅ', 'E': 'ᴇ', 'F': 'ꜰ',
-                    'G': 'ɢ', 'H': 'ʜ', 'I': 'ɪ', 'J': 'ᴊ', 'K': 'ᴋ', 'L': 'ʟ',
-                    'M': 'ᴍ', 'N': 'ɴ', 'O': 'ᴏ', 'P': 'ᴘ', 'Q': 'Q', 'R': 'ʀ',
-                    'S': 's', 'T': 'ᴛ', 'U': 'ᴜ', 'V': 'ᴠ', 'W': 'ᴡ', 'X': 'x',
-                    'Y': 'ʏ', 'Z': 'ᴢ'
-                }
-                result_chars.append(char_mapping.get(char, char))
-            return ''.join(result_chars)
+        result = re.sub(r'\\textsc\{([^}]+)\}', _textsc_to_smallcaps, text)
         
         # 連続する大文字（2文字以上）を小型大文字に変換
-        result = re.sub(r'(?<![A-Za-z])[A-Z]{2,}(?![A-Za-z])', convert_caps_to_smallcaps, result)
+        result = re.sub(r'(?<![A-Za-z])[A-Z]{2,}(?![A-Za-z])', _caps_to_smallcaps, result)
         
         return result
     
     def to_gb4e_format(self, sentences: List[Dict]) -> str:
         """gb4e形式に変換（Leipzig.sty対応、IPA→tipa変換付き）"""
-        output = []
-        
-        output.append("% UTF-8エンコーディング用設定")
-        output.append("% \\usepackage[utf8]{inputenc}")
-        output.append("% \\usepackage{CJKutf8}")
-        output.append("% \\usepackage{gb4e}")
-        output.append("% \\usepackage{tipa}")
-        output.append("% \\usepackage{leipzig}  % Leipzig.styパッケージ")
-        output.append("")
-        output.append("% Leipzig.styの使用により、大文字の文法記号が自動的に小文字のスモールキャップスに変換されます")
-        output.append("% IPA文字は自動的にtipaコマンドに変換されます")
-        output.append("")
+        buf = io.StringIO()
+        
+        buf.write(_GB4E_HEADER)
         
         for i, sentence in enumerate(sentences, 1):
             if not sentence['text']:
                 continue
                 
-            output.append("\\begin{exe}")
-            output.append("\\ex")
+            buf.write(_GB4E_EXAMPLE_BEGIN)
             
             # 1段目: text（IPAをtipaに変換）
             text_tipa = self._convert_ipa_to_tipa(sentence['text'])
-            output.append(f"\\gll {text_tipa}\\\\")
+            buf.write(f"\\gll {text_tipa}\\\\\n")
             
             # 2段目: gloss（形態素整列 + Leipzig.sty変換）
             if sentence['gloss']:
@@ -889,39 +1013,38 @@ class EAFConverter:
                 leipzig_gloss = self._convert_leipzig_glosses(aligned_gloss)
                 # 二重バックスラッシュを単一に修正
                 leipzig_gloss = leipzig_gloss.replace('\\\\', '\\')
-                output.append(f"     {leipzig_gloss}\\\\")
+                buf.write(f"     {leipzig_gloss}\\\\\n")
             else:
-                output.append("     \\\\")
+                buf.write("     \\\\\n")
             
             # 3段目: translation（デバッグ情報付き）
             if sentence.get('translation') and sentence['translation'].strip():
-                output.append(f"\\glt {sentence['translation']}")
+                buf.write(f"\\glt {sentence['translation']}\n")
             else:
                 # 翻訳がない場合の情報表示
                 if not sentence.get('translation'):
                     print(f"警告: 文 {i} に翻訳データがありません")
                 else:
                     print(f"警告: 文 {i} の翻訳が空です: '{sentence['translation']}'")
-                output.append("\\glt")
+                buf.write("\\glt\n")
             
-            output.append("\\end{exe}")
-            output.append("")
+            buf.write(_GB4E_EXAMPLE_END)
         
-        return "\n".join(output)
+        return buf.getvalue()[:-1]  # 末尾の改行なし（"\n".joinと同じ結果）
     
     def to_doc_format(self, sentences: List[Dict], debug: bool = False) -> str:
         """doc形式（プレーンテキスト、IPA文字復元、小型大文字変換、インデント調整付き）"""
-        output = []
+        buf = io.StringIO()
         
         for i, sentence in enumerate(sentences, 1):
             if not sentence['text']:
                 continue
                 
-            output.append(f"({i})")
+            buf.write(f"({i})\n")
             
-            # 1段目: text（IPAをtipaに変換してから元に戻す）
-            text_tipa = self._convert_ipa_to_tipa(sentence['text'])
-            text_original = self._convert_tipa_back_to_ipa(text_tipa)
+            # 1段目: text（IPAをtipaに変換してから元に戻すのと同じ結果を、1回のtranslateと
+            # テキストに元々含まれるtipaコマンドの逆変換だけで得る）
+            text_original = self._convert_tipa_back_to_ipa(sentence['text'].translate(_IPA_NORMALIZE))
             
             # 2段目: gloss（区切り文字に基づく整列 + Leipzig.sty変換後に小型大文字に戻す）
             if sentence['gloss']:
@@ -949,21 +1072,19 @@ class EAFConverter:
                     print(f"text単語数: {len(text_original.split())}")
                     print(f"gloss単語数: {len(plain_gloss.split())}")
                 
-                output.append(aligned_text)
-                output.append(aligned_gloss_final)
+                buf.write(f"{aligned_text}\n{aligned_gloss_final}\n")
             else:
-                output.append(text_original)
-                output.append("")
+                buf.write(f"{text_original}\n\n")
             
             # 3段目: translation
             if sentence['translation']:
-                output.append(sentence['translation'])
+                buf.write(f"{sentence['translation']}\n")
             else:
-                output.append("")
+                buf.write("\n")
             
-            output.append("")
+            buf.write("\n")
         
-        return "\n".join(output)
+        return buf.getvalue()[:-1]  # 末尾の改行なし（"\n".joinと同じ結果）
 
 # Leipzig.styテスト関数を改良
 def test_leipzig_conversion():
@@ -7,25 +7,47 @@
 # - Audio splitting functionality included
 
 import xml.etree.ElementTree as ET
+import bisect
+import functools
+import importlib.util
+import io
+import logging
+import operator
 import os
 import re
-import shutil
+import sys
+import unicodedata
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import accumulate, repeat
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import time
 import platform
 
+# Per-call status from file I/O, audio loading and EAF parsing goes through logging
+# (silent at the default WARNING level; enable with logging.basicConfig(level=logging.INFO))
+logger = logging.getLogger(__name__)
+
 # Audio processing library imports
 AUDIO_LIBRARY = None
 try:
-    import librosa
+    # soundfile (+ NumPy) alone handles WAV I/O and is preferred over pydub's ffmpeg decode/re-encode;
+    # librosa (slow to import) is only the fallback reader in load_audio for formats libsndfile
+    # cannot read, so here we just check whether it is installed and import it on demand
     import soundfile as sf
-    AUDIO_LIBRARY = 'librosa'
-    print("✅ Using librosa + soundfile")
+    import numpy as np
+    if importlib.util.find_spec('librosa') is not None:
+        AUDIO_LIBRARY = 'librosa'
+        print("✅ Using librosa + soundfile")
+    else:
+        AUDIO_LIBRARY = 'soundfile'
+        print("✅ Using soundfile")
 except ImportError:
     try:
         from pydub import AudioSegment
+        import wave  # Segments are written straight from the decoded PCM bytes
         AUDIO_LIBRARY = 'pydub'
         print("✅ Using pydub")
     except ImportError:
@@ -38,58 +60,501 @@ except ImportError:
             AUDIO_LIBRARY = None
             print("⚠️ No audio processing library (text conversion only)")
 
+# Libraries whose audio is held as an int16 NumPy array (sliced per segment)
+_ARRAY_AUDIO_LIBRARIES = ('librosa', 'soundfile', 'wave')
+
+# NumPy (optional) for bulk sorting of tier annotations
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# lxml (optional) for faster EAF parsing; the standard library parser is used otherwise
+try:
+    from lxml import etree as lxml_etree
+    HAS_LXML = True
+    _XML_PARSE_ERRORS = (ET.ParseError, lxml_etree.XMLSyntaxError)
+except ImportError:
+    HAS_LXML = False
+    _XML_PARSE_ERRORS = (ET.ParseError,)
+
+# Numba (optional, needs NumPy) to JIT-compile the tier overlap scan; the NumPy path is used otherwise
+try:
+    import numba
+    HAS_NUMBA = HAS_NUMPY
+except ImportError:
+    HAS_NUMBA = False
+
+# Splits text into (text, sentence-ending punctuation) pairs for sentence splitting
+_SENTENCE_RE = re.compile(r'([^.?!]*)([.?!]*)')
+# Deletes sentence-ending punctuation in one str.translate pass (for character/word counts)
+_STRIP_SENTENCE_PUNCT = str.maketrans('', '', '.?!')
+
+# Splits a text1 word at morpheme boundaries, keeping the delimiters
+_MORPH_BOUNDARY_RE = re.compile(r'([=-])')
+
+# Filename sanitizers for split audio files
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Concurrent segment writes (disk-bound, so more threads than this only contend for the disk)
+_SEGMENT_WRITE_WORKERS = min(8, os.cpu_count() or 1)
+
+# IPA to tipa command mapping (added {} for clear separation)
+# Built once as a str.translate table: every IPA key is a single codepoint
+_IPA_TO_TIPA = str.maketrans({
+    'ɨ': '\\textbari{}',
+    'ɯ': '\\textturnm{}',
+    'ɛ': '\\textepsilon{}',
+    'ɔ': '\\textopeno{}',
+    'æ': '\\textae{}',
+    'ɑ': '\\textscripta{}',
+    'ɒ': '\\textturnscripta{}',
+    'ə': '\\textschwa{}',
+    'ɪ': '\\textsci{}',
+    'ʊ': '\\textupsilon{}',
+    'ʃ': '\\textesh{}',
+    'ʒ': '\\textyogh{}',
+    'θ': '\\texttheta{}',
+    'ð': '\\texteth{}',
+    'ŋ': '\\texteng{}',
+    'ɲ': '\\textltailn{}',
+    'ɳ': '\\textrtailn{}',
+    'ɱ': '\\textltailm{}',
+    'ɾ': '\\textfishhookr{}',
+    'ɽ': '\\textrtailr{}',
+    'ɻ': '\\textturnr{}',
+    'ɭ': '\\textrtaill{}',
+    'ʎ': '\\textturny{}',
+    'ʈ': '\\textrtailt{}',
+    'ɖ': '\\textrtaild{}',
+    'ʂ': '\\textrtails{}',
+    'ʐ': '\\textrtailz{}',
+    'ɕ': '\\textctc{}',
+    'ʑ': '\\textctj{}',
+    'ç': '\\textccedilla{}',
+    'ʝ': '\\textctj{}',
+    'ɣ': '\\textgamma{}',
+    'χ': '\\textchi{}',
+    'ʁ': '\\textinvscr{}',
+    'ħ': '\\textcrh{}',
+    'ʕ': '\\textrevglotstop{}',
+    'ʔ': '\\textglotstop{}',
+    'ɸ': '\\textphi{}',
+    'β': '\\textbeta{}',
+    'ʋ': '\\textscriptv{}',
+    'ɹ': '\\textturnr{}',
+    'ɰ': '\\textturnmrleg{}',
+    'ɺ': '\\textlhti{}',
+    'ɢ': '\\textscg{}',
+    'ʛ': '\\texthtg{}',
+    'ʄ': '\\texthtbardotlessjdotlessj{}',
+    'ɠ': '\\texthtg{}',
+    'ɡ': '\\textscg{}',
+    'ː': '\\textlengthmark{}',
+    'ˈ': '\\textprimstress{}',
+    'ˌ': '\\textsecstress{}',
+    'ʲ': '\\textpal{}',
+    'ʷ': '\\textlab{}',
+    'ʰ': '\\textsuperscript{h}',
+    'ⁿ': '\\textsuperscript{n}',
+    'ʼ': '\\textglotstop{}',
+})
+
+# tipa command to IPA mapping (reverse of _IPA_TO_TIPA)
+_TIPA_TO_IPA = {
+    '\\textbari{}': 'ɨ',
+    '\\textturnm{}': 'ɯ',
+    '\\textepsilon{}': 'ɛ',
+    '\\textopeno{}': 'ɔ',
+    '\\textae{}': 'æ',
+    '\\textscripta{}': 'ɑ',
+    '\\textturnscripta{}': 'ɒ',
+    '\\textschwa{}': 'ə',
+    '\\textsci{}': 'ɪ',
+    '\\textupsilon{}': 'ʊ',
+    '\\textesh{}': 'ʃ',
+    '\\textyogh{}': 'ʒ',
+    '\\texttheta{}': 'θ',
+    '\\texteth{}': 'ð',
+    '\\texteng{}': 'ŋ',
+    '\\textltailn{}': 'ɲ',
+    '\\textrtailn{}': 'ɳ',
+    '\\textltailm{}': 'ɱ',
+    '\\textfishhookr{}': 'ɾ',
+    '\\textrtailr{}': 'ɽ',
+    '\\textturnr{}': 'ɻ',
+    '\\textrtaill{}': 'ɭ',
+    '\\textturny{}': 'ʎ',
+    '\\textrtailt{}': 'ʈ',
+    '\\textrtaild{}': 'ɖ',
+    '\\textrtails{}': 'ʂ',
+    '\\textrtailz{}': 'ʐ',
+    '\\textctc{}': 'ɕ',
+    '\\textctj{}': 'ʑ',
+    '\\textccedilla{}': 'ç',
+    '\\textgamma{}': 'ɣ',
+    '\\textchi{}': 'χ',
+    '\\textinvscr{}': 'ʁ',
+    '\\textcrh{}': 'ħ',
+    '\\textrevglotstop{}': 'ʕ',
+    '\\textglotstop{}': 'ʔ',
+    '\\textphi{}': 'ɸ',
+    '\\textbeta{}': 'β',
+    '\\textscriptv{}': 'ʋ',
+    '\\textturnmrleg{}': 'ɰ',
+    '\\textlhti{}': 'ɺ',
+    '\\textscg{}': 'ɢ',
+    '\\texthtg{}': 'ʛ',
+    '\\texthtbardotlessjdotlessj{}': 'ʄ',
+    '\\textbardotlessj{}': 'ɟ',
+    '\\textlengthmark{}': 'ː',
+    '\\textprimstress{}': 'ˈ',
+    '\\textsecstress{}': 'ˌ',
+    '\\textpal{}': 'ʲ',
+    '\\textlab{}': 'ʷ',
+    '\\textsuperscript{h}': 'ʰ',
+    '\\textsuperscript{n}': 'ⁿ',
+}
+# Trie-like pattern: the shared '\text' prefix is matched once, then the command suffixes
+# (longest first so a command is never shadowed by a shorter prefix)
+_TIPA_PREFIX = os.path.commonprefix(list(_TIPA_TO_IPA))
+_TIPA_RE = re.compile(re.escape(_TIPA_PREFIX) + '(?:' + '|'.join(
+    re.escape(k[len(_TIPA_PREFIX):]) for k in sorted(_TIPA_TO_IPA, key=len, reverse=True)) + ')')
+# Replacement for a _TIPA_RE match (module level, so sub() is not handed a new closure per call)
+def _tipa_match_to_ipa(match):
+    return _TIPA_TO_IPA[match.group()]
+
+# IPA characters whose tipa command converts back to a different character (e.g. ɹ → \textturnr{} → ɻ).
+# Translating with this table equals the IPA→tipa→IPA round trip for plain IPA text.
+_IPA_NORMALIZE = {cp: _TIPA_TO_IPA.get(cmd, cmd) for cp, cmd in _IPA_TO_TIPA.items()
+                  if _TIPA_TO_IPA.get(cmd) != chr(cp)}
+
+# Two-stage width table: codepoint >> 8 selects a 256-entry page, codepoint & 0xff the width.
+# Pages are filled lazily the first time a codepoint in them is seen.
+_WIDTH_PAGES = [None] * (0x110000 >> 8)
+
+# East Asian Width classes displayed as two columns (Fullwidth, Wide)
+_WIDE_EAST_ASIAN_WIDTHS = frozenset('FW')
+
+def _build_width_page(page_index):
+    """Compute widths for one 256-codepoint page (Full/Wide = 2; Half, Narrow, Neutral and Ambiguous = 1)"""
+    base = page_index << 8
+    east_asian_width = unicodedata.east_asian_width
+    page = bytes(2 if east_asian_width(chr(base + i)) in _WIDE_EAST_ASIAN_WIDTHS else 1 for i in range(256))
+    _WIDTH_PAGES[page_index] = page
+    return page
+
+# Memoized on top of the page table: a cache hit never enters Python code, and a corpus only
+# uses a small alphabet, so the cache stays small without a size limit
+@functools.lru_cache(maxsize=None)
+def _char_width(char):
+    """Display width of a single character (page table lookup)"""
+    cp = ord(char)
+    page = _WIDTH_PAGES[cp >> 8]
+    if page is None:
+        page = _build_width_page(cp >> 8)
+    return page[cp & 0xff]
+
+def _str_width(s):
+    """Display width of a string for doc-format alignment"""
+    if s.isascii():
+        # ASCII is always narrow: skip the per-character lookup
+        return len(s)
+    return sum(map(_char_width, s))
+
+# Lines at least this long get their word widths from one vectorized NumPy lookup
+# (below it, NumPy's per-call overhead outweighs the per-character loop)
+_NUMPY_WIDTH_MIN_CHARS = 256
+_WIDTH_LUT = None  # NumPy copy of the width pages (0 = page not copied yet)
+
+def _word_widths(words):
+    """Display widths of a list of non-empty words (as from str.split())"""
+    global _WIDTH_LUT
+    joined = ''.join(words)
+    if joined.isascii():
+        # ASCII-only line (the common case for romanized corpora): width is the length
+        return list(map(len, words))
+    if not HAS_NUMPY or len(joined) < _NUMPY_WIDTH_MIN_CHARS:
+        return [_str_width(word) for word in words]
+    
+    if _WIDTH_LUT is None:
+        _WIDTH_LUT = np.zeros(0x110000, dtype=np.uint8)
+    codepoints = np.frombuffer(joined.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    # Copy any width pages this line needs into the lookup table
+    for page_index in np.unique(codepoints >> 8).tolist():
+        if not _WIDTH_LUT[page_index << 8]:
+            page = _WIDTH_PAGES[page_index] or _build_width_page(page_index)
+            _WIDTH_LUT[page_index << 8:(page_index + 1) << 8] = np.frombuffer(page, dtype=np.uint8)
+    # Sum character widths per word in one pass
+    offsets = np.cumsum([0] + [len(word) for word in words[:-1]])
+    return np.add.reduceat(_WIDTH_LUT[codepoints].astype(np.int64), offsets).tolist()
+
+# Static LaTeX header and per-example wrappers for gb4e output
+_GB4E_HEADER = (
+    "% UTF-8 encoding settings\n"
+    "% \\usepackage[utf8]{inputenc}\n"
+    "% \\usepackage{CJKutf8}\n"
+    "% \\usepackage{gb4e}\n"
+    "% \\usepackage{tipa}\n"
+    "% \\usepackage{leipzig}  % Leipzig.sty package\n"
+    "\n"
+    "% With Leipzig.sty, uppercase grammatical symbols are automatically converted to lowercase smallcaps\n"
+    "% IPA characters are automatically converted to tipa commands\n"
+    "\n"
+)
+_GB4E_EXAMPLE_BEGIN = "\\begin{exe}\n\\ex\n"
+_GB4E_EXAMPLE_END = "\\end{exe}\n\n"
+
+# Leipzig.sty glossing abbreviations (the lowercase text goes into \textsc{})
+_LEIPZIG_MAPPING = {
+    'NOM': '\\textsc{nom}', 'ACC': '\\textsc{acc}', 'GEN': '\\textsc{gen}',
+    'DAT': '\\textsc{dat}', 'ABL': '\\textsc{abl}', 'LOC': '\\textsc{loc}',
+    'PST': '\\textsc{pst}', 'PRS': '\\textsc{prs}', 'FUT': '\\textsc{fut}',
+    'NPST': '\\textsc{npst}', 'PFV': '\\textsc{pfv}', 'IPFV': '\\textsc{ipfv}',
+    'SG': '\\textsc{sg}', 'PL': '\\textsc{pl}', 'DU': '\\textsc{du}',
+    'COP': '\\textsc{cop}', 'AUX': '\\textsc{aux}', 'NEG': '\\textsc{neg}',
+    'FOC': '\\textsc{foc}', 'TOP': '\\textsc{top}', 'EMPH': '\\textsc{emph}',
+    'HS': '\\textsc{hs}', 'EVID': '\\textsc{evid}', 'QUOT': '\\textsc{quot}',
+    'SFP': '\\textsc{sfp}', 'CAS': '\\textsc{cas}', 'PART': '\\textsc{part}',
+    'CAUS': '\\textsc{caus}', 'PASS': '\\textsc{pass}', 'REFL': '\\textsc{refl}',
+    'Q': '\\textsc{q}', 'CLF': '\\textsc{clf}', 'DET': '\\textsc{det}',
+    'DEF': '\\textsc{def}', 'INDEF': '\\textsc{indef}', 'COM': '\\textsc{com}',
+    'INF': '\\textsc{inf}', 'SEQ': '\\textsc{seq}', 'FIL': '\\textsc{fil}'
+}
+# Whole uppercase words (strict word boundary check): any run of 2+ capitals, or a single-letter symbol
+_LEIPZIG_RE = re.compile(r'(?<![A-Za-z])(?:[A-Z]{2,}|' + '|'.join(k for k in _LEIPZIG_MAPPING if len(k) == 1) + r')(?![A-Za-z])')
+_CAPS_RUN_RE = re.compile(r'(?<![A-Za-z])[A-Z]{2,}(?![A-Za-z])')
+_TEXTSC_RE = re.compile(r'\\textsc\{([^}]+)\}')
+
+# Unicode small caps for Leipzig.sty abbreviations (doc format)
+_SMALLCAP_MAPPING = {
+    'nom': 'ɴᴏᴍ', 'acc': 'ᴀᴄᴄ', 'gen': 'ɢᴇɴ',
+    'dat': 'ᴅᴀᴛ', 'abl': 'ᴀʙʟ', 'loc': 'ʟᴏᴄ',
+    'pst': 'ᴘsᴛ', 'prs': 'ᴘʀs', 'fut': 'ꜰᴜᴛ',
+    'npst': 'ɴᴘsᴛ', 'pfv': 'ᴘꜰᴠ', 'ipfv': 'ɪᴘꜰᴠ',
+    'sg': 'sɢ', 'pl': 'ᴘʟ', 'du': 'ᴅᴜ',
+    'cop': 'ᴄᴏᴘ', 'aux': 'ᴀᴜx', 'neg': 'ɴᴇɢ',
+    'foc': 'ꜰᴏᴄ', 'top': 'ᴛᴏᴘ', 'emph': 'ᴇᴍᴘʜ',
+    'hs': 'ʜs', 'evid': 'ᴇᴠɪᴅ', 'quot': 'Qᴜᴏᴛ',
+    'sfp': 'sꜰᴘ', 'cas': 'ᴄᴀs', 'part': 'ᴘᴀʀᴛ',
+    'caus': 'ᴄᴀᴜs', 'pass': 'ᴘᴀss', 'refl': 'ʀᴇꜰʟ',
+    'q': 'Q', 'clf': 'ᴄʟꜰ', 'det': 'ᴅᴇᴛ',
+    'def': 'ᴅᴇꜰ', 'indef': 'ɪɴᴅᴇꜰ', 'com': 'ᴄᴏᴍ',
+    'inf': 'ɪɴꜰ', 'seq': 'sᴇQ', 'fil': 'ꜰɪʟ'
+}
+# Per-letter small caps for other uppercase runs (letters without a small cap form are kept as is)
+_SMALLCAPS_TRANS = str.maketrans({
+    'A': 'ᴀ', 'B': 'ʙ', 'C': 'ᴄ', 'D': 'ᴅ', 'E': 'ᴇ', 'F': 'ꜰ',
+    'G': 'ɢ', 'H': 'ʜ', 'I': 'ɪ', 'J': 'ᴊ', 'K': 'ᴋ', 'L': 'ʟ',
+    'M': 'ᴍ', 'N': 'ɴ', 'O': 'ᴏ', 'P': 'ᴘ', 'R': 'ʀ', 'S': 's',
+    'T': 'ᴛ', 'U': 'ᴜ', 'V': 'ᴠ', 'W': 'ᴡ', 'X': 'x', 'Y': 'ʏ',
+    'Z': 'ᴢ'
+})
+
+# Replacement functions for the Leipzig conversions (module level, so sub() is not handed a new closure per call)
+def _leipzig_replacement(match):
+    """Known symbol -> its mapping; any other capital run -> \\textsc{lowercase}"""
+    caps = match.group(0)
+    return _LEIPZIG_MAPPING.get(caps) or f'\\textsc{{{caps.lower()}}}'
+
+def _textsc_to_smallcaps(match):
+    """\\textsc{...} -> Unicode small caps"""
+    content = match.group(1)
+    return _SMALLCAP_MAPPING.get(content.lower(), content.upper())
+
+def _caps_to_smallcaps(match):
+    """Run of capitals -> per-letter small caps"""
+    return match.group(0).translate(_SMALLCAPS_TRANS)
+
+# Time slot / annotation references of annotation elements (used with map() over a whole tier)
+_GET_SLOT_REF1 = operator.methodcaller('get', 'TIME_SLOT_REF1')
+_GET_SLOT_REF2 = operator.methodcaller('get', 'TIME_SLOT_REF2')
+_GET_ANNOTATION_REF = operator.methodcaller('get', 'ANNOTATION_REF')
+
+# Tiers at least this long are searched for overlaps with vectorized NumPy interval tests
+# (below it, NumPy's per-call overhead outweighs the per-annotation loop)
+_NUMPY_OVERLAP_MIN_ANNOTATIONS = 64
+
+def _overlap_indices(starts, ends, start_time, end_time):
+    """Indices of a start-sorted tier's intervals that overlap (or exactly match) [start_time, end_time]"""
+    indices = np.empty(len(starts), dtype=np.int64)
+    count = 0
+    limit = max(start_time, end_time)
+    for i in range(len(starts)):
+        if starts[i] > limit:
+            break  # Sorted by start: nothing later can overlap or match
+        if (min(ends[i], end_time) > max(starts[i], start_time)
+                or (starts[i] == start_time and ends[i] == end_time)):
+            indices[count] = i
+            count += 1
+    return indices[:count]
+
+if HAS_NUMBA:
+    _overlap_indices = numba.njit(cache=True)(_overlap_indices)
+
+class Annotation(NamedTuple):
+    """Single tier annotation (lighter than a dict; one per EAF annotation)"""
+    start_time: int
+    end_time: int
+    value: str
+    type: str
+    ref_id: Optional[str] = None
+    words: Tuple[str, ...] = ()
+
+class TierIntervals(NamedTuple):
+    """Column (structure-of-arrays) view of a start-sorted tier for overlap search
+    
+    The time columns are NumPy arrays for large tiers and plain lists otherwise.
+    max_ends[i] is the largest end time among the first i + 1 annotations (non-decreasing, so it can be bisected).
+    """
+    starts: 'np.ndarray'
+    ends: 'np.ndarray'
+    max_ends: 'np.ndarray'
+    values: List[str]
+    words: List[Tuple[str, ...]]
+
+@functools.lru_cache(maxsize=1)
 def get_desktop_path():
-    """Get desktop path (improved version with fallback support)"""
+    """Get desktop path (improved version with fallback support, cached per session)"""
     system = platform.system()
+    home_dir = os.path.expanduser("~")
     
-    desktop_candidates = []
-    
+    # Candidates relative to the home directory, in order of preference
     if system == "Windows":
         desktop_candidates = [
-            os.path.join(os.path.expanduser("~"), "Desktop"),
-            os.path.join(os.path.expanduser("~"), "デスクトップ"),
-            os.path.join(os.path.expanduser("~"), "OneDrive", "Desktop"),
-            os.path.join(os.path.expanduser("~"), "OneDrive", "デスクトップ"),
-            os.path.join(os.environ.get("USERPROFILE", ""), "Desktop"),
-            os.path.join(os.environ.get("USERPROFILE", ""), "デスクトップ")
+            ("Desktop",),
+            ("デスクトップ",),
+            ("OneDrive", "Desktop"),
+            ("OneDrive", "デスクトップ")
         ]
     elif system == "Darwin":  # macOS
         desktop_candidates = [
-            os.path.join(os.path.expanduser("~"), "Desktop"),
-            os.path.join(os.path.expanduser("~"), "デスクトップ")
+            ("Desktop",),
+            ("デスクトップ",)
         ]
     else:  # Linux
         desktop_candidates = [
-            os.path.join(os.path.expanduser("~"), "Desktop"),
-            os.path.join(os.path.expanduser("~"), "デスクトップ"),
-            os.path.join(os.path.expanduser("~"), "Documents")
+            ("Desktop",),
+            ("デスクトップ",),
+            ("Documents",)
+        ]
+    
+    # Read the home directory once instead of probing each candidate with exists()
+    try:
+        with os.scandir(home_dir) as entries:
+            home_subdirs = {os.path.normcase(entry.name) for entry in entries if entry.is_dir()}
+    except OSError:
+        home_subdirs = set()
+    
+    candidate_paths = [
+        os.path.join(home_dir, *parts) for parts in desktop_candidates
+        if os.path.normcase(parts[0]) in home_subdirs
+        and (len(parts) == 1 or os.path.isdir(os.path.join(home_dir, *parts)))
+    ]
+    
+    # USERPROFILE normally equals the home directory; only probe it when it differs
+    user_profile = os.environ.get("USERPROFILE", "") if system == "Windows" else ""
+    if user_profile and os.path.normcase(user_profile) != os.path.normcase(home_dir):
+        candidate_paths += [
+            path for path in (os.path.join(user_profile, "Desktop"), os.path.join(user_profile, "デスクトップ"))
+            if os.path.isdir(path)
         ]
     
     # Find writable desktop path
-    for candidate in desktop_candidates:
-        if os.path.exists(candidate) and os.access(candidate, os.W_OK):
+    for candidate in candidate_paths:
+        if os.access(candidate, os.W_OK):
             print(f"✅ Desktop path confirmed: {candidate}")
             return candidate
     
     # Fallback: home directory
-    home_dir = os.path.expanduser("~")
     print(f"⚠️ Desktop not found, using home directory: {home_dir}")
     return home_dir
 
+def _annotation_value(annotation):
+    """Stripped ANNOTATION_VALUE text of an annotation element ("" when missing)"""
+    value_elem = annotation.find('ANNOTATION_VALUE')
+    value = value_elem.text if value_elem is not None else ""
+    return value.strip() if value else ""
+
+def _stream_eaf(path):
+    """Stream-parse an EAF file into plain records, dropping each TIER subtree once it has been read
+    
+    Returns (time_slots, tiers, align_slots, ref_parent):
+    - time_slots: {TIME_SLOT_ID: milliseconds}
+    - tiers: (tier_id, ((slot_ref1, slot_ref2, value), ...), ((annotation_ref, value), ...)) per TIER, in file order
+    - align_slots: {ANNOTATION_ID: (slot_ref1, slot_ref2)} for ALIGNABLE_ANNOTATIONs
+    - ref_parent: {ANNOTATION_ID: ANNOTATION_REF} for REF_ANNOTATIONs
+    """
+    time_slots = {}
+    tiers = []
+    align_slots = {}
+    ref_parent = {}
+    
+    if HAS_LXML:
+        # lxml can filter by tag in C, so only TIME_SLOT/TIER ends reach the loop
+        events = lxml_etree.iterparse(path, events=('end',), tag=('TIME_SLOT', 'TIER'))
+    else:
+        events = ET.iterparse(path)
+    
+    for _, elem in events:
+        if elem.tag == 'TIME_SLOT':
+            time_value = elem.get('TIME_VALUE')
+            time_slots[elem.get('TIME_SLOT_ID')] = int(time_value) if time_value else 0
+        elif elem.tag == 'TIER':
+            if HAS_LXML:
+                # One C-filtered walk over the tier subtree yielding both kinds (document order within each)
+                alignable = []
+                refs = []
+                for annotation in elem.iter('ALIGNABLE_ANNOTATION', 'REF_ANNOTATION'):
+                    (alignable if annotation.tag == 'ALIGNABLE_ANNOTATION' else refs).append(annotation)
+            else:
+                # ElementTree's iter() takes a single tag, and findall('.//tag') is already a C-filtered
+                # iter(tag): two filtered walks beat one unfiltered walk classified in Python
+                alignable = elem.findall('.//ALIGNABLE_ANNOTATION')
+                refs = elem.findall('.//REF_ANNOTATION')
+            
+            # An ID is indexed once, first match winning across both dicts in the order the annotations
+            # used to be searched (tier by tier, ALIGNABLE before REF); a REF without ANNOTATION_REF is skipped
+            for annotation in alignable:
+                annotation_id = annotation.get('ANNOTATION_ID')
+                if annotation_id not in align_slots and annotation_id not in ref_parent:
+                    align_slots[annotation_id] = (annotation.get('TIME_SLOT_REF1'), annotation.get('TIME_SLOT_REF2'))
+            for annotation in refs:
+                annotation_id = annotation.get('ANNOTATION_ID')
+                nested_ref_id = annotation.get('ANNOTATION_REF')
+                if nested_ref_id and annotation_id not in align_slots and annotation_id not in ref_parent:
+                    ref_parent[annotation_id] = nested_ref_id
+            
+            tiers.append((
+                elem.get('TIER_ID'),
+                tuple(zip(map(_GET_SLOT_REF1, alignable), map(_GET_SLOT_REF2, alignable),
+                          map(_annotation_value, alignable))),
+                tuple(zip(map(_GET_ANNOTATION_REF, refs), map(_annotation_value, refs)))
+            ))
+            elem.clear()  # The tier is fully read: free its annotation elements
+    
+    return time_slots, tuple(tiers), align_slots, ref_parent
+
+@functools.lru_cache(maxsize=8)
+def _parse_eaf_cached(path, mtime_ns, size):
+    """Stream-parse an EAF file once per (path, mtime, size); the records are only read, never modified"""
+    return _stream_eaf(path)
+
 def ensure_directory_writable(path):
     """Check and create directory with write permissions"""
     path = Path(path)
     try:
         path.mkdir(parents=True, exist_ok=True)
-        # Test write
-        test_file = path / ".write_test"
-        with open(test_file, 'w') as f:
-            f.write("test")
-        test_file.unlink()
-        return True
     except Exception as e:
-        print(f"❌ Directory creation/write error: {e}")
+        logger.error("❌ Directory creation/write error: %s", e)
         return False
+    # Check write permission (single access() call instead of a probe file)
+    return os.access(path, os.W_OK)
+
+# Flags for writing output files as raw bytes (O_BINARY only exists on Windows; no newline translation)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
 
 def save_file_safely(file_path, content, encoding='utf-8'):
     """Save file safely"""
@@ -98,48 +563,132 @@ def save_file_safely(file_path, content, encoding='utf-8'):
         # Ensure directory
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, 'w', encoding=encoding, newline='\n') as f:
-            f.write(content)
+        # Encode once and hand the bytes to os.write: the content is already fully built in memory
+        data = memoryview(content.encode(encoding))
+        fd = os.open(file_path, _WRITE_FLAGS, 0o644)
+        try:
+            written = 0
+            while written < len(data):
+                written += os.write(fd, data[written:])
+        finally:
+            os.close(fd)
+        
+        logger.info("✅ File saved successfully: %s", file_path)
+        return True
+    except Exception as e:
+        logger.error("❌ File save failed %s: %s", file_path, e)
+        return False
+
+def stream_file_safely(file_path, write_content, encoding='utf-8'):
+    """Save file safely, streaming it through write_content(file) instead of building it in memory"""
+    try:
+        file_path = Path(file_path)
+        # Ensure directory
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # newline='' writes '\n' as is, like save_file_safely's raw bytes
+        with open(file_path, 'w', encoding=encoding, newline='', buffering=1 << 16) as f:
+            write_content(f)
         
-        print(f"✅ File saved successfully: {file_path}")
+        logger.info("✅ File saved successfully: %s", file_path)
+        return True
+    except Exception as e:
+        logger.error("❌ File save failed %s: %s", file_path, e)
+        return False
+
+def _wav_data_offset(path):
+    """Byte offset of the PCM payload ('data' chunk) in a RIFF/WAVE file"""
+    with open(path, 'rb') as f:
+        riff = f.read(12)
+        if riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+            raise ValueError(f"Not a RIFF/WAVE file: {path}")
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"No data chunk in WAV file: {path}")
+            chunk_id, chunk_size = header[:4], int.from_bytes(header[4:], 'little')
+            if chunk_id == b'data':
+                return f.tell()
+            f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)  # Chunks are padded to even sizes
+
+def _write_wav_segment(segment, sample_rate, output_path):
+    """Write an array audio segment as a 16bit WAV file"""
+    if AUDIO_LIBRARY in ('librosa', 'soundfile'):
+        sf.write(output_path, segment, sample_rate, subtype='PCM_16')
+    else:
+        with wave.open(output_path, 'wb') as wav_out:
+            wav_out.setnchannels(1)  # Mono
+            wav_out.setsampwidth(2)  # 16bit
+            wav_out.setframerate(sample_rate)
+            # Write straight from the (contiguous) slice of the loaded audio instead of a tobytes() copy
+            wav_out.writeframes(np.ascontiguousarray(segment))
+
+def _save_shared_segment(shm_name, shape, dtype, sample_rate, start_sample, end_sample, output_path):
+    """Process pool worker: save one segment of audio held in shared memory"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        audio = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        try:
+            _write_wav_segment(audio[start_sample:end_sample], sample_rate, output_path)
+        finally:
+            del audio  # Release the buffer view before close()
         return True
     except Exception as e:
-        print(f"❌ File save failed {file_path}: {e}")
+        logger.error("Audio save error: %s", e)
         return False
+    finally:
+        shm.close()
 
 class EAFConverter:
     def __init__(self, eaf_file_path: str, wav_file_path: str = None):
         self.eaf_file_path = eaf_file_path
         self.wav_file_path = wav_file_path
-        self.tree = None
-        self.root = None
         self.time_slots = {}
         self.tiers = {}
+        self._align_index = {}  # ALIGNABLE_ANNOTATION ID -> (start_ms, end_ms)
+        self._ref_parent = {}   # REF_ANNOTATION ID -> referenced ANNOTATION_ID
         
         # Audio processing attributes
         self.audio_data = None
         self.sample_rate = None
         self.audio_available = False
+        self._pcm_data = None  # pydub: raw PCM bytes of audio_data (segments are sliced from it directly)
         
     def load_audio(self):
         """Load audio file"""
         if not self.wav_file_path:
-            print("No audio file specified. Text conversion only.")
+            logger.info("No audio file specified. Text conversion only.")
             return False
             
         if not os.path.exists(self.wav_file_path):
-            print(f"Audio file not found: {self.wav_file_path}")
+            logger.warning("Audio file not found: %s", self.wav_file_path)
             return False
             
         if AUDIO_LIBRARY is None:
-            print("Audio library not available. Audio splitting not possible.")
+            logger.warning("Audio library not available. Audio splitting not possible.")
             return False
             
+        self.close()  # Release previously loaded audio (and its file mapping) before reloading
+        
         try:
-            if AUDIO_LIBRARY == 'librosa':
-                self.audio_data, self.sample_rate = librosa.load(self.wav_file_path, sr=None)
-                print(f"Audio file loaded: {self.wav_file_path}")
-                print(f"Sample rate: {self.sample_rate}Hz, Length: {len(self.audio_data)/self.sample_rate:.2f}s")
+            if AUDIO_LIBRARY in ('librosa', 'soundfile'):
+                try:
+                    # Read as int16 PCM (half the memory of librosa's float32; segments are written back as 16bit)
+                    self.audio_data, self.sample_rate = sf.read(self.wav_file_path, dtype='int16', always_2d=False)
+                    if self.audio_data.ndim > 1:
+                        # Mix down to mono (same as librosa.load default)
+                        self.audio_data = self.audio_data.mean(axis=1).astype(np.int16)
+                except RuntimeError:
+                    # Formats libsndfile cannot read (e.g. mp3 on older builds)
+                    if AUDIO_LIBRARY != 'librosa':
+                        raise
+                    import librosa
+                    audio, self.sample_rate = librosa.load(self.wav_file_path, sr=None)
+                    # Convert once to int16 as well (same scaling and clipping sf.write applies for
+                    # PCM_16), so every segment is written as 16bit without a per-file cast
+                    self.audio_data = np.clip(np.floor(audio * 32768), -32768, 32767).astype(np.int16)
+                logger.info("Audio file loaded: %s", self.wav_file_path)
+                logger.info("Sample rate: %sHz, Length: %.2fs", self.sample_rate, len(self.audio_data) / self.sample_rate)
                 
             elif AUDIO_LIBRARY == 'pydub':
                 if self.wav_file_path.lower().endswith('.wav'):
@@ -149,199 +698,159 @@ class EAFConverter:
                 else:
                     self.audio_data = AudioSegment.from_file(self.wav_file_path)
                 self.sample_rate = self.audio_data.frame_rate
-                print(f"Audio file loaded: {self.wav_file_path}")
-                print(f"Sample rate: {self.sample_rate}Hz, Length: {len(self.audio_data)/1000:.2f}s")
+                self._pcm_data = memoryview(self.audio_data.raw_data)
+                logger.info("Audio file loaded: %s", self.wav_file_path)
+                logger.info("Sample rate: %sHz, Length: %.2fs", self.sample_rate, len(self.audio_data) / 1000)
                 
             elif AUDIO_LIBRARY == 'wave':
                 with wave.open(self.wav_file_path, 'rb') as wav_file:
                     self.sample_rate = wav_file.getframerate()
-                    frames = wav_file.readframes(wav_file.getnframes())
-                    self.audio_data = np.frombuffer(frames, dtype=np.int16)
-                print(f"Audio file loaded: {self.wav_file_path}")
-                print(f"Sample rate: {self.sample_rate}Hz, Length: {len(self.audio_data)/self.sample_rate:.2f}s")
+                    frame_size = wav_file.getnchannels() * wav_file.getsampwidth()
+                    frame_count = wav_file.getnframes()
+                data_offset = _wav_data_offset(self.wav_file_path)
+                # Truncated files (cut-off recordings, data chunk still being written) declare more frames
+                # than are on disk: map only the whole frames that exist, as readframes() would return
+                frame_count = min(frame_count, (os.path.getsize(self.wav_file_path) - data_offset) // frame_size)
+                sample_count = frame_count * frame_size // 2
+                # Map the PCM payload instead of reading it: segments are views and the OS only pages in
+                # the parts that are actually sliced
+                if sample_count:
+                    self.audio_data = np.memmap(self.wav_file_path, dtype='<i2', mode='r',
+                                                offset=data_offset, shape=(sample_count,))
+                else:
+                    self.audio_data = np.zeros(0, dtype=np.int16)
+                logger.info("Audio file loaded: %s", self.wav_file_path)
+                logger.info("Sample rate: %sHz, Length: %.2fs", self.sample_rate, len(self.audio_data) / self.sample_rate)
                 
             self.audio_available = True
             return True
             
         except Exception as e:
-            print(f"Audio file loading error: {e}")
+            logger.error("Audio file loading error: %s", e)
             return False
+    
+    def close(self):
+        """Drop the loaded audio (the wave backend's memory map keeps the WAV file open until then)"""
+        self.audio_data = None
+        self._pcm_data = None
+        self.audio_available = False
         
     def parse_eaf(self):
         """Parse EAF file"""
         try:
-            self.tree = ET.parse(self.eaf_file_path)
-            self.root = self.tree.getroot()
-            print(f"EAF file loaded successfully: {self.eaf_file_path}")
-        except ET.ParseError as e:
-            print(f"XML parse error: {e}")
+            # Reuse the parsed records when the same unchanged file is converted again (e.g. quick_convert then debug_convert)
+            st = os.stat(self.eaf_file_path)
+            time_slots, tiers, align_slots, self._ref_parent = _parse_eaf_cached(
+                os.fspath(self.eaf_file_path), st.st_mtime_ns, st.st_size
+            )
+            logger.info("EAF file loaded successfully: %s", self.eaf_file_path)
+        except _XML_PARSE_ERRORS as e:
+            logger.error("XML parse error: %s", e)
             return False
         except FileNotFoundError:
-            print(f"File not found: {self.eaf_file_path}")
+            logger.error("File not found: %s", self.eaf_file_path)
             return False
             
         # Get time slots
-        time_order = self.root.find('TIME_ORDER')
-        if time_order is not None:
-            for time_slot in time_order.findall('TIME_SLOT'):
-                slot_id = time_slot.get('TIME_SLOT_ID')
-                time_value = time_slot.get('TIME_VALUE')
-                self.time_slots[slot_id] = int(time_value) if time_value else 0
+        self.time_slots.update(time_slots)
+        
+        logger.info("Time slots: %d", len(self.time_slots))
         
-        print(f"Time slots: {len(self.time_slots)}")
+        # Times of every ALIGNABLE_ANNOTATION by ID, for resolving REF_ANNOTATIONs without a tree walk
+        slot_time = self.time_slots.get
+        self._align_index = {
+            annotation_id: (slot_time(start_id, 0), slot_time(end_id, 0))
+            for annotation_id, (start_id, end_id) in align_slots.items()
+        }
         
         # Display tier information
-        print("\nAvailable tiers:")
-        for tier in self.root.findall('TIER'):
-            tier_id = tier.get('TIER_ID')
-            print(f"  - {tier_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available tiers:")
+            for tier_id, _, _ in tiers:
+                logger.debug("  - %s", tier_id)
             
-        # Get tiers (check both ALIGNABLE_ANNOTATION and REF_ANNOTATION)
-        for tier in self.root.findall('TIER'):
-            tier_id = tier.get('TIER_ID')
+        # Get tiers (both ALIGNABLE_ANNOTATION and REF_ANNOTATION)
+        for tier_id, alignable, refs in tiers:
             self.tiers[tier_id] = []
+            tier_starts = []  # Start times parallel to self.tiers[tier_id] (for sorting)
             
-            # Check ALIGNABLE_ANNOTATION
-            for annotation in tier.findall('.//ALIGNABLE_ANNOTATION'):
-                start_id = annotation.get('TIME_SLOT_REF1')
-                end_id = annotation.get('TIME_SLOT_REF2')
-                value_elem = annotation.find('ANNOTATION_VALUE')
-                value = value_elem.text if value_elem is not None else ""
-                
-                self.tiers[tier_id].append({
-                    'start_time': self.time_slots.get(start_id, 0),
-                    'end_time': self.time_slots.get(end_id, 0),
-                    'value': value.strip() if value else "",
-                    'type': 'ALIGNABLE'
-                })
+            # ALIGNABLE_ANNOTATION
+            # Resolve the whole tier's time slot references in one C-level map() each (missing slots -> 0)
+            start_times = list(map(self.time_slots.get, map(operator.itemgetter(0), alignable), repeat(0)))
+            end_times = list(map(self.time_slots.get, map(operator.itemgetter(1), alignable), repeat(0)))
+            tier_starts.extend(start_times)
             
-            # Also check REF_ANNOTATION
-            for annotation in tier.findall('.//REF_ANNOTATION'):
-                ref_id = annotation.get('ANNOTATION_REF')
-                value_elem = annotation.find('ANNOTATION_VALUE')
-                value = value_elem.text if value_elem is not None else ""
-                
+            for (_, _, value), start_time, end_time in zip(alignable, start_times, end_times):
+                self.tiers[tier_id].append(Annotation(
+                    start_time=start_time,
+                    end_time=end_time,
+                    value=value,
+                    type='ALIGNABLE',
+                    words=tuple(value.split())  # Pre-split once for sentence extraction
+                ))
+            
+            # REF_ANNOTATION
+            for ref_id, value in refs:
                 # Get time from referenced annotation
                 ref_start, ref_end = self._get_ref_time(ref_id)
                 
-                self.tiers[tier_id].append({
-                    'start_time': ref_start,
-                    'end_time': ref_end,
-                    'value': value.strip() if value else "",
-                    'type': 'REF',
-                    'ref_id': ref_id
-                })
+                tier_starts.append(ref_start)
+                self.tiers[tier_id].append(Annotation(
+                    start_time=ref_start,
+                    end_time=ref_end,
+                    value=value,
+                    type='REF',
+                    ref_id=ref_id,
+                    words=tuple(value.split())  # Pre-split once for sentence extraction
+                ))
             
-            # Sort by start time
-            self.tiers[tier_id].sort(key=lambda x: x['start_time'])
-            print(f"  {tier_id}: {len(self.tiers[tier_id])} annotations")
+            # Sort by start time (stable NumPy argsort when available)
+            if HAS_NUMPY and len(tier_starts) > 1:
+                order = np.argsort(np.asarray(tier_starts, dtype=np.int64), kind='stable')
+                annotations = self.tiers[tier_id]
+                self.tiers[tier_id] = [annotations[i] for i in order.tolist()]
+            else:
+                self.tiers[tier_id].sort(key=operator.attrgetter('start_time'))
+            logger.debug("  %s: %d annotations", tier_id, len(self.tiers[tier_id]))
         
         return True
     
     def _get_ref_time(self, ref_id: str) -> tuple:
         """Get time from REF_ANNOTATION reference"""
-        # Search all tiers for referenced annotation
-        for tier in self.root.findall('TIER'):
-            for annotation in tier.findall('.//ALIGNABLE_ANNOTATION'):
-                if annotation.get('ANNOTATION_ID') == ref_id:
-                    start_id = annotation.get('TIME_SLOT_REF1')
-                    end_id = annotation.get('TIME_SLOT_REF2')
-                    return (self.time_slots.get(start_id, 0), self.time_slots.get(end_id, 0))
-            
-            # Handle REF_ANNOTATION referencing other REF_ANNOTATION
-            for annotation in tier.findall('.//REF_ANNOTATION'):
-                if annotation.get('ANNOTATION_ID') == ref_id:
-                    nested_ref_id = annotation.get('ANNOTATION_REF')
-                    if nested_ref_id:
-                        return self._get_ref_time(nested_ref_id)
+        # Follow REF_ANNOTATION -> REF_ANNOTATION chains until an ALIGNABLE_ANNOTATION is reached
+        # (a chain can be at most len(self._ref_parent) long; anything longer is a reference cycle)
+        for _ in range(len(self._ref_parent) + 1):
+            times = self._align_index.get(ref_id)
+            if times is not None:
+                return times
+            ref_id = self._ref_parent.get(ref_id)
+            if ref_id is None:
+                break
         
         return (0, 0)
     
-    def _convert_leipzig_glosses(self, gloss_text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _convert_leipzig_glosses(gloss_text: str) -> str:
         """Convert uppercase grammatical morpheme symbols according to Leipzig.sty rules"""
         if not gloss_text:
             return gloss_text
         
-        # Double backslashes to avoid tab character issues
-        leipzig_mapping = {
-            'NOM': '\\\\textsc{nom}', 'ACC': '\\\\textsc{acc}', 'GEN': '\\\\textsc{gen}',
-            'DAT': '\\\\textsc{dat}', 'ABL': '\\\\textsc{abl}', 'LOC': '\\\\textsc{loc}',
-            'PST': '\\\\textsc{pst}', 'PRS': '\\\\textsc{prs}', 'FUT': '\\\\textsc{fut}',
-            'NPST': '\\\\textsc{npst}', 'PFV': '\\\\textsc{pfv}', 'IPFV': '\\\\textsc{ipfv}',
-            'SG': '\\\\textsc{sg}', 'PL': '\\\\textsc{pl}', 'DU': '\\\\textsc{du}',
-            'COP': '\\\\textsc{cop}', 'AUX': '\\\\textsc{aux}', 'NEG': '\\\\textsc{neg}',
-            'FOC': '\\\\textsc{foc}', 'TOP': '\\\\textsc{top}', 'EMPH': '\\\\textsc{emph}',
-            'HS': '\\\\textsc{hs}', 'EVID': '\\\\textsc{evid}', 'QUOT': '\\\\textsc{quot}',
-            'SFP': '\\\\textsc{sfp}', 'CAS': '\\\\textsc{cas}', 'PART': '\\\\textsc{part}',
-            'CAUS': '\\\\textsc{caus}', 'PASS': '\\\\textsc{pass}', 'REFL': '\\\\textsc{refl}',
-            'Q': '\\\\textsc{q}', 'CLF': '\\\\textsc{clf}', 'DET': '\\\\textsc{det}',
-            'DEF': '\\\\textsc{def}', 'INDEF': '\\\\textsc{indef}', 'COM': '\\\\textsc{com}',
-            'INF': '\\\\textsc{inf}', 'SEQ': '\\\\textsc{seq}', 'FIL': '\\\\textsc{fil}'
-        }
-        
-        result = gloss_text
-        
-        # More careful conversion: strict word boundary check
-        for original, replacement in leipzig_mapping.items():
-            pattern = r'(?<![A-Za-z])' + re.escape(original) + r'(?![A-Za-z])'
-            result = re.sub(pattern, replacement, result)
-        
-        # Auto-convert remaining consecutive uppercase letters
-        def convert_unknown_caps(match):
-            caps_text = match.group(0)
-            return f'\\\\textsc{{{caps_text.lower()}}}'
-        
-        result = re.sub(r'(?<![A-Za-z])[A-Z]{2,}(?![A-Za-z])', convert_unknown_caps, result)
-        
-        return result
+        # Known symbols use their mapping; any other run of 2+ capitals becomes \textsc{lowercase}
+        return _LEIPZIG_RE.sub(_leipzig_replacement, gloss_text)
     
-    def _convert_leipzig_back_to_plain(self, text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _convert_leipzig_back_to_plain(text: str) -> str:
         """Convert Leipzig.sty smallcaps commands back to original small caps"""
         if not text:
             return text
         
-        def convert_textsc_to_smallcaps(match):
-            content = match.group(1)
-            # Convert to small caps (using actual Unicode small caps characters)
-            smallcap_mapping = {
-                'nom': 'ɴᴏᴍ', 'acc': 'ᴀᴄᴄ', 'gen': 'ɢᴇɴ',
-                'dat': 'ᴅᴀᴛ', 'abl': 'ᴀʙʟ', 'loc': 'ʟᴏᴄ',
-                'pst': 'ᴘsᴛ', 'prs': 'ᴘʀs', 'fut': 'ꜰᴜᴛ',
-                'npst': 'ɴᴘsᴛ', 'pfv': 'ᴘꜰᴠ', 'ipfv': 'ɪᴘꜰᴠ',
-                'sg': 'sɢ', 'pl': 'ᴘʟ', 'du': 'ᴅᴜ',
-                'cop': 'ᴄᴏᴘ', 'aux': 'ᴀᴜx', 'neg': 'ɴᴇɢ',
-                'foc': 'ꜰᴏᴄ', 'top': 'ᴛᴏᴘ', 'emph': 'ᴇᴍᴘʜ',
-                'hs': 'ʜs', 'evid': 'ᴇᴠɪᴅ', 'quot': 'Qᴜᴏᴛ',
-                'sfp': 'sꜰᴘ', 'cas': 'ᴄᴀs', 'part': 'ᴘᴀʀᴛ',
-                'caus': 'ᴄᴀᴜs', 'pass': 'ᴘᴀss', 'refl': 'ʀᴇꜰʟ',
-                'q': 'Q', 'clf': 'ᴄʟꜰ', 'det': 'ᴅᴇᴛ',
-                'def': 'ᴅᴇꜰ', 'indef': 'ɪɴᴅᴇꜰ', 'com': 'ᴄᴏᴍ',
-                'inf': 'ɪɴꜰ', 'seq': 'sᴇQ', 'fil': 'ꜰɪʟ'
-            }
-            
-            return smallcap_mapping.get(content.lower(), content.upper())
-        
         # Convert \\textsc{...} to small caps
-        result = re.sub(r'\\textsc\{([^}]+)\}', convert_textsc_to_smallcaps, text)
+        result = _TEXTSC_RE.sub(_textsc_to_smallcaps, text)
         
         # Also convert regular uppercase (2+ characters) to small caps
-        def convert_caps_to_smallcaps(match):
-            caps_text = match.group(0)
-            result_chars = []
-            for char in caps_text:
-                # Individual character mapping
-                char_mapping = {
-                    'A': 'ᴀ', 'B': 'ʙ', 'C': 'ᴄ', 'D': 'ᴅ', 'E': 'ᴇ', 'F': 'ꜰ',
-                    'G': 'ɢ', 'H': 'ʜ', 'I': 'ɪ', 'J': 'ᴊ', 'K': 'ᴋ', 'L': 'ʟ',
-                    'M': 'ᴍ', 'N': 'ɴ', 'O': 'ᴏ', 'P': 'ᴘ', 'Q': 'Q', 'R': 'ʀ',
-                    'S': 's', 'T': 'ᴛ', 'U': 'ᴜ', 'V': 'ᴠ', 'W': 'ᴡ', 'X': 'x',
-                    'Y': 'ʏ', 'Z': 'ᴢ'
-                }
-                result_chars.append(char_mapping.get(char, char))
-            return ''.join(result_chars)
-        
-        # Convert consecutive uppercase letters (2+ characters) to small caps
-        result = re.sub(r'(?<![A-Za-z])[A-Z]{2,}(?![A-Za-z])', convert_caps_to_smallcaps, result)
+        result = _CAPS_RUN_RE.sub(_caps_to_smallcaps, result)
         
         return result
     
@@ -355,15 +864,30 @@ class EAFConverter:
         if not morph_list:
             return morph_or_gloss
         
-        # Split text1 layer into words
         text1_words = text1.split()
+        if not text1_words:
+            # Whitespace-only text1 has no words to carry morphemes
+            return ''
+        
+        return ' '.join(self._align_morph_words_with_text1(text1_words, morph_list))
+    
+    def _align_morph_words_with_text1(self, text1_words: List[str], morph_list: List[str]) -> List[str]:
+        """Word-list version of _align_morphs_with_text1 (input and output are pre-split)"""
+        if not text1_words or not morph_list:
+            return morph_list
+        
+        # Without any boundary symbol every text1 word takes exactly one morpheme
+        joined_text1 = ' '.join(text1_words)
+        if '=' not in joined_text1 and '-' not in joined_text1:
+            return morph_list[:len(text1_words)]
+        
         result_parts = []
         morph_idx = 0
         
         for word in text1_words:
             # Find morpheme boundaries within word (=, -)
             # Split while preserving delimiters
-            segments = re.split(r'([=-])', word)
+            segments = _MORPH_BOUNDARY_RE.split(word)
             word_morphs = []
             
             for segment in segments:
@@ -415,106 +939,81 @@ class EAFConverter:
                 
                 result_parts.extend(combined_morphs)
         
-        return ' '.join(result_parts)
+        return result_parts
     
-    def _split_sentences_by_punctuation_multilayer(self, text0: str, text1: str, morph: str, gloss: str, translation: str, start_time: int = 0, end_time: int = 0) -> List[Dict]:
-        """Multi-layer sentence splitting (based on text0)"""
-        # Pattern to detect sentence-ending punctuation
-        sentence_pattern = r'([.?!]+)'
-        
-        # Split text0 layer by sentence-ending punctuation
-        text0_parts = re.split(sentence_pattern, text0)
-        
+    def _split_sentences_by_punctuation_multilayer(self, text0: str, text1_words: List[str], morph_words: List[str], gloss_words: List[str], translation: str, start_time: int = 0, end_time: int = 0) -> List[Dict]:
+        """Multi-layer sentence splitting (based on text0; other layers are passed pre-split into words)"""
         sentences = []
         current_text0 = ""
         
-        # Split each layer by spaces
-        text1_words = text1.split() if text1 else []
-        morph_words = morph.split() if morph else []
-        gloss_words = gloss.split() if gloss else []
+        # All layers advance in lockstep, so one word index covers text1, morph and gloss
+        word_idx = 0
         
-        text1_idx = 0
-        morph_idx = 0
-        gloss_idx = 0
-        
-        # For time calculation
-        total_chars = len(text0.replace('.', '').replace('?', '').replace('!', ''))
+        # For time calculation (duration computed once)
+        total_chars = len(text0.translate(_STRIP_SENTENCE_PUNCT))
         current_chars = 0
+        duration = end_time - start_time if total_chars > 0 and start_time != end_time else None
         
-        for part in text0_parts:
-            # Check if it's punctuation
-            is_punctuation = bool(re.match(r'^[.?!]+$', part))
+        # Walk text0 as (text, sentence-ending punctuation) pairs in a single regex pass
+        for segment, punctuation in _SENTENCE_RE.findall(text0):
+            if segment.strip():
+                # Regular text
+                current_text0 += segment
             
-            if is_punctuation:
+            if punctuation:
                 # Sentence-ending punctuation
-                current_text0 += part
+                current_text0 += punctuation
                 
                 # Complete current sentence
                 if current_text0.strip():
                     # Calculate corresponding word count
-                    clean_text0 = current_text0.replace('.', '').replace('?', '').replace('!', '')
+                    clean_text0 = current_text0.translate(_STRIP_SENTENCE_PUNCT)
                     text0_words_count = len(clean_text0.split())
                     
-                    # Get corresponding text1, morph, gloss
-                    sent_text1 = text1_words[text1_idx:text1_idx + text0_words_count] if text1_idx < len(text1_words) else []
-                    sent_morphs = morph_words[morph_idx:morph_idx + text0_words_count] if morph_idx < len(morph_words) else []
-                    sent_glosses = gloss_words[gloss_idx:gloss_idx + text0_words_count] if gloss_idx < len(gloss_words) else []
+                    # Word range (a, b) shared by text1, morph and gloss
+                    a = word_idx
+                    b = word_idx + text0_words_count
                     
                     # Estimate time
                     sentence_chars = len(clean_text0)
-                    if total_chars > 0 and start_time != end_time:
-                        char_ratio = sentence_chars / total_chars
-                        duration = end_time - start_time
+                    if duration is not None:
                         sentence_start = start_time + int((current_chars / total_chars) * duration)
-                        sentence_end = sentence_start + int(char_ratio * duration)
+                        sentence_end = sentence_start + int((sentence_chars / total_chars) * duration)
                     else:
                         sentence_start = start_time
                         sentence_end = end_time
                     
                     sentences.append({
                         'text0': current_text0.strip(),
-                        'text1': ' '.join(sent_text1),
-                        'morph': ' '.join(sent_morphs),
-                        'gloss': ' '.join(sent_glosses),
+                        'text1': ' '.join(text1_words[a:b]),
+                        'morph': ' '.join(morph_words[a:b]),
+                        'gloss': ' '.join(gloss_words[a:b]),
                         'translation': translation,  # Translation shared for all
                         'start_time': sentence_start,
                         'end_time': sentence_end
                     })
                     
-                    # Update indices
-                    text1_idx += text0_words_count
-                    morph_idx += text0_words_count
-                    gloss_idx += text0_words_count
+                    # Update index
+                    word_idx = b
                     current_chars += sentence_chars
                     current_text0 = ""
-            
-            elif part.strip():
-                # Regular text
-                current_text0 += part
         
         # Handle remaining text
         if current_text0.strip():
-            # Use remaining layers
-            remaining_text1 = text1_words[text1_idx:] if text1_idx < len(text1_words) else []
-            remaining_morphs = morph_words[morph_idx:] if morph_idx < len(morph_words) else []
-            remaining_glosses = gloss_words[gloss_idx:] if gloss_idx < len(gloss_words) else []
-            
             # Calculate remaining time
-            sentence_chars = len(current_text0.replace('.', '').replace('?', '').replace('!', ''))
-            if total_chars > 0 and start_time != end_time:
-                char_ratio = sentence_chars / total_chars
-                duration = end_time - start_time
+            sentence_chars = len(current_text0.translate(_STRIP_SENTENCE_PUNCT))
+            if duration is not None:
                 sentence_start = start_time + int((current_chars / total_chars) * duration)
-                sentence_end = sentence_start + int(char_ratio * duration)
+                sentence_end = sentence_start + int((sentence_chars / total_chars) * duration)
             else:
                 sentence_start = start_time
                 sentence_end = end_time
             
             sentences.append({
                 'text0': current_text0.strip(),
-                'text1': ' '.join(remaining_text1),
-                'morph': ' '.join(remaining_morphs),
-                'gloss': ' '.join(remaining_glosses),
+                'text1': ' '.join(text1_words[word_idx:]),
+                'morph': ' '.join(morph_words[word_idx:]),
+                'gloss': ' '.join(gloss_words[word_idx:]),
                 'translation': translation,
                 'start_time': sentence_start,
                 'end_time': sentence_end
@@ -522,9 +1021,9 @@ class EAFConverter:
         
         return sentences if sentences else [{
             'text0': text0, 
-            'text1': text1,
-            'morph': morph, 
-            'gloss': gloss, 
+            'text1': ' '.join(text1_words),
+            'morph': ' '.join(morph_words), 
+            'gloss': ' '.join(gloss_words), 
             'translation': translation,
             'start_time': start_time,
             'end_time': end_time
@@ -558,27 +1057,33 @@ class EAFConverter:
         print(f"  gloss: {len(gloss_tier)} items")
         print(f"  translation: {len(translation_tier)} items")
         
+        # Column views of the searched tiers (built once, reused for every text0 annotation)
+        text1_intervals = self._tier_intervals(text1_tier)
+        morph_intervals = self._tier_intervals(morph_tier)
+        gloss_intervals = self._tier_intervals(gloss_tier)
+        translation_intervals = self._tier_intervals(translation_tier)
+        
         # Synchronize other layers based on text0
         for i, text0_annotation in enumerate(text0_tier):
-            if not text0_annotation['value']:
+            if not text0_annotation.value:
                 continue
                 
-            start_time = text0_annotation['start_time']
-            end_time = text0_annotation['end_time']
+            start_time = text0_annotation.start_time
+            end_time = text0_annotation.end_time
             
-            # Find corresponding text1, morph, gloss, translation
-            text1 = self._find_overlapping_annotation(text1_tier, start_time, end_time)
-            morph = self._find_overlapping_annotation(morph_tier, start_time, end_time)
-            gloss = self._find_overlapping_annotation(gloss_tier, start_time, end_time)
-            translation = self._find_overlapping_annotation(translation_tier, start_time, end_time)
+            # Find corresponding text1, morph, gloss (as pre-split words) and translation
+            text1_words = self._find_overlapping_words(text1_tier, start_time, end_time, text1_intervals)
+            morph_words = self._find_overlapping_words(morph_tier, start_time, end_time, morph_intervals)
+            gloss_words = self._find_overlapping_words(gloss_tier, start_time, end_time, gloss_intervals)
+            translation = self._find_overlapping_annotation(translation_tier, start_time, end_time, translation_intervals)
             
             # Adjust morph and gloss based on text1 morpheme boundaries
-            aligned_morph = self._align_morphs_with_text1(text1, morph)
-            aligned_gloss = self._align_morphs_with_text1(text1, gloss)
+            aligned_morph_words = self._align_morph_words_with_text1(text1_words, morph_words)
+            aligned_gloss_words = self._align_morph_words_with_text1(text1_words, gloss_words)
             
             # Split by sentence-ending punctuation (with time info)
             split_sentences = self._split_sentences_by_punctuation_multilayer(
-                text0_annotation['value'], text1, aligned_morph, aligned_gloss, translation, start_time, end_time
+                text0_annotation.value, text1_words, aligned_morph_words, aligned_gloss_words, translation, start_time, end_time
             )
             
             sentences.extend(split_sentences)
@@ -586,22 +1091,84 @@ class EAFConverter:
         print(f"\nExtracted sentences: {len(sentences)}")
         return sentences
     
-    def _find_overlapping_annotation(self, tier_data: List[Dict], start_time: int, end_time: int) -> str:
+    def _find_overlapping_annotation(self, tier_data: List[Annotation], start_time: int, end_time: int,
+                                     intervals: Optional[TierIntervals] = None) -> str:
         """Find and combine annotations that overlap with specified time range"""
+        if intervals is not None:
+            values = intervals.values
+            return ' '.join([values[i] for i in self._overlap_index_list(intervals, start_time, end_time) if values[i]])
+        matching_annotations = self._find_overlapping_annotations(tier_data, start_time, end_time, intervals)
+        return ' '.join([ann.value for ann in matching_annotations if ann.value])
+    
+    def _find_overlapping_words(self, tier_data: List[Annotation], start_time: int, end_time: int,
+                                intervals: Optional[TierIntervals] = None) -> List[str]:
+        """Same as _find_overlapping_annotation, but returns the pre-split words"""
+        if intervals is not None:
+            words = intervals.words
+            return [word for i in self._overlap_index_list(intervals, start_time, end_time) for word in words[i]]
+        matching_annotations = self._find_overlapping_annotations(tier_data, start_time, end_time, intervals)
+        return [word for ann in matching_annotations for word in ann.words]
+    
+    def _tier_intervals(self, tier_data: List[Annotation]) -> TierIntervals:
+        """Column view of a start-sorted tier for overlap search (built once per tier)"""
+        if HAS_NUMPY and len(tier_data) >= _NUMPY_OVERLAP_MIN_ANNOTATIONS:
+            starts = np.fromiter(map(operator.attrgetter('start_time'), tier_data), dtype=np.int64, count=len(tier_data))
+            ends = np.fromiter(map(operator.attrgetter('end_time'), tier_data), dtype=np.int64, count=len(tier_data))
+            max_ends = np.maximum.accumulate(ends)
+        else:
+            # Small tier (or no NumPy): plain lists, searched with bisect
+            starts = list(map(operator.attrgetter('start_time'), tier_data))
+            ends = list(map(operator.attrgetter('end_time'), tier_data))
+            max_ends = list(accumulate(ends, max))
+        values = list(map(operator.attrgetter('value'), tier_data))
+        words = list(map(operator.attrgetter('words'), tier_data))
+        return TierIntervals(starts, ends, max_ends, values, words)
+    
+    def _overlap_index_list(self, intervals: TierIntervals, start_time: int, end_time: int) -> List[int]:
+        """Indices (in start order) of the tier's annotations that overlap with specified time range"""
+        starts, ends, max_ends = intervals.starts, intervals.ends, intervals.max_ends
+        # Only annotations starting no later than max(start_time, end_time) can overlap or match exactly,
+        # and none of those before the first one ending at or after min(start_time, end_time) can:
+        # both bounds are binary searches over non-decreasing columns, leaving a window [lower, limit)
+        if isinstance(starts, list):
+            limit = bisect.bisect_right(starts, max(start_time, end_time))
+            lower = bisect.bisect_left(max_ends, min(start_time, end_time), 0, limit)
+            return [i for i in range(lower, limit)
+                    if min(ends[i], end_time) > max(starts[i], start_time)
+                    or (starts[i] == start_time and ends[i] == end_time)]  # Has overlap or exact match
+        
+        if HAS_NUMBA:
+            # Compiled scan that stops at the first annotation starting after the range
+            return _overlap_indices(starts, ends, start_time, end_time).tolist()
+        
+        limit = int(np.searchsorted(starts, max(start_time, end_time), side='right'))
+        lower = int(np.searchsorted(max_ends[:limit], min(start_time, end_time), side='left'))
+        starts, ends = starts[lower:limit], ends[lower:limit]
+        # Has overlap or exact match
+        mask = np.minimum(ends, end_time) > np.maximum(starts, start_time)
+        mask |= (starts == start_time) & (ends == end_time)
+        return (np.flatnonzero(mask) + lower).tolist()
+    
+    def _find_overlapping_annotations(self, tier_data: List[Annotation], start_time: int, end_time: int,
+                                      intervals: Optional[TierIntervals] = None) -> List[Annotation]:
+        """Find annotations that overlap with specified time range (sorted by start time)"""
+        if intervals is not None:
+            return [tier_data[i] for i in self._overlap_index_list(intervals, start_time, end_time)]
+        
         matching_annotations = []
         
         for annotation in tier_data:
             # Check if time ranges overlap
-            overlap_start = max(annotation['start_time'], start_time)
-            overlap_end = min(annotation['end_time'], end_time)
+            overlap_start = max(annotation.start_time, start_time)
+            overlap_end = min(annotation.end_time, end_time)
             
-            if overlap_start < overlap_end or (annotation['start_time'] == start_time and annotation['end_time'] == end_time):
+            if overlap_start < overlap_end or (annotation.start_time == start_time and annotation.end_time == end_time):
                 # Has overlap or exact match
                 matching_annotations.append(annotation)
         
-        # Sort overlapping annotations by time and combine
-        matching_annotations.sort(key=lambda x: x['start_time'])
-        return ' '.join([ann['value'] for ann in matching_annotations if ann['value']])
+        # Sort overlapping annotations by time
+        matching_annotations.sort(key=operator.attrgetter('start_time'))
+        return matching_annotations
     
     def save_audio_segment(self, start_ms: int, end_ms: int, output_path: str, padding_ms: int = 100):
         """Save audio segment for specified time range"""
@@ -612,42 +1179,31 @@ class EAFConverter:
             # Add padding (small buffer before and after)
             padded_start = max(0, start_ms - padding_ms)
             
-            if AUDIO_LIBRARY == 'librosa':
+            if AUDIO_LIBRARY in _ARRAY_AUDIO_LIBRARIES:
                 # Convert milliseconds to sample numbers
-                start_sample = int((padded_start / 1000.0) * self.sample_rate)
-                end_sample = int((end_ms / 1000.0) * self.sample_rate)
-                padded_end_sample = min(len(self.audio_data), end_sample + int((padding_ms / 1000.0) * self.sample_rate))
-                
-                # Extract audio segment
-                audio_segment = self.audio_data[start_sample:padded_end_sample]
+                start_sample, padded_end_sample = self._segment_sample_range(start_ms, end_ms, padding_ms)
                 
-                # Save to file
-                sf.write(output_path, audio_segment, self.sample_rate)
+                # Extract audio segment and save to file
+                _write_wav_segment(self.audio_data[start_sample:padded_end_sample], self.sample_rate, output_path)
                 
             elif AUDIO_LIBRARY == 'pydub':
-                padded_end = end_ms + padding_ms
-                
-                # Extract audio segment
-                audio_segment = self.audio_data[padded_start:padded_end]
+                audio = self.audio_data
+                duration_ms = len(audio)
+                padded_end = min(end_ms + padding_ms, duration_ms)
+                padded_start = min(padded_start, padded_end)
                 
-                # Save to file
-                audio_segment.export(output_path, format="wav")
-                
-            elif AUDIO_LIBRARY == 'wave':
-                # Convert milliseconds to sample numbers
-                start_sample = int((padded_start / 1000.0) * self.sample_rate)
-                end_sample = int((end_ms / 1000.0) * self.sample_rate)
-                padded_end_sample = min(len(self.audio_data), end_sample + int((padding_ms / 1000.0) * self.sample_rate))
+                # Byte range of the segment (same frame arithmetic as AudioSegment slicing)
+                frames_per_ms = audio.frame_rate / 1000.0
+                start_byte = int(padded_start * frames_per_ms) * audio.frame_width
+                end_byte = int(padded_end * frames_per_ms) * audio.frame_width
                 
-                # Extract audio segment
-                audio_segment = self.audio_data[start_sample:padded_end_sample]
-                
-                # Save as WAV file
+                # Write the PCM slice with a WAV header (what export(format="wav") does, without
+                # building an intermediate AudioSegment per segment)
                 with wave.open(output_path, 'wb') as wav_out:
-                    wav_out.setnchannels(1)  # Mono
-                    wav_out.setsampwidth(2)  # 16bit
-                    wav_out.setframerate(self.sample_rate)
-                    wav_out.writeframes(audio_segment.tobytes())
+                    wav_out.setnchannels(audio.channels)
+                    wav_out.setsampwidth(audio.sample_width)
+                    wav_out.setframerate(audio.frame_rate)
+                    wav_out.writeframes(self._pcm_data[start_byte:end_byte])
             
             return True
             
@@ -655,137 +1211,88 @@ class EAFConverter:
             print(f"Audio save error: {e}")
             return False
     
-    def _convert_ipa_to_tipa(self, text: str) -> str:
+    def save_audio_segments_batch(self, segments: List[Tuple[int, int, str]], padding_ms: int = 100) -> List[bool]:
+        """Save (start_ms, end_ms, output_path) segments concurrently; returns success per segment"""
+        if not self.audio_available:
+            return [False] * len(segments)
+        
+        if AUDIO_LIBRARY not in _ARRAY_AUDIO_LIBRARIES or not segments:
+            # pydub: AudioSegment slicing/export per segment
+            with ThreadPoolExecutor(max_workers=_SEGMENT_WRITE_WORKERS) as executor:
+                return list(executor.map(lambda segment: self.save_audio_segment(*segment, padding_ms), segments))
+        
+        # Sample ranges of all segments in one vectorized pass (same arithmetic as _segment_sample_range)
+        start_ms = np.fromiter((segment[0] for segment in segments), dtype=np.int64, count=len(segments))
+        end_ms = np.fromiter((segment[1] for segment in segments), dtype=np.int64, count=len(segments))
+        start_samples = ((np.maximum(start_ms - padding_ms, 0) / 1000.0) * self.sample_rate).astype(np.int64)
+        end_samples = np.minimum(
+            len(self.audio_data),
+            ((end_ms / 1000.0) * self.sample_rate).astype(np.int64) + int((padding_ms / 1000.0) * self.sample_rate)
+        )
+        
+        def write_segment(job):
+            start_sample, end_sample, output_path = job
+            try:
+                _write_wav_segment(self.audio_data[start_sample:end_sample], self.sample_rate, output_path)
+                return True
+            except Exception as e:
+                logger.error("Audio save error: %s", e)
+                return False
+        
+        # Writes are independent files and libsndfile releases the GIL while writing
+        with ThreadPoolExecutor(max_workers=_SEGMENT_WRITE_WORKERS) as executor:
+            return list(executor.map(write_segment, zip(
+                start_samples.tolist(), end_samples.tolist(), (segment[2] for segment in segments)
+            )))
+    
+    def _segment_sample_range(self, start_ms: int, end_ms: int, padding_ms: int) -> tuple:
+        """Sample range (start, end) of a padded segment for array-backed audio"""
+        padded_start = max(0, start_ms - padding_ms)
+        start_sample = int((padded_start / 1000.0) * self.sample_rate)
+        end_sample = int((end_ms / 1000.0) * self.sample_rate)
+        padded_end_sample = min(len(self.audio_data), end_sample + int((padding_ms / 1000.0) * self.sample_rate))
+        return start_sample, padded_end_sample
+    
+    def _save_segments_in_processes(self, segments: List[tuple], padding_ms: int) -> List[bool]:
+        """Save (start_ms, end_ms, output_path) segments with a process pool; audio is shared, not copied"""
+        shm = shared_memory.SharedMemory(create=True, size=self.audio_data.nbytes)
+        try:
+            shared_audio = np.ndarray(self.audio_data.shape, dtype=self.audio_data.dtype, buffer=shm.buf)
+            shared_audio[:] = self.audio_data
+            del shared_audio  # Release the buffer view before close()
+            
+            with ProcessPoolExecutor() as executor:
+                futures = [
+                    executor.submit(_save_shared_segment, shm.name, self.audio_data.shape, self.audio_data.dtype.str,
+                                    self.sample_rate, *self._segment_sample_range(start_ms, end_ms, padding_ms),
+                                    output_path)
+                    for start_ms, end_ms, output_path in segments
+                ]
+                return [future.result() for future in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _convert_ipa_to_tipa(text: str) -> str:
         """Convert IPA characters to tipa package format"""
-        if not text:
+        if not text or text.isascii():
+            # All IPA keys are non-ASCII, so ASCII-only text has nothing to convert
             return text
             
-        # IPA to tipa command mapping (added {} for clear separation)
-        ipa_to_tipa = {
-            'ɨ': '\\textbari{}',
-            'ɯ': '\\textturnm{}',
-            'ɛ': '\\textepsilon{}',
-            'ɔ': '\\textopeno{}',
-            'æ': '\\textae{}',
-            'ɑ': '\\textscripta{}',
-            'ɒ': '\\textturnscripta{}',
-            'ə': '\\textschwa{}',
-            'ɪ': '\\textsci{}',
-            'ʊ': '\\textupsilon{}',
-            'ʃ': '\\textesh{}',
-            'ʒ': '\\textyogh{}',
-            'θ': '\\texttheta{}',
-            'ð': '\\texteth{}',
-            'ŋ': '\\texteng{}',
-            'ɲ': '\\textltailn{}',
-            'ɳ': '\\textrtailn{}',
-            'ɱ': '\\textltailm{}',
-            'ɾ': '\\textfishhookr{}',
-            'ɽ': '\\textrtailr{}',
-            'ɻ': '\\textturnr{}',
-            'ɭ': '\\textrtaill{}',
-            'ʎ': '\\textturny{}',
-            'ʈ': '\\textrtailt{}',
-            'ɖ': '\\textrtaild{}',
-            'ʂ': '\\textrtails{}',
-            'ʐ': '\\textrtailz{}',
-            'ɕ': '\\textctc{}',
-            'ʑ': '\\textctj{}',
-            'ç': '\\textccedilla{}',
-            'ʝ': '\\textctj{}',
-            'ɣ': '\\textgamma{}',
-            'χ': '\\textchi{}',
-            'ʁ': '\\textinvscr{}',
-            'ħ': '\\textcrh{}',
-            'ʕ': '\\textrevglotstop{}',
-            'ʔ': '\\textglotstop{}',
-            'ɸ': '\\textphi{}',
-            'β': '\\textbeta{}',
-            'ʋ': '\\textscriptv{}',
-            'ɹ': '\\textturnr{}',
-            'ɰ': '\\textturnmrleg{}',
-            'ɺ': '\\textlhti{}',
-            'ɢ': '\\textscg{}',
-            'ʛ': '\\texthtg{}',
-            'ʄ': '\\texthtbardotlessjdotlessj{}',
-            'ɠ': '\\texthtg{}',
-            'ɡ': '\\textscg{}',
-            'ː': '\\textlengthmark{}',
-            'ˈ': '\\textprimstress{}',
-            'ˌ': '\\textsecstress{}',
-            'ʲ': '\\textpal{}',
-            'ʷ': '\\textlab{}',
-            'ʰ': '\\textsuperscript{h}',
-            'ⁿ': '\\textsuperscript{n}',
-            'ʼ': '\\textglotstop{}',
-        }
-        
-        result = text
-        for ipa_char, tipa_command in ipa_to_tipa.items():
-            result = result.replace(ipa_char, tipa_command)
-        
-        return result
+        # Single C-level pass over the text (all IPA keys are single codepoints)
+        return text.translate(_IPA_TO_TIPA)
     
-    def _convert_tipa_back_to_ipa(self, text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _convert_tipa_back_to_ipa(text: str) -> str:
         """Convert tipa commands back to original IPA characters"""
-        if not text:
+        if not text or _TIPA_PREFIX not in text:
             return text
             
-        result = text
-        result = result.replace('\\textbari{}', 'ɨ')
-        result = result.replace('\\textturnm{}', 'ɯ')
-        result = result.replace('\\textepsilon{}', 'ɛ')
-        result = result.replace('\\textopeno{}', 'ɔ')
-        result = result.replace('\\textae{}', 'æ')
-        result = result.replace('\\textscripta{}', 'ɑ')
-        result = result.replace('\\textturnscripta{}', 'ɒ')
-        result = result.replace('\\textschwa{}', 'ə')
-        result = result.replace('\\textsci{}', 'ɪ')
-        result = result.replace('\\textupsilon{}', 'ʊ')
-        result = result.replace('\\textesh{}', 'ʃ')
-        result = result.replace('\\textyogh{}', 'ʒ')
-        result = result.replace('\\texttheta{}', 'θ')
-        result = result.replace('\\texteth{}', 'ð')
-        result = result.replace('\\texteng{}', 'ŋ')
-        result = result.replace('\\textltailn{}', 'ɲ')
-        result = result.replace('\\textrtailn{}', 'ɳ')
-        result = result.replace('\\textltailm{}', 'ɱ')
-        result = result.replace('\\textfishhookr{}', 'ɾ')
-        result = result.replace('\\textrtailr{}', 'ɽ')
-        result = result.replace('\\textturnr{}', 'ɻ')
-        result = result.replace('\\textrtaill{}', 'ɭ')
-        result = result.replace('\\textturny{}', 'ʎ')
-        result = result.replace('\\textrtailt{}', 'ʈ')
-        result = result.replace('\\textrtaild{}', 'ɖ')
-        result = result.replace('\\textrtails{}', 'ʂ')
-        result = result.replace('\\textrtailz{}', 'ʐ')
-        result = result.replace('\\textctc{}', 'ɕ')
-        result = result.replace('\\textctj{}', 'ʑ')
-        result = result.replace('\\textccedilla{}', 'ç')
-        result = result.replace('\\textgamma{}', 'ɣ')
-        result = result.replace('\\textchi{}', 'χ')
-        result = result.replace('\\textinvscr{}', 'ʁ')
-        result = result.replace('\\textcrh{}', 'ħ')
-        result = result.replace('\\textrevglotstop{}', 'ʕ')
-        result = result.replace('\\textglotstop{}', 'ʔ')
-        result = result.replace('\\textphi{}', 'ɸ')
-        result = result.replace('\\textbeta{}', 'β')
-        result = result.replace('\\textscriptv{}', 'ʋ')
-        result = result.replace('\\textturnmrleg{}', 'ɰ')
-        result = result.replace('\\textlhti{}', 'ɺ')
-        result = result.replace('\\textscg{}', 'ɢ')
-        result = result.replace('\\texthtg{}', 'ʛ')
-        result = result.replace('\\texthtbardotlessjdotlessj{}', 'ʄ')
-        result = result.replace('\\textbardotlessj{}', 'ɟ')
-        result = result.replace('\\textlengthmark{}', 'ː')
-        result = result.replace('\\textprimstress{}', 'ˈ')
-        result = result.replace('\\textsecstress{}', 'ˌ')
-        result = result.replace('\\textpal{}', 'ʲ')
-        result = result.replace('\\textlab{}', 'ʷ')
-        result = result.replace('\\textsuperscript{h}', 'ʰ')
-        result = result.replace('\\textsuperscript{n}', 'ⁿ')
-        
-        return result
+        # Single pass over the text, touching only matched tipa commands
+        return _TIPA_RE.sub(_tipa_match_to_ipa, text)
     
     def _align_four_layers_for_doc(self, text0_line: str, morph_line: str, gloss_line: str) -> tuple:
         """Align word start positions for 4 layers (text0, morph, gloss) in doc format"""
@@ -796,148 +1303,94 @@ class EAFConverter:
         morph_words = morph_line.split() if morph_line else []
         gloss_words = gloss_line.split() if gloss_line else []
         
-        # More accurate character width calculation
-        def char_width(s):
-            import unicodedata
-            width = 0
-            for char in s:
-                if unicodedata.east_asian_width(char) in ('F', 'W'):
-                    width += 2
-                elif unicodedata.east_asian_width(char) in ('H', 'Na', 'N'):
-                    width += 1
-                else:
-                    width += 1
-            return width
-        
-        # Get maximum word count
-        max_len = max(len(text0_words), len(morph_words), len(gloss_words))
-        
-        aligned_text0_parts = []
-        aligned_morph_parts = []
-        aligned_gloss_parts = []
-        
-        for i in range(max_len):
-            text0_word = text0_words[i] if i < len(text0_words) else ""
-            morph_word = morph_words[i] if i < len(morph_words) else ""
-            gloss_word = gloss_words[i] if i < len(gloss_words) else ""
-            
-            # Calculate width for each layer
-            text0_width = char_width(text0_word)
-            morph_width = char_width(morph_word)
-            gloss_width = char_width(gloss_word)
-            
-            # Calculate maximum width for 3 layers (minimum 2 character spacing)
-            max_width = max(text0_width, morph_width, gloss_width) + 2
-            
-            # Calculate padding for each layer
-            text0_padding = max_width - text0_width
-            morph_padding = max_width - morph_width
-            gloss_padding = max_width - gloss_width
-            
-            if i < max_len - 1:  # Not the last word
-                aligned_text0_parts.append(text0_word + ' ' * text0_padding if text0_word else ' ' * max_width)
-                aligned_morph_parts.append(morph_word + ' ' * morph_padding if morph_word else ' ' * max_width)
-                aligned_gloss_parts.append(gloss_word + ' ' * gloss_padding if gloss_word else ' ' * max_width)
-            else:  # Last word
-                aligned_text0_parts.append(text0_word)
-                aligned_morph_parts.append(morph_word)
-                aligned_gloss_parts.append(gloss_word)
-        
-        return ''.join(aligned_text0_parts), ''.join(aligned_morph_parts), ''.join(aligned_gloss_parts)
+        aligned_text0, aligned_morph, aligned_gloss = self._align_word_layers([text0_words, morph_words, gloss_words])
+        return aligned_text0, aligned_morph, aligned_gloss
+    
+    def _align_word_layers(self, layers: List[List[str]]) -> List[str]:
+        """Align word start positions across any number of word layers (shared by the doc aligners)"""
+        # 1st pass: width of every word
+        layer_widths = [_word_widths(words) for words in layers]
+        
+        # Get maximum word count and pad shorter layers with empty (zero-width) words
+        max_len = max(map(len, layers), default=0)
+        layers = [words + [""] * (max_len - len(words)) for words in layers]
+        layer_widths = [widths + [0] * (max_len - len(widths)) for widths in layer_widths]
+        
+        # Column widths (minimum 2 character spacing)
+        column_widths = [max(widths) + 2 for widths in zip(*layer_widths)]
+        
+        # 2nd pass: pad every column except the last (an empty word has zero width, so padding == column width)
+        aligned = []
+        for words, widths in zip(layers, layer_widths):
+            # str.ljust pads by character count, so the target length is len(word) plus the padding in columns
+            parts = [words[i].ljust(len(words[i]) + column_widths[i] - widths[i]) for i in range(max_len - 1)]
+            if max_len:  # Last word
+                parts.append(words[-1])
+            aligned.append(''.join(parts))
+        
+        return aligned
     
     def to_gb4e_format(self, sentences: List[Dict]) -> str:
         """Convert to gb4e format (4-tier gloss: text0, morph, gloss, translation) - using \\glll + Leipzig.sty support"""
-        output = []
+        buf = io.StringIO()
         
         # Add LaTeX header
-        output.append("% UTF-8 encoding settings")
-        output.append("% \\usepackage[utf8]{inputenc}")
-        output.append("% \\usepackage{CJKutf8}")
-        output.append("% \\usepackage{gb4e}")
-        output.append("% \\usepackage{tipa}")
-        output.append("% \\usepackage{leipzig}  % Leipzig.sty package")
-        output.append("")
-        output.append("% With Leipzig.sty, uppercase grammatical symbols are automatically converted to lowercase smallcaps")
-        output.append("% IPA characters are automatically converted to tipa commands")
-        output.append("")
+        buf.write(_GB4E_HEADER)
         
         for i, sentence in enumerate(sentences, 1):
             if not sentence.get('text0'):
                 continue
                 
-            output.append("\\begin{exe}")
-            output.append("\\ex")
-            
             # 🔥 Important: Use \\glll for 4-tier gloss (3 l's)
             text0_tipa = self._convert_ipa_to_tipa(sentence['text0'])
-            output.append(f"\\glll {text0_tipa}\\\\")
+            # morph/gloss tiers get the Leipzig.sty conversion (an empty tier stays an empty line)
+            leipzig_morph = self._convert_leipzig_glosses(sentence.get('morph') or '')
+            leipzig_gloss = self._convert_leipzig_glosses(sentence.get('gloss') or '')
+            translation = sentence.get('translation')
+            glt = f"\\glt  {translation}\n" if translation else "\\glt\n"
             
-            # 2nd tier: morph (adjusted based on text1 boundaries)
-            if sentence.get('morph'):
-                # Apply Leipzig.sty conversion
-                leipzig_morph = self._convert_leipzig_glosses(sentence['morph'])
-                # Fix double backslashes to single
-                leipzig_morph = leipzig_morph.replace('\\\\', '\\')
-                output.append(f"      {leipzig_morph}\\\\")
-            else:
-                output.append("      \\\\")
-            
-            # 3rd tier: gloss (adjusted based on text1 boundaries + Leipzig.sty conversion)
-            if sentence.get('gloss'):
-                # Apply Leipzig.sty conversion
-                leipzig_gloss = self._convert_leipzig_glosses(sentence['gloss'])
-                # Fix double backslashes to single
-                leipzig_gloss = leipzig_gloss.replace('\\\\', '\\')
-                output.append(f"      {leipzig_gloss}\\\\")
-            else:
-                output.append("      \\\\")
-            
-            # 4th tier: translation
-            if sentence.get('translation'):
-                output.append(f"\\glt  {sentence['translation']}")
-            else:
-                output.append("\\glt")
-            
-            output.append("\\end{exe}")
-            output.append("")
+            # The whole example is one f-string (compiled once into a single string build, no per-line writes)
+            buf.write(f"{_GB4E_EXAMPLE_BEGIN}\\glll {text0_tipa}\\\\\n"
+                      f"      {leipzig_morph}\\\\\n"
+                      f"      {leipzig_gloss}\\\\\n"
+                      f"{glt}{_GB4E_EXAMPLE_END}")
         
-        return "\n".join(output)
+        return buf.getvalue()[:-1]  # No trailing newline (same as joining lines with "\n")
     
     def to_doc_format(self, sentences: List[Dict], debug: bool = False) -> str:
         """Doc format (4-tier display: text0, morph, gloss, translation) + small caps conversion"""
-        output = []
+        buf = io.StringIO()
         
         for i, sentence in enumerate(sentences, 1):
             if not sentence.get('text0'):
                 continue
                 
             # Example number
-            output.append(f"({i})")
+            buf.write(f"({i})\n")
             
-            # 1st tier: text0 (convert IPA to tipa then back to original)
-            text0_tipa = self._convert_ipa_to_tipa(sentence['text0'])
-            text0_original = self._convert_tipa_back_to_ipa(text0_tipa)
+            # 1st tier: text0 (same result as converting IPA to tipa and back, in one translate pass
+            # plus the tipa back-conversion for any commands already present in the text)
+            text0_original = self._convert_tipa_back_to_ipa(sentence['text0'].translate(_IPA_NORMALIZE))
             
             # 2nd tier: morph (adjusted based on text1 + Leipzig.sty conversion then back to small caps)
             morph_content = sentence.get('morph', '')
             if morph_content:
                 leipzig_morph = self._convert_leipzig_glosses(morph_content)
-                leipzig_morph = leipzig_morph.replace('\\\\', '\\')  # Fix double backslashes
                 morph_content = self._convert_leipzig_back_to_plain(leipzig_morph)
             
             # 3rd tier: gloss (adjusted based on text1 + Leipzig.sty conversion then back to small caps)
             gloss_content = sentence.get('gloss', '')
             if gloss_content:
                 leipzig_gloss = self._convert_leipzig_glosses(gloss_content)
-                leipzig_gloss = leipzig_gloss.replace('\\\\', '\\')  # Fix double backslashes
                 gloss_content = self._convert_leipzig_back_to_plain(leipzig_gloss)
             
             if debug:
-                print(f"\n--- Example {i} debug info ---")
-                print(f"text0: '{sentence.get('text0', '')}'")
-                print(f"text1: '{sentence.get('text1', '')}'")
-                print(f"morph: '{morph_content}'")
-                print(f"gloss: '{gloss_content}'")
+                # One print per example; with debug off nothing is formatted at all
+                print(f"\n--- Example {i} debug info ---\n"
+                      f"text0: '{sentence.get('text0', '')}'\n"
+                      f"text1: '{sentence.get('text1', '')}'\n"
+                      f"morph: '{morph_content}'\n"
+                      f"gloss: '{gloss_content}'")
             
             # Align word start positions for 4 layers
             if morph_content and gloss_content:
@@ -946,30 +1399,24 @@ class EAFConverter:
                     text0_original, morph_content, gloss_content
                 )
                 
-                output.append(aligned_text0)
-                output.append(aligned_morph)
-                output.append(aligned_gloss)
+                buf.write(f"{aligned_text0}\n{aligned_morph}\n{aligned_gloss}\n")
             elif morph_content:
                 # text0 and morph only
                 aligned_text0, aligned_morph = self._align_words_for_doc(text0_original, morph_content)
-                output.append(aligned_text0)
-                output.append(aligned_morph)
-                output.append("")
+                buf.write(f"{aligned_text0}\n{aligned_morph}\n\n")
             else:
                 # text0 only
-                output.append(text0_original)
-                output.append("")
-                output.append("")
+                buf.write(f"{text0_original}\n\n\n")
             
             # 4th tier: translation
             if sentence.get('translation'):
-                output.append(sentence['translation'])
+                buf.write(f"{sentence['translation']}\n")
             else:
-                output.append("")
+                buf.write("\n")
             
-            output.append("")
+            buf.write("\n")
         
-        return "\n".join(output)
+        return buf.getvalue()[:-1]  # No trailing newline (same as joining lines with "\n")
     
     def _align_words_for_doc(self, text_line: str, gloss_line: str) -> tuple:
         """Align word start positions for doc format (2-layer version)"""
@@ -979,65 +1426,33 @@ class EAFConverter:
         text_words = text_line.split()
         gloss_words = gloss_line.split()
         
-        # More accurate character width calculation
-        def char_width(s):
-            import unicodedata
-            width = 0
-            for char in s:
-                # Use Unicode character categories for more accurate determination
-                if unicodedata.east_asian_width(char) in ('F', 'W'):
-                    # Full width, Wide characters
-                    width += 2
-                elif unicodedata.east_asian_width(char) in ('H', 'Na', 'N'):
-                    # Half width, Narrow, Neutral characters
-                    width += 1
-                else:
-                    # Others (A=Ambiguous) are environment-dependent, treat as 1
-                    width += 1
-            return width
-        
         # If word counts differ, use the shorter one
         min_len = min(len(text_words), len(gloss_words))
         if len(text_words) != len(gloss_words):
             print(f"Warning: Word count mismatch (text: {len(text_words)}, gloss: {len(gloss_words)})")
         
-        aligned_text_parts = []
-        aligned_gloss_parts = []
-        
-        for i in range(min_len):
-            text_word = text_words[i]
-            gloss_word = gloss_words[i]
-            
-            text_width = char_width(text_word)
-            gloss_width = char_width(gloss_word)
-            
-            # Calculate maximum width for both words (minimum 2 character spacing)
-            max_width = max(text_width, gloss_width) + 2
-            
-            # Add padding
-            text_padding = max_width - text_width
-            gloss_padding = max_width - gloss_width
-            
-            if i < min_len - 1:  # Not the last word
-                aligned_text_parts.append(text_word + ' ' * text_padding)
-                aligned_gloss_parts.append(gloss_word + ' ' * gloss_padding)
-            else:  # Last word
-                aligned_text_parts.append(text_word)
-                aligned_gloss_parts.append(gloss_word)
+        aligned_text, aligned_gloss = self._align_word_layers([text_words[:min_len], gloss_words[:min_len]])
         
         # Handle remaining words
         if len(text_words) > min_len:
-            remaining_text = ' '.join(text_words[min_len:])
-            aligned_text_parts.append(' ' + remaining_text)
+            aligned_text += ' ' + ' '.join(text_words[min_len:])
         
         if len(gloss_words) > min_len:
-            remaining_gloss = ' '.join(gloss_words[min_len:])
-            aligned_gloss_parts.append(' ' + remaining_gloss)
+            aligned_gloss += ' ' + ' '.join(gloss_words[min_len:])
         
-        return ''.join(aligned_text_parts), ''.join(aligned_gloss_parts)
+        return aligned_text, aligned_gloss
+    
+    def _sentence_audio_filename(self, i: int, sentence: Dict) -> str:
+        """Numbered, filesystem-safe WAV filename for a sentence"""
+        safe_text = sentence.get('text0', '')[:30]
+        if safe_text:
+            safe_text = _UNSAFE_FILENAME_RE.sub('', safe_text)  # Safe filename
+            safe_text = _WHITESPACE_RE.sub('_', safe_text.strip())
+        return f"{i:03d}_{safe_text}.wav"
     
     def split_audio_to_desktop(self, sentences: List[Dict], folder_name: str = None, 
-                              padding_ms: int = 100, create_zip: bool = False, output_directory: str = None):
+                              padding_ms: int = 100, create_zip: bool = False, output_directory: str = None,
+                              zip_compression: int = zipfile.ZIP_STORED, use_processes: bool = False):
         """Split sentence audio and save to desktop (including text files)"""
         if not self.audio_available:
             print("Audio data not available. Audio splitting will be skipped.")
@@ -1051,20 +1466,18 @@ class EAFConverter:
         
         # Determine output folder name
         if not folder_name:
-            base_name = Path(self.eaf_file_path).stem
+            base_name = os.path.splitext(os.path.basename(self.eaf_file_path))[0]
             folder_name = f"{base_name}_sentences"
         
         # Create output directory on desktop
         output_path = Path(output_directory) / folder_name
-        if output_path.exists():
-            # Backup existing folder
-            timestamp = int(time.time())
-            backup_path = Path(output_directory) / f"{folder_name}_backup_{timestamp}"
-            try:
-                shutil.move(str(output_path), str(backup_path))
-                print(f"📦 Existing folder backed up: {backup_path}")
-            except:
-                pass
+        # Backup existing folder: a sibling rename is one syscall and needs no exists() check first
+        backup_path = Path(output_directory) / f"{folder_name}_backup_{int(time.time())}"
+        try:
+            os.rename(output_path, backup_path)
+            print(f"📦 Existing folder backed up: {backup_path}")
+        except OSError:
+            pass  # No existing folder (or it could not be moved)
         
         if not ensure_directory_writable(output_path):
             print(f"❌ Failed to create output directory: {output_path}")
@@ -1076,26 +1489,25 @@ class EAFConverter:
         
         saved_files = []
         
-        # Extract audio for each sentence
+        # Sentences with time information (numbered by position in the full list)
+        jobs = []
         for i, sentence in enumerate(sentences, 1):
             if not sentence.get('start_time') or not sentence.get('end_time'):
                 print(f"⚠️ Sentence {i} has no time information. Skipping.")
                 continue
-                
-            # Generate filename (numbered)
-            safe_text = re.sub(r'[^\w\s-]', '', sentence.get('text0', '')[:30])  # Safe filename
-            safe_text = re.sub(r'\s+', '_', safe_text.strip())
-            filename = f"{i:03d}_{safe_text}.wav"
-            output_file = output_path / filename
-            
-            # Save audio
-            success = self.save_audio_segment(
-                sentence['start_time'], 
-                sentence['end_time'], 
-                str(output_file),
-                padding_ms
-            )
-            
+            filename = self._sentence_audio_filename(i, sentence)
+            jobs.append((i, sentence, filename, output_path / filename))
+        segments = [(sentence['start_time'], sentence['end_time'], str(output_file))
+                    for i, sentence, filename, output_file in jobs]
+        
+        # Extract audio for each sentence in parallel (segments are independent files)
+        if use_processes and AUDIO_LIBRARY in _ARRAY_AUDIO_LIBRARIES and segments and len(self.audio_data):
+            results = self._save_segments_in_processes(segments, padding_ms)
+        else:
+            results = self.save_audio_segments_batch(segments, padding_ms)
+        
+        # Report in sentence order
+        for (i, sentence, filename, output_file), success in zip(jobs, results):
             if success:
                 saved_files.append({
                     'number': i,
@@ -1122,25 +1534,30 @@ class EAFConverter:
         save_file_safely(doc_file, doc_content)
         
         # Create summary text file
-        summary_content = self._create_summary_content(saved_files, output_path, gb4e_file, doc_file)
+        # (written straight to the file: it grows with the number of sentences)
         summary_file = output_path / 'audio_summary.txt'
-        save_file_safely(summary_file, summary_content)
+        stream_file_safely(summary_file, lambda f: self._write_summary_content(f, saved_files, output_path, gb4e_file, doc_file))
         
         # Create README file
-        readme_content = self._create_readme_content(saved_files, gb4e_file, doc_file, summary_file)
         readme_file = output_path / 'README.txt'
-        save_file_safely(readme_file, readme_content)
+        stream_file_safely(readme_file, lambda f: self._write_readme_content(f, saved_files, gb4e_file, doc_file, summary_file))
         
         # Create ZIP file if requested
         zip_file_path = None
         if create_zip and saved_files:
             zip_file_path = Path(output_directory) / f"{folder_name}.zip"
             try:
-                with zipfile.ZipFile(zip_file_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file_path in output_path.rglob('*'):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(output_path)
-                            zipf.write(file_path, arcname)
+                # WAV is raw PCM and compresses poorly, so audio is stored by default;
+                # the small .tex/.txt files are always deflated
+                with zipfile.ZipFile(zip_file_path, 'w', zip_compression, strict_timestamps=False) as zipf:
+                    # os.walk (scandir) tells files from directories without a stat per entry
+                    for dirpath, dirnames, filenames in os.walk(output_path):
+                        dirnames.sort()
+                        for filename in sorted(filenames):
+                            file_path = os.path.join(dirpath, filename)
+                            arcname = os.path.relpath(file_path, output_path)
+                            compress_type = zipfile.ZIP_DEFLATED if filename.endswith(('.tex', '.txt')) else zip_compression
+                            zipf.write(file_path, arcname, compress_type=compress_type)
                 
                 print(f"📦 ZIP file created: {zip_file_path}")
             except Exception as e:
@@ -1169,66 +1586,64 @@ class EAFConverter:
             'total_files': len(saved_files)
         }
     
-    def _create_summary_content(self, saved_files, output_path, gb4e_file, doc_file):
-        """Create summary file content"""
-        content = []
-        content.append("Audio File Splitting Results (Leipzig.sty Compatible Version)\n")
-        content.append("="*50 + "\n\n")
-        content.append(f"Source file: {self.eaf_file_path}\n")
-        content.append(f"Audio file: {self.wav_file_path}\n")
-        content.append(f"Total sentences: {len(saved_files)}\n")
-        content.append(f"Save location: {output_path}\n\n")
-        content.append("📁 Generated files:\n")
-        content.append(f"  - GB4E format (Leipzig.sty compatible): {gb4e_file.name}\n")
-        content.append(f"  - DOC format (small caps compatible): {doc_file.name}\n")
-        content.append(f"  - Audio files: {len(saved_files)} files\n\n")
-        content.append("🔧 Leipzig.sty features:\n")
-        content.append("  - Auto-convert uppercase grammatical symbols (FOC → \\textsc{foc})\n")
-        content.append("  - DOC format converts to Unicode small caps (FOC → ꜰᴏᴄ)\n")
-        content.append("  - Auto-convert IPA characters to tipa commands\n\n")
+    def _write_summary_content(self, f, saved_files, output_path, gb4e_file, doc_file):
+        """Write summary file content to the text file f"""
+        write = f.write
+        file_count = len(saved_files)
+        write("Audio File Splitting Results (Leipzig.sty Compatible Version)\n")
+        write("="*50 + "\n\n")
+        write(f"Source file: {self.eaf_file_path}\n")
+        write(f"Audio file: {self.wav_file_path}\n")
+        write(f"Total sentences: {file_count}\n")
+        write(f"Save location: {output_path}\n\n")
+        write("📁 Generated files:\n")
+        write(f"  - GB4E format (Leipzig.sty compatible): {gb4e_file.name}\n")
+        write(f"  - DOC format (small caps compatible): {doc_file.name}\n")
+        write(f"  - Audio files: {file_count} files\n\n")
+        write("🔧 Leipzig.sty features:\n")
+        write("  - Auto-convert uppercase grammatical symbols (FOC → \\textsc{foc})\n")
+        write("  - DOC format converts to Unicode small caps (FOC → ꜰᴏᴄ)\n")
+        write("  - Auto-convert IPA characters to tipa commands\n\n")
         
         for file_info in saved_files:
-            content.append(f"{file_info['number']:03d}. {file_info['text']}\n")
-            content.append(f"     Time: {file_info['start_time']}ms - {file_info['end_time']}ms "
-                          f"(Length: {file_info['duration']}ms)\n")
-            content.append(f"     File: {Path(file_info['file_path']).name}\n\n")
-        
-        return "".join(content)
-    
-    def _create_readme_content(self, saved_files, gb4e_file, doc_file, summary_file):
-        """Create README file content"""
-        content = []
-        content.append("EAF File Audio Splitting Results (Leipzig.sty Compatible Version)\n")
-        content.append("="*40 + "\n\n")
-        content.append("📁 This folder contains the following files:\n\n")
-        content.append("🎵 Audio files:\n")
-        content.append(f"  - {len(saved_files)} split audio files (001_*.wav ~ {len(saved_files):03d}_*.wav)\n")
-        content.append("  - Each file is split by sentence\n\n")
-        content.append("📝 Text files:\n")
-        content.append(f"  - {gb4e_file.name}: LaTeX gb4e format examples (4-tier gloss: \\glll usage, Leipzig.sty compatible)\n")
-        content.append(f"  - {doc_file.name}: Plain text format examples (4-tier display, Unicode small caps compatible)\n")
-        content.append(f"  - {summary_file.name}: Detailed splitting information\n")
-        content.append(f"  - README.txt: This description file\n\n")
-        content.append("💡 Usage:\n")
-        content.append("  - Audio files: Play individual sentence audio\n")
-        content.append("  - GB4E file: Compile with LaTeX to create linguistic paper examples\n")
-        content.append("    Don't forget to add \\usepackage{leipzig}\n")
-        content.append("  - DOC file: Can be pasted directly into documents (Unicode small caps display)\n\n")
-        content.append("🔧 Technical specifications:\n")
-        content.append("  - GB4E format: 4-tier gloss (text0, morph, gloss, translation)\n")
-        content.append("  - Morpheme boundaries: text1 layer boundary symbols (=, -) reflected in morph/gloss layers\n")
-        content.append("  - IPA characters: Auto-converted to tipa package commands\n")
-        content.append("  - Leipzig.sty: Auto-convert uppercase grammatical symbols to \\textsc{lowercase}\n")
-        content.append("  - Small caps: Unicode small caps used in DOC format\n")
-        content.append("  - Sentence splitting: Auto-split by sentence-ending punctuation (., ?, !)\n\n")
-        content.append("📚 Leipzig.sty conversion examples:\n")
-        content.append("  - LaTeX: FOC → \\textsc{foc}, PST → \\textsc{pst}\n")
-        content.append("  - DOC: FOC → ꜰᴏᴄ, PST → ᴘsᴛ\n")
-        content.append("  - Regular uppercase: INF → ɪɴꜰ, SEQ → sᴇQ\n\n")
-        content.append(f"📅 Created: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        content.append(f"🔧 Source file: {Path(self.eaf_file_path).name}\n")
-        
-        return "".join(content)
+            write(f"{file_info['number']:03d}. {file_info['text']}\n")
+            write(f"     Time: {file_info['start_time']}ms - {file_info['end_time']}ms "
+                  f"(Length: {file_info['duration']}ms)\n")
+            write(f"     File: {Path(file_info['file_path']).name}\n\n")
+    
+    def _write_readme_content(self, f, saved_files, gb4e_file, doc_file, summary_file):
+        """Write README file content to the text file f"""
+        write = f.write
+        file_count = len(saved_files)
+        write("EAF File Audio Splitting Results (Leipzig.sty Compatible Version)\n")
+        write("="*40 + "\n\n")
+        write("📁 This folder contains the following files:\n\n")
+        write("🎵 Audio files:\n")
+        write(f"  - {file_count} split audio files (001_*.wav ~ {file_count:03d}_*.wav)\n")
+        write("  - Each file is split by sentence\n\n")
+        write("📝 Text files:\n")
+        write(f"  - {gb4e_file.name}: LaTeX gb4e format examples (4-tier gloss: \\glll usage, Leipzig.sty compatible)\n")
+        write(f"  - {doc_file.name}: Plain text format examples (4-tier display, Unicode small caps compatible)\n")
+        write(f"  - {summary_file.name}: Detailed splitting information\n")
+        write(f"  - README.txt: This description file\n\n")
+        write("💡 Usage:\n")
+        write("  - Audio files: Play individual sentence audio\n")
+        write("  - GB4E file: Compile with LaTeX to create linguistic paper examples\n")
+        write("    Don't forget to add \\usepackage{leipzig}\n")
+        write("  - DOC file: Can be pasted directly into documents (Unicode small caps display)\n\n")
+        write("🔧 Technical specifications:\n")
+        write("  - GB4E format: 4-tier gloss (text0, morph, gloss, translation)\n")
+        write("  - Morpheme boundaries: text1 layer boundary symbols (=, -) reflected in morph/gloss layers\n")
+        write("  - IPA characters: Auto-converted to tipa package commands\n")
+        write("  - Leipzig.sty: Auto-convert uppercase grammatical symbols to \\textsc{lowercase}\n")
+        write("  - Small caps: Unicode small caps used in DOC format\n")
+        write("  - Sentence splitting: Auto-split by sentence-ending punctuation (., ?, !)\n\n")
+        write("📚 Leipzig.sty conversion examples:\n")
+        write("  - LaTeX: FOC → \\textsc{foc}, PST → \\textsc{pst}\n")
+        write("  - DOC: FOC → ꜰᴏᴄ, PST → ᴘsᴛ\n")
+        write("  - Regular uppercase: INF → ɪɴꜰ, SEQ → sᴇQ\n\n")
+        write(f"📅 Created: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(f"🔧 Source file: {Path(self.eaf_file_path).name}\n")
 
 
 # Diagnostic functions
@@ -1249,9 +1664,9 @@ def diagnose_eaf_file(eaf_filename, wav_filename=None):
         
         # Display first 3 annotations
         for i, ann in enumerate(annotations[:3]):
-            ann_type = ann.get('type', 'UNKNOWN')
-            print(f"  [{i+1}] ({ann_type}) Time: {ann['start_time']}-{ann['end_time']}")
-            content = ann['value'][:100] + '...' if len(ann['value']) > 100 else ann['value']
+            ann_type = ann.type or 'UNKNOWN'
+            print(f"  [{i+1}] ({ann_type}) Time: {ann.start_time}-{ann.end_time}")
+            content = ann.value[:100] + '...' if len(ann.value) > 100 else ann.value
             print(f"      Content: '{content}'")
         
         if len(annotations) > 3:
@@ -1278,7 +1693,6 @@ def test_leipzig_conversion():
     
     for gloss in test_glosses:
         latex_converted = converter._convert_leipzig_glosses(gloss)
-        latex_converted = latex_converted.replace('\\\\', '\\')  # Fix double backslashes
         doc_converted = converter._convert_leipzig_back_to_plain(latex_converted)
         
         print(f"'{gloss}'")
@@ -1304,10 +1718,19 @@ def test_leipzig_conversion():
     print("- Example: INF.SEQ → ɪɴꜰ.sᴇQ")
 
 
+# Text outputs produced for each output_format (unknown formats produce none)
+_OUTPUT_FORMATS = {
+    'gb4e': frozenset({'gb4e'}),
+    'doc': frozenset({'doc'}),
+    'both': frozenset({'gb4e', 'doc'}),
+}
+
+
 # Main conversion function
 def convert_eaf_file(eaf_filename, wav_filename=None, tier_names=None, output_format='both', 
                     debug=False, save_audio=True, audio_folder_name=None, 
-                    audio_padding_ms=100, create_zip=False, output_directory=None):
+                    audio_padding_ms=100, create_zip=False, output_directory=None,
+                    zip_compression=zipfile.ZIP_STORED, preview=False, audio_use_processes=False):
     """
     Complete EAF file conversion function (all fixes integrated + Leipzig.sty support)
     
@@ -1322,6 +1745,9 @@ def convert_eaf_file(eaf_filename, wav_filename=None, tier_names=None, output_fo
         audio_padding_ms: Audio file padding before/after (milliseconds)
         create_zip: Create ZIP of audio files
         output_directory: Output directory (defaults to desktop if not specified)
+        zip_compression: ZIP compression method (zipfile.ZIP_STORED by default; e.g. zipfile.ZIP_DEFLATED)
+        preview: Print the first 500 characters of each generated format
+        audio_use_processes: Split audio with a process pool (shared memory) instead of threads
     
     Returns:
         Conversion result dictionary
@@ -1355,15 +1781,22 @@ def convert_eaf_file(eaf_filename, wav_filename=None, tier_names=None, output_fo
     if not converter.parse_eaf():
         return None
     
-    # Load audio file if available
-    if wav_filename:
-        print("🎵 Loading audio file...")
-        converter.load_audio()
-    
-    sentences = converter.extract_sentences(tier_names)
+    # Load audio file if available, in a background thread while the sentences are extracted
+    # (load_audio only sets the audio attributes, which extract_sentences never reads)
+    with ThreadPoolExecutor(max_workers=1) as audio_loader:
+        audio_future = None
+        if wav_filename:
+            print("🎵 Loading audio file...")
+            audio_future = audio_loader.submit(converter.load_audio)
+        
+        sentences = converter.extract_sentences(tier_names)
+        
+        if audio_future is not None:
+            audio_future.result()
     
     if not sentences:
         print("❌ No convertible sentences found.")
+        converter.close()
         return None
     
     result = {
@@ -1379,32 +1812,37 @@ def convert_eaf_file(eaf_filename, wav_filename=None, tier_names=None, output_fo
     # Display and save text conversion results
     print("\n" + "="*70)
     
-    base_name = Path(eaf_filename).stem
+    # Plain string paths: Path objects are only created where their API is needed (save_file_safely)
+    base_name = os.path.splitext(os.path.basename(eaf_filename))[0]
     
-    if output_format in ['gb4e', 'both']:
+    wanted_formats = _OUTPUT_FORMATS.get(output_format, frozenset())
+    
+    if 'gb4e' in wanted_formats:
         print("📝 GB4E format (4-tier gloss: \\glll usage, Leipzig.sty compatible):")
-        print("-" * 40)
         gb4e_content = converter.to_gb4e_format(sentences)
-        print(gb4e_content[:500] + "..." if len(gb4e_content) > 500 else gb4e_content)
+        if preview:
+            print("-" * 40)
+            print(gb4e_content[:500] + ("..." if len(gb4e_content) > 500 else ""))
         
         # Save to file
-        gb4e_filename = Path(output_directory) / f"{base_name}_gb4e_leipzig.tex"
+        gb4e_filename = os.path.join(output_directory, base_name + "_gb4e_leipzig.tex")
         if save_file_safely(gb4e_filename, gb4e_content):
-            result['gb4e_file'] = str(gb4e_filename)
+            result['gb4e_file'] = gb4e_filename
     
-    if output_format in ['both']:
+    if len(wanted_formats) == 2:
         print("\n" + "="*70)
     
-    if output_format in ['doc', 'both']:
+    if 'doc' in wanted_formats:
         print("📄 DOC format (4-tier display: Unicode small caps compatible):")
-        print("-" * 40)
         doc_content = converter.to_doc_format(sentences, debug=debug)
-        print(doc_content[:500] + "..." if len(doc_content) > 500 else doc_content)
+        if preview:
+            print("-" * 40)
+            print(doc_content[:500] + ("..." if len(doc_content) > 500 else ""))
         
         # Save to file
-        doc_filename = Path(output_directory) / f"{base_name}_doc.txt"
+        doc_filename = os.path.join(output_directory, base_name + "_doc.txt")
         if save_file_safely(doc_filename, doc_content):
-            result['doc_file'] = str(doc_filename)
+            result['doc_file'] = doc_filename
     
     # Execute audio splitting
     if save_audio and wav_filename and converter.audio_available:
@@ -1413,7 +1851,7 @@ def convert_eaf_file(eaf_filename, wav_filename=None, tier_names=None, output_fo
         
         audio_result = converter.split_audio_to_desktop(
             sentences, audio_folder_name or f"{base_name}_sentences", 
-            audio_padding_ms, create_zip, output_directory
+            audio_padding_ms, create_zip, output_directory, zip_compression, audio_use_processes
         )
         result['audio_result'] = audio_result
     elif save_audio and wav_filename:
@@ -1421,6 +1859,9 @@ def convert_eaf_file(eaf_filename, wav_filename=None, tier_names=None, output_fo
     elif save_audio:
         print("\n⚠️ Audio splitting: Skipped due to no WAV file specified")
     
+    # Audio is no longer needed: release it so the WAV file is not held open by the converter
+    converter.close()
+    
     print(f"\n🎉 Conversion complete!")
     print(f"📊 Extracted sentences: {len(sentences)}")
     if result['gb4e_file']:
@@ -1431,14 +1872,19 @@ def convert_eaf_file(eaf_filename, wav_filename=None, tier_names=None, output_fo
         print(f"🎵 Audio files: {result['audio_result']['total_files']} files")
         print(f"📁 Audio save location: {result['audio_result']['output_path']}")
     
-    # File verification
-    print(f"\n=== Output file verification ===")
+    # File verification (lines collected and written in one go)
+    lines = ["\n=== Output file verification ==="]
     for key, filepath in result.items():
-        if filepath and isinstance(filepath, str) and os.path.exists(filepath):
-            size = os.path.getsize(filepath)
-            print(f"✅ {key}: {filepath} ({size} bytes)")
-        elif filepath and key.endswith('_file'):
-            print(f"❌ {key}: {filepath} (file does not exist)")
+        if not (filepath and isinstance(filepath, str)):
+            continue
+        try:
+            st = os.stat(filepath)  # one lookup instead of exists() + getsize()
+        except OSError:
+            if key.endswith('_file'):
+                lines.append(f"❌ {key}: {filepath} (file does not exist)")
+            continue
+        lines.append(f"✅ {key}: {filepath} ({st.st_size} bytes)")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return result
 
@@ -1464,7 +1910,8 @@ def debug_convert(eaf_filename, wav_filename=None):
         wav_filename=wav_filename,
         output_format='both',
         debug=True,
-        save_audio=True if wav_filename else False
+        save_audio=True if wav_filename else False,
+        preview=True
     )
 
 
@@ -1498,71 +1945,76 @@ def test_gb4e_output():
 
 
 # Usage instructions
-print("=== Complete EAF File Conversion Script (Leipzig.sty Compatible) ===")
-print("🎯 All fixes integrated + Leipzig.sty functionality - Ready to use!")
-print()
-print("🔧 Integrated fixes + new features:")
-print("✅ GB4E format using \\glll (4-tier gloss)")
-print("✅ Leipzig.sty compatible: Auto-convert uppercase grammatical symbols to \\textsc{lowercase}")
-print("✅ Unicode small caps compatible: Display ꜰᴏᴄ, ᴘsᴛ etc. in DOC format")
-print("✅ Reflect text1 layer boundary symbols (=, -) in morph/gloss layers")
-print("✅ Desktop output issues resolved (OneDrive compatible)")
-print("✅ Safe file saving functionality")
-print("✅ IPA→tipa command auto-conversion")
-print("✅ Audio splitting functionality (sentence-by-sentence)")
-print("✅ 4-tier display DOC format")
-print()
-print("📝 Usage:")
-print()
-print("# 1. Basic conversion (recommended・Leipzig.sty compatible)")
-print("result = quick_convert('your_file.eaf', 'your_file.wav')")
-print()
-print("# 2. Text-only conversion")
-print("result = quick_convert('your_file.eaf')")
-print()
-print("# 3. Custom output destination")
-print("result = quick_convert('your_file.eaf', 'your_file.wav', '/path/to/output')")
-print()
-print("# 4. Detailed settings")
-print("result = convert_eaf_file(")
-print("    eaf_filename='your_file.eaf',")
-print("    wav_filename='your_file.wav',")
-print("    output_format='both',")
-print("    save_audio=True,")
-print("    create_zip=True,")
-print("    tier_names={")
-print("        'text0': 'your_text0_tier_name',")
-print("        'text1': 'your_text1_tier_name',")
-print("        'morph': 'your_morph_tier_name',")
-print("        'gloss': 'your_gloss_tier_name',")
-print("        'translation': 'your_translation_tier_name'")
-print("    }")
-print(")")
-print()
-print("# 5. Debug mode")
-print("result = debug_convert('your_file.eaf', 'your_file.wav')")
-print()
-print("# 6. File structure diagnosis")
-print("diagnose_eaf_file('your_file.eaf', 'your_file.wav')")
-print()
-print("# 7. GB4E format test (Leipzig.sty compatible)")
-print("test_gb4e_output()")
-print()
-print("# 8. Leipzig.sty conversion test")
-print("test_leipzig_conversion()")
-print()
-print("🎉 This script is the complete version (Leipzig.sty compatible). Ready to start using!")
-print("💡 If you encounter problems, please diagnose with diagnose_eaf_file().")
-print()
-print("📚 Leipzig.sty functionality:")
-print("- LaTeX: FOC → \\textsc{foc}, PST → \\textsc{pst}")
-print("- DOC: FOC → ꜰᴏᴄ, PST → ᴘsᴛ")
-print("- Regular uppercase: INF → ɪɴꜰ, SEQ → sᴇQ")
-
-if AUDIO_LIBRARY:
-    print(f"\n🎵 Audio processing: {AUDIO_LIBRARY} available")
-else:
-    print(f"\n⚠️ Audio processing: No library (text conversion only)")
-    print("To use audio splitting, install:")
-    print("  pip install librosa soundfile  # Recommended")
-    print("  pip install pydub              # Lightweight version")
+_USAGE_BANNER = """\
+=== Complete EAF File Conversion Script (Leipzig.sty Compatible) ===
+🎯 All fixes integrated + Leipzig.sty functionality - Ready to use!
+
+🔧 Integrated fixes + new features:
+✅ GB4E format using \\glll (4-tier gloss)
+✅ Leipzig.sty compatible: Auto-convert uppercase grammatical symbols to \\textsc{lowercase}
+✅ Unicode small caps compatible: Display ꜰᴏᴄ, ᴘsᴛ etc. in DOC format
+✅ Reflect text1 layer boundary symbols (=, -) in morph/gloss layers
+✅ Desktop output issues resolved (OneDrive compatible)
+✅ Safe file saving functionality
+✅ IPA→tipa command auto-conversion
+✅ Audio splitting functionality (sentence-by-sentence)
+✅ 4-tier display DOC format
+
+📝 Usage:
+
+# 1. Basic conversion (recommended・Leipzig.sty compatible)
+result = quick_convert('your_file.eaf', 'your_file.wav')
+
+# 2. Text-only conversion
+result = quick_convert('your_file.eaf')
+
+# 3. Custom output destination
+result = quick_convert('your_file.eaf', 'your_file.wav', '/path/to/output')
+
+# 4. Detailed settings
+result = convert_eaf_file(
+    eaf_filename='your_file.eaf',
+    wav_filename='your_file.wav',
+    output_format='both',
+    save_audio=True,
+    create_zip=True,
+    tier_names={
+        'text0': 'your_text0_tier_name',
+        'text1': 'your_text1_tier_name',
+        'morph': 'your_morph_tier_name',
+        'gloss': 'your_gloss_tier_name',
+        'translation': 'your_translation_tier_name'
+    }
+)
+
+# 5. Debug mode
+result = debug_convert('your_file.eaf', 'your_file.wav')
+
+# 6. File structure diagnosis
+diagnose_eaf_file('your_file.eaf', 'your_file.wav')
+
+# 7. GB4E format test (Leipzig.sty compatible)
+test_gb4e_output()
+
+# 8. Leipzig.sty conversion test
+test_leipzig_conversion()
+
+🎉 This script is the complete version (Leipzig.sty compatible). Ready to start using!
+💡 If you encounter problems, please diagnose with diagnose_eaf_file().
+
+📚 Leipzig.sty functionality:
+- LaTeX: FOC → \\textsc{foc}, PST → \\textsc{pst}
+- DOC: FOC → ꜰᴏᴄ, PST → ᴘsᴛ
+- Regular uppercase: INF → ɪɴꜰ, SEQ → sᴇQ
+"""
+
+# Usage instructions (only when run directly; set EAFTOX_QUIET=1 to silence)
+if __name__ == '__main__' and os.environ.get('EAFTOX_QUIET') != '1':
+    if AUDIO_LIBRARY:
+        audio_status = f"\n🎵 Audio processing: {AUDIO_LIBRARY} available\n"
+    else:
+        audio_status = ("\n⚠️ Audio processing: No library (text conversion only)\n"
+                        "To use audio splitting, install:\n"
+                        "  pip install librosa soundfile  # Recommended\n"
+                        "  pip install pydub              # Lightweight version\n")
+    sys.stdout.write(_USAGE_BANNER + audio_status)
@@ -1,6 +1,12 @@
+import bisect
+import functools
+import operator
 import os
 import re
+import threading
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from pathlib import Path
 import time
 import shutil
@@ -9,6 +15,7 @@ import shutil
 AUDIO_LIBRARY = None
 try:
     import librosa
+    import numpy as np
     import soundfile as sf
     AUDIO_LIBRARY = 'librosa'
     print("使用オーディオライブラリ: librosa + soundfile")
@@ -26,7 +33,129 @@ except ImportError:
         except ImportError:
             print("オーディオライブラリが見つかりません。音声機能は無効です。")
 
+# 音声をNumPy配列で保持するライブラリ（区間は配列のスライスで切り出す）
+_ARRAY_AUDIO_LIBRARIES = ('librosa', 'wave')
+
+# 音声区間の並列書き出し数（ディスク書き込みが律速なのでこれ以上増やしても競合するだけ）
+_SEGMENT_WRITE_WORKERS = min(8, os.cpu_count() or 1)
+
+# 分割音声のファイル名用（使えない文字の削除・空白の置換）
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# lxml（任意）があればEAFの解析に使う（なければ標準ライブラリのElementTree）
+try:
+    from lxml import etree as lxml_etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# GB4E出力の固定ヘッダー（行ごとのappendではなく読み込み時に一度だけ作成）
+_GB4E_SPACING_FIX_HEADER = (
+    "% GB4E形式の例文（行間問題根本解決版）\n"
+    "% プリアンブルに以下を必ず追加:\n"
+    "% \\usepackage{tipa}\n"
+    "% \\usepackage{gb4e}\n"
+    "% % GB4E行間調整（重要）\n"
+    "% \\let\\eachwordone=\\it\n"
+    "% \\let\\eachwordtwo=\\rm\n"
+    "% \\def\\glossglue{\\hfil}\n"
+    "% \\setlength{\\glossglue}{0pt}\n"
+)
+_GB4E_MINIMAL_HEADER = "% GB4E形式の例文（最小限版）\n"
+_TXT_HEADER = "EAF例文集\n" + "=" * 50 + "\n"
+
+# GB4E/TXTファイル書き出し時のバッファサイズ
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+def _annotation_value(annotation):
+    """注釈要素のANNOTATION_VALUE（前後の空白を除去、なければ空文字）"""
+    value_elem = annotation.find('ANNOTATION_VALUE')
+    return value_elem.text.strip() if value_elem is not None and value_elem.text else ""
+
+# IPA→TIPA変換表（スペース保護版）: IPA側は全て1文字なので、str.translateで1回の走査で変換できる
+_IPA_TO_TIPA = str.maketrans({
+    'ɨ': '\\textbari{}',
+    'ɯ': '\\textturnm{}',
+    'ɪ': '\\textsci{}',
+    'ʊ': '\\textupsilon{}',
+    'ə': '\\textschwa{}',
+    'ɛ': '\\textepsilon{}',
+    'ɔ': '\\textopeno{}',
+    'æ': '\\textae{}',
+    'ɑ': '\\textscripta{}',
+    'ɸ': '\\textphi{}',
+    'β': '\\textbeta{}',
+    'θ': '\\texttheta{}',
+    'ð': '\\textdh{}',
+    'ʃ': '\\textesh{}',
+    'ʒ': '\\textyogh{}',
+    'ç': '\\textcçc{}',
+    'ɣ': '\\textgamma{}',
+    'χ': '\\textchi{}',
+    'ʁ': '\\textinvscr{}',
+    'ɱ': '\\textmrleg{}',
+    'ɳ': '\\textrtailn{}',
+    'ɲ': '\\textltailn{}',
+    'ŋ': '\\texteng{}',
+    'ɾ': '\\textfishhookr{}',
+    'ɹ': '\\textturnr{}',
+    'ʔ': '\\textglotstop{}',
+    'ː': ':',
+})
+
+# 注釈の辞書から各列を取り出す
+_GET_START_TIME = operator.itemgetter('start_time')
+_GET_END_TIME = operator.itemgetter('end_time')
+_GET_VALUE = operator.itemgetter('value')
+
+class _IntervalIndex:
+    """ティアの注釈を開始時刻順に並べた区間の索引（文ごとの全件走査の代わりに二分探索する）
+    
+    注釈の辞書のリストを、開始・終了時刻と値の並列リスト（列ごとの配列）に分けて持つ
+    """
+    __slots__ = ('order', 'starts', 'ends', 'values', 'min_end_from', 'max_end_to')
+    
+    def __init__(self, annotations):
+        # 列ごとに取り出す（辞書の参照はmap内のCのループで1回ずつ）
+        starts = list(map(_GET_START_TIME, annotations))
+        ends = list(map(_GET_END_TIME, annotations))
+        values = list(map(_GET_VALUE, annotations))
+        # 安定ソートなので、開始時刻が同じ注釈はティア内の順のまま
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        self.order = order
+        self.starts = list(map(starts.__getitem__, order))
+        self.ends = list(map(ends.__getitem__, order))
+        self.values = list(map(values.__getitem__, order))
+        # 終了時刻の後方最小値（この位置以降に範囲内で終わる注釈が残っているか）と前方最大値（この位置までに範囲を覆う注釈があり得るか）
+        self.min_end_from = list(accumulate(reversed(self.ends), min))[::-1]
+        self.max_end_to = list(accumulate(self.ends, max))
+    
+    def values_within(self, start, end):
+        """[start, end]に収まる注釈の値（開始時刻順）"""
+        starts, ends, min_end_from = self.starts, self.ends, self.min_end_from
+        values = []
+        i = bisect.bisect_left(starts, start)
+        while i < len(starts) and (starts[i] <= end or min_end_from[i] <= end):
+            if ends[i] <= end:
+                values.append(self.values[i])
+            i += 1
+        return values
+    
+    def first_value_covering(self, start, end):
+        """[start, end]を覆う注釈のうちティア内で最初のものの値（なければ空文字）"""
+        ends, order, max_end_to = self.ends, self.order, self.max_end_to
+        best = None
+        i = bisect.bisect_right(self.starts, start) - 1
+        while i >= 0 and max_end_to[i] >= end:
+            if ends[i] >= end and (best is None or order[i] < order[best]):
+                best = i
+            i -= 1
+        return self.values[best] if best is not None else ""
+
+@functools.lru_cache(maxsize=1)
 def get_desktop_path():
+    """デスクトップのパス（見つからなければホーム）。存在確認は初回だけ行いセッション中はキャッシュ"""
     home = Path.home()
     desktop_candidates = [home / "Desktop", home / "デスクトップ", home / "desktop"]
     for path in desktop_candidates:
@@ -43,67 +172,87 @@ class SimpleEAFConverter:
         self.audio_available = False
         self.audio_data = None
         self.sample_rate = None
+        self._sound_file = None  # librosa使用時: 区間ごとに読むための開いたままのSoundFile
+        self._sound_file_lock = threading.Lock()  # seekとreadの組を複数スレッドから同時に行わない
     
     def parse_eaf(self):
         try:
-            tree = ET.parse(self.eaf_file_path)
-            root = tree.getroot()
-            
-            # タイムスロット解析
-            for time_slot in root.findall('.//TIME_SLOT'):
-                slot_id = time_slot.get('TIME_SLOT_ID')
-                time_value = time_slot.get('TIME_VALUE')
-                if time_value:
-                    self.time_slots[slot_id] = int(time_value)
+            # 木全体を作らずに逐次解析し、閉じたティアは記録してからすぐに解放する
+            tiers = []  # (TIER_ID, ALIGNABLE_ANNOTATIONの記録, REF_ANNOTATIONの記録)
+            if HAS_LXML:
+                # lxmlはタグの絞り込みをCで行うので、TIME_SLOT/TIERの終了だけがループに来る
+                events = lxml_etree.iterparse(self.eaf_file_path, events=('end',), tag=('TIME_SLOT', 'TIER'))
+            else:
+                events = ET.iterparse(self.eaf_file_path, events=('end',))
+            
+            for _, elem in events:
+                if elem.tag == 'TIME_SLOT':
+                    # タイムスロット解析
+                    time_value = elem.get('TIME_VALUE')
+                    if time_value:
+                        self.time_slots[elem.get('TIME_SLOT_ID')] = int(time_value)
+                elif elem.tag == 'TIER':
+                    alignable = []
+                    refs = []
+                    # EAFの構造は固定（TIER/ANNOTATION/各注釈）なので、XPathで子孫を探さずに直接たどる
+                    for wrapper in elem.iterfind('ANNOTATION'):
+                        for annotation in wrapper:
+                            if annotation.tag == 'ALIGNABLE_ANNOTATION':
+                                alignable.append((annotation.get('ANNOTATION_ID'), annotation.get('TIME_SLOT_REF1'),
+                                                  annotation.get('TIME_SLOT_REF2'), _annotation_value(annotation)))
+                            elif annotation.tag == 'REF_ANNOTATION':
+                                refs.append((annotation.get('ANNOTATION_ID'), annotation.get('ANNOTATION_REF'),
+                                             _annotation_value(annotation)))
+                    tiers.append((elem.get('TIER_ID'), alignable, refs))
+                else:
+                    continue
+                
+                elem.clear()
+                if HAS_LXML:
+                    # 処理済みの前の兄弟要素も親から外す（空の要素が残り続けないように）
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
             
             print(f"EAFファイル読み込み: {self.eaf_file_path}")
             print(f"タイムスロット数: {len(self.time_slots)}")
             
-            # アノテーション解析
-            all_annotations = {}
+            # アノテーション解析（タイムスロットが全て揃ってから、ファイル中の順に解決）
+            all_annotations = {}  # REF_ANNOTATIONから参照されるIDの注釈だけを記録
+            referenced_ids = {ref_id for _, _, refs in tiers for _, ref_id, _ in refs}
+            time_slots = self.time_slots
             
-            for tier in root.findall('.//TIER'):
-                tier_id = tier.get('TIER_ID')
+            for tier_id, alignable, refs in tiers:
                 annotations = []
                 
-                # ALIGNABLE_ANNOTATION
-                for annotation in tier.findall('.//ALIGNABLE_ANNOTATION'):
-                    annotation_id = annotation.get('ANNOTATION_ID')
-                    start_slot = annotation.get('TIME_SLOT_REF1')
-                    end_slot = annotation.get('TIME_SLOT_REF2')
-                    
-                    if start_slot in self.time_slots and end_slot in self.time_slots:
-                        value_elem = annotation.find('ANNOTATION_VALUE')
-                        value = value_elem.text if value_elem is not None and value_elem.text else ""
-                        
+                # ALIGNABLE_ANNOTATION（時刻はintなので、getの結果がNoneならタイムスロットなし: 辞書の参照は各1回）
+                for annotation_id, start_slot, end_slot, value in alignable:
+                    start_time = time_slots.get(start_slot)
+                    end_time = time_slots.get(end_slot)
+                    if start_time is not None and end_time is not None:
                         ann_data = {
-                            'start_time': self.time_slots[start_slot],
-                            'end_time': self.time_slots[end_slot],
-                            'value': value.strip(),
+                            'start_time': start_time,
+                            'end_time': end_time,
+                            'value': value,
                             'annotation_id': annotation_id
                         }
                         annotations.append(ann_data)
-                        all_annotations[annotation_id] = ann_data
+                        if annotation_id in referenced_ids:
+                            all_annotations[annotation_id] = ann_data
                 
                 # REF_ANNOTATION
-                for annotation in tier.findall('.//REF_ANNOTATION'):
-                    annotation_id = annotation.get('ANNOTATION_ID')
-                    ref_id = annotation.get('ANNOTATION_REF')
-                    
+                for annotation_id, ref_id, value in refs:
                     if ref_id in all_annotations:
                         ref_ann = all_annotations[ref_id]
-                        value_elem = annotation.find('ANNOTATION_VALUE')
-                        value = value_elem.text if value_elem is not None and value_elem.text else ""
-                        
                         ann_data = {
                             'start_time': ref_ann['start_time'],
                             'end_time': ref_ann['end_time'],
-                            'value': value.strip(),
+                            'value': value,
                             'annotation_id': annotation_id,
                             'ref_annotation': ref_id
                         }
                         annotations.append(ann_data)
-                        all_annotations[annotation_id] = ann_data
+                        if annotation_id in referenced_ids:
+                            all_annotations[annotation_id] = ann_data
                 
                 self.annotations[tier_id] = annotations
             
@@ -139,6 +288,11 @@ class SimpleEAFConverter:
             print(f"text層が見つかりません")
             return sentences
         
+        # 各ティアを一度だけ開始時刻順に並べ、文ごとの区間検索は二分探索で行う
+        word_index = _IntervalIndex(word_annotations)
+        gloss_index = _IntervalIndex(gloss_annotations)
+        trans_index = _IntervalIndex(trans_annotations)
+        
         for text_ann in text_annotations:
             text_start = text_ann['start_time']
             text_end = text_ann['end_time']
@@ -146,28 +300,12 @@ class SimpleEAFConverter:
             
             print(f"処理中: {text_content} ({text_start}ms - {text_end}ms)")
             
-            words_in_sentence = []
-            glosses_in_sentence = []
-            
-            for word_ann in word_annotations:
-                if (word_ann['start_time'] >= text_start and word_ann['end_time'] <= text_end):
-                    words_in_sentence.append(word_ann)
+            # 文の範囲に収まるword/gloss（索引が開始時刻順なので並べ替え不要）
+            word_text = " ".join(word_index.values_within(text_start, text_end))
+            gloss_text = " ".join(gloss_index.values_within(text_start, text_end))
             
-            for gloss_ann in gloss_annotations:
-                if (gloss_ann['start_time'] >= text_start and gloss_ann['end_time'] <= text_end):
-                    glosses_in_sentence.append(gloss_ann)
-            
-            trans_content = ""
-            for trans_ann in trans_annotations:
-                if (trans_ann['start_time'] <= text_start and trans_ann['end_time'] >= text_end):
-                    trans_content = trans_ann['value']
-                    break
-            
-            words_in_sentence.sort(key=lambda x: x['start_time'])
-            glosses_in_sentence.sort(key=lambda x: x['start_time'])
-            
-            word_text = " ".join([ann['value'] for ann in words_in_sentence])
-            gloss_text = " ".join([ann['value'] for ann in glosses_in_sentence])
+            # 文の範囲を覆う最初の翻訳
+            trans_content = trans_index.first_value_covering(text_start, text_end)
             
             if word_text.strip():
                 sentence = {
@@ -184,41 +322,10 @@ class SimpleEAFConverter:
         return sentences
     
     def ipa_to_tipa(self, text):
-        # IPA→TIPA変換マップ（スペース保護版）
-        conversions = {}
-        conversions['ɨ'] = '\\textbari{}'
-        conversions['ɯ'] = '\\textturnm{}'
-        conversions['ɪ'] = '\\textsci{}'
-        conversions['ʊ'] = '\\textupsilon{}'
-        conversions['ə'] = '\\textschwa{}'
-        conversions['ɛ'] = '\\textepsilon{}'
-        conversions['ɔ'] = '\\textopeno{}'
-        conversions['æ'] = '\\textae{}'
-        conversions['ɑ'] = '\\textscripta{}'
-        conversions['ɸ'] = '\\textphi{}'
-        conversions['β'] = '\\textbeta{}'
-        conversions['θ'] = '\\texttheta{}'
-        conversions['ð'] = '\\textdh{}'
-        conversions['ʃ'] = '\\textesh{}'
-        conversions['ʒ'] = '\\textyogh{}'
-        conversions['ç'] = '\\textcçc{}'
-        conversions['ɣ'] = '\\textgamma{}'
-        conversions['χ'] = '\\textchi{}'
-        conversions['ʁ'] = '\\textinvscr{}'
-        conversions['ɱ'] = '\\textmrleg{}'
-        conversions['ɳ'] = '\\textrtailn{}'
-        conversions['ɲ'] = '\\textltailn{}'
-        conversions['ŋ'] = '\\texteng{}'
-        conversions['ɾ'] = '\\textfishhookr{}'
-        conversions['ɹ'] = '\\textturnr{}'
-        conversions['ʔ'] = '\\textglotstop{}'
-        conversions['ː'] = ':'
-        
-        result = text
-        for ipa_char, tipa_code in conversions.items():
-            result = result.replace(ipa_char, tipa_code)
-        
-        return result
+        if text.isascii():
+            # IPA側は全て非ASCII文字なので、ASCIIのみのテキストは変換不要
+            return text
+        return text.translate(_IPA_TO_TIPA)
     
     def load_audio(self):
         """音声ファイルを読み込む"""
@@ -236,9 +343,16 @@ class SimpleEAFConverter:
             
         try:
             if AUDIO_LIBRARY == 'librosa':
-                self.audio_data, self.sample_rate = librosa.load(self.wav_file_path, sr=None)
+                self.close()  # 読み込み直しのときは前のファイルを閉じる
+                try:
+                    # 全体を読み込まず、保存する区間だけをファイルから読む
+                    self._sound_file = sf.SoundFile(self.wav_file_path)
+                    self.sample_rate = self._sound_file.samplerate
+                except RuntimeError:
+                    # libsndfileで読めない形式（mp3など）はlibrosaで全体を読み込む
+                    self.audio_data, self.sample_rate = librosa.load(self.wav_file_path, sr=None)
                 print(f"音声ファイル読み込み: {self.wav_file_path}")
-                print(f"サンプリング周波数: {self.sample_rate}Hz, 長さ: {len(self.audio_data)/self.sample_rate:.2f}秒")
+                print(f"サンプリング周波数: {self.sample_rate}Hz, 長さ: {self._sample_count()/self.sample_rate:.2f}秒")
                 
             elif AUDIO_LIBRARY == 'pydub':
                 if self.wav_file_path.lower().endswith('.wav'):
@@ -266,37 +380,90 @@ class SimpleEAFConverter:
             print(f"音声読み込みエラー: {e}")
             return False
     
+    def close(self):
+        """load_audioで開いたままの音声ファイルを閉じる（以降の音声保存は不可）"""
+        if self._sound_file is not None:
+            self._sound_file.close()
+            self._sound_file = None
+            self.audio_available = False
+    
     def save_audio_segment(self, start_ms, end_ms, output_path, padding_ms=100):
         """指定時間範囲の音声を保存"""
         if not self.audio_available:
             return False
+        
+        if AUDIO_LIBRARY in _ARRAY_AUDIO_LIBRARIES:
+            return self._write_samples(*self._segment_sample_range(start_ms, end_ms, padding_ms), output_path)
             
         try:
+            # pydub: ミリ秒単位でスライスして書き出す
             padded_start = max(0, start_ms - padding_ms)
+            padded_end = end_ms + padding_ms
+            audio_segment = self.audio_data[padded_start:padded_end]
+            audio_segment.export(output_path, format="wav")
+            return True
+            
+        except Exception as e:
+            print(f"音声保存エラー: {e}")
+            return False
+    
+    def _segment_sample_range(self, start_ms, end_ms, padding_ms):
+        """パディング込みの区間のサンプル範囲 (開始, 終了)"""
+        padded_start = max(0, start_ms - padding_ms)
+        start_sample = int((padded_start / 1000.0) * self.sample_rate)
+        end_sample = int((end_ms / 1000.0) * self.sample_rate)
+        padded_end_sample = min(self._sample_count(), end_sample + int((padding_ms / 1000.0) * self.sample_rate))
+        return start_sample, padded_end_sample
+    
+    def _segment_sample_ranges(self, segments, padding_ms):
+        """(start_ms, end_ms)のリスト全体のサンプル範囲をNumPyで一度に計算（_segment_sample_rangeと同じ計算）"""
+        start_ms = np.fromiter((start for start, _ in segments), dtype=np.int64, count=len(segments))
+        end_ms = np.fromiter((end for _, end in segments), dtype=np.int64, count=len(segments))
+        start_samples = ((np.maximum(start_ms - padding_ms, 0) / 1000.0) * self.sample_rate).astype(np.int64)
+        end_samples = np.minimum(
+            self._sample_count(),
+            ((end_ms / 1000.0) * self.sample_rate).astype(np.int64) + int((padding_ms / 1000.0) * self.sample_rate)
+        )
+        return list(zip(start_samples.tolist(), end_samples.tolist()))
+    
+    def _sample_count(self):
+        """音声全体のサンプル（フレーム）数"""
+        if self._sound_file is not None:
+            return self._sound_file.frames
+        return len(self.audio_data)
+    
+    def _read_samples(self, start_sample, end_sample):
+        """開いているSoundFileから[start_sample, end_sample)だけをモノラルで読む
+        
+        モノラルは切り出して書き出すだけなので、float32に変換せずint16のまま読む（PCM16の音声はそのままの値）。
+        複数チャンネルはlibrosa.loadと同じくfloat32で平均してモノラルにする
+        """
+        start_sample = min(start_sample, self._sound_file.frames)
+        frame_count = max(0, end_sample - start_sample)
+        with self._sound_file_lock:
+            self._sound_file.seek(start_sample)
+            if self._sound_file.channels == 1:
+                return self._sound_file.read(frame_count, dtype='int16')
+            audio_segment = self._sound_file.read(frame_count, dtype='float32')
+        return audio_segment.mean(axis=1)
+    
+    def _write_samples(self, start_sample, end_sample, output_path):
+        """音声の[start_sample, end_sample)をWAVファイルとして保存"""
+        try:
+            if self._sound_file is not None:
+                audio_segment = self._read_samples(start_sample, end_sample)
+            else:
+                audio_segment = self.audio_data[start_sample:end_sample]  # コピーではなくビュー
             
             if AUDIO_LIBRARY == 'librosa':
-                start_sample = int((padded_start / 1000.0) * self.sample_rate)
-                end_sample = int((end_ms / 1000.0) * self.sample_rate)
-                padded_end_sample = min(len(self.audio_data), end_sample + int((padding_ms / 1000.0) * self.sample_rate))
-                audio_segment = self.audio_data[start_sample:padded_end_sample]
-                sf.write(output_path, audio_segment, self.sample_rate)
-                
-            elif AUDIO_LIBRARY == 'pydub':
-                padded_end = end_ms + padding_ms
-                audio_segment = self.audio_data[padded_start:padded_end]
-                audio_segment.export(output_path, format="wav")
-                
-            elif AUDIO_LIBRARY == 'wave':
-                start_sample = int((padded_start / 1000.0) * self.sample_rate)
-                end_sample = int((end_ms / 1000.0) * self.sample_rate)
-                padded_end_sample = min(len(self.audio_data), end_sample + int((padding_ms / 1000.0) * self.sample_rate))
-                audio_segment = self.audio_data[start_sample:padded_end_sample]
-                
+                sf.write(output_path, audio_segment, self.sample_rate, subtype='PCM_16')
+            else:
                 with wave.open(output_path, 'wb') as wav_out:
                     wav_out.setnchannels(1)
                     wav_out.setsampwidth(2)
                     wav_out.setframerate(self.sample_rate)
-                    wav_out.writeframes(audio_segment.tobytes())
+                    # writeframesはバッファをそのまま受け取れるので、tobytes()でコピーしない
+                    wav_out.writeframes(audio_segment)
             
             return True
             
@@ -304,177 +471,116 @@ class SimpleEAFConverter:
             print(f"音声保存エラー: {e}")
             return False
     
-    def create_gb4e(self, sentences):
-        lines = []
-        lines.append("% GB4E形式の例文")
-        lines.append("% プリアンブルに \\usepackage{tipa} を追加")
-        lines.append("")
-        
-        for i, sentence in enumerate(sentences, 1):
-            if not sentence['word']:
-                continue
-            
-            word_text = sentence['word']
-            gloss_text = sentence['gloss']
-            trans_text = sentence['trans']
-            
-            # カンマをスペースに変換
-            clean_gloss = ""
-            for char in gloss_text:
-                if char == ",":
-                    clean_gloss = clean_gloss + " "
-                else:
-                    clean_gloss = clean_gloss + char
-            
-            # IPA→TIPA変換
-            tipa_word = self.ipa_to_tipa(word_text)
-            
-            # GB4E標準形式：改行を%で終了して継続
-            lines.append("\\begin{exe}")
-            lines.append("\\ex")
-            lines.append("\\gll " + tipa_word + " \\\\%")
-            lines.append("     " + clean_gloss + " \\\\%")
-            lines.append("\\glt " + trans_text)
-            lines.append("\\end{exe}")
-        
     def create_gb4e_with_spacing_fix(self, sentences):
         """GB4E行間問題の根本解決版"""
-        lines = []
-        lines.append("% GB4E形式の例文（行間問題根本解決版）")
-        lines.append("% プリアンブルに以下を必ず追加:")
-        lines.append("% \\usepackage{tipa}")
-        lines.append("% \\usepackage{gb4e}")
-        lines.append("% % GB4E行間調整（重要）")
-        lines.append("% \\let\\eachwordone=\\it")
-        lines.append("% \\let\\eachwordtwo=\\rm") 
-        lines.append("% \\def\\glossglue{\\hfil}")
-        lines.append("% \\setlength{\\glossglue}{0pt}")
-        lines.append("")
-        
-        for i, sentence in enumerate(sentences, 1):
-            if not sentence['word']:
-                continue
-            
-            word_text = sentence['word']
-            gloss_text = sentence['gloss']
-            trans_text = sentence['trans']
-            
-            clean_gloss = gloss_text.replace(',', ' ')
-            tipa_word = self.ipa_to_tipa(word_text)
-            
-            # 厳密なGB4E形式（行間制御）
-            lines.append("\\begin{exe}")
-            lines.append("\\ex")
-            lines.append("\\gll " + tipa_word + "\\\\")
-            lines.append("     " + clean_gloss + "\\\\")
-            lines.append("\\glt `" + trans_text + "'%")
-            lines.append("\\end{exe}")
-            lines.append("")
-        
-        return "\n".join(lines)
+        return "".join(self._gb4e_chunks(sentences))
+    
+    def _gb4e_chunks(self, sentences):
+        """create_gb4e_with_spacing_fixの内容をヘッダー・例文ごとに順に返す（ファイルへ直接書き出す用）"""
+        yield _GB4E_SPACING_FIX_HEADER
+        # 厳密なGB4E形式（行間制御）: 1例文を1つのf文字列で作る
+        for sentence in sentences:
+            if sentence['word']:
+                yield (
+                    f"\n\\begin{{exe}}\n\\ex\n\\gll {self.ipa_to_tipa(sentence['word'])}\\\\\n"
+                    f"     {sentence['gloss'].replace(',', ' ')}\\\\\n"
+                    f"\\glt `{sentence['trans']}'%\n\\end{{exe}}\n"
+                )
 
     def create_gb4e_minimal(self, sentences):
         """最小限GB4E形式（行間問題回避）"""
-        lines = []
-        lines.append("% GB4E形式の例文（最小限版）")
-        lines.append("")
-        
-        for i, sentence in enumerate(sentences, 1):
-            if not sentence['word']:
-                continue
-            
-            word_text = sentence['word']
-            gloss_text = sentence['gloss']
-            trans_text = sentence['trans']
-            
-            clean_gloss = gloss_text.replace(',', ' ')
-            tipa_word = self.ipa_to_tipa(word_text)
-            
-            # 最小限の書式（スペース最小化）
-            lines.append("\\begin{exe}\\ex")
-            lines.append("\\gll " + tipa_word + "\\\\")
-            lines.append(clean_gloss + "\\\\")
-            lines.append("\\glt `" + trans_text + "'\\end{exe}")
-            lines.append("")
-        
-        return "\n".join(lines)
+        # 最小限の書式（スペース最小化）: 1例文を1つのf文字列で作り、最後に一度だけ連結
+        return _GB4E_MINIMAL_HEADER + "".join(
+            f"\n\\begin{{exe}}\\ex\n\\gll {self.ipa_to_tipa(sentence['word'])}\\\\\n"
+            f"{sentence['gloss'].replace(',', ' ')}\\\\\n"
+            f"\\glt `{sentence['trans']}'\\end{{exe}}\n"
+            for sentence in sentences if sentence['word']
+        )
 
     def create_gb4e(self, sentences):
         # 問題解決版を優先使用
         return self.create_gb4e_with_spacing_fix(sentences)
     
     def create_txt(self, sentences):
-        lines = []
-        lines.append("EAF例文集")
-        lines.append("=" * 50)
-        lines.append("")
-        
+        return "".join(self._txt_chunks(sentences))
+    
+    def _txt_chunks(self, sentences):
+        """create_txtの内容をヘッダー・例文ごとに順に返す（ファイルへ直接書き出す用）"""
+        yield _TXT_HEADER
+        # 例文ごとに番号・word・gloss・transの行を作る
         for i, sentence in enumerate(sentences, 1):
-            if not sentence['word']:
-                continue
-            
-            lines.append(f"({i})")
-            lines.append(sentence['word'])
-            lines.append(sentence['gloss'])
-            lines.append(sentence['trans'])
-            lines.append("")
-        
-        return "\n".join(lines)
+            if sentence['word']:
+                yield f"\n({i})\n{sentence['word']}\n{sentence['gloss']}\n{sentence['trans']}\n"
     
     def save_to_desktop(self, sentences):
-        desktop_path = get_desktop_path()
+        desktop_path = Path(get_desktop_path())
         base_name = Path(self.eaf_file_path).stem
         folder_name = f"{base_name}_output"
         
-        output_path = Path(desktop_path) / folder_name
+        output_path = desktop_path / folder_name
         if output_path.exists():
             timestamp = int(time.time())
-            backup_path = Path(desktop_path) / f"{folder_name}_backup_{timestamp}"
+            backup_path = desktop_path / f"{folder_name}_backup_{timestamp}"
             shutil.move(str(output_path), str(backup_path))
             print(f"バックアップ: {backup_path}")
         
         output_path.mkdir(parents=True, exist_ok=True)
         
         # GB4E形式保存
-        gb4e_content = self.create_gb4e(sentences)
+        # 全体を1つの文字列にせず、例文ごとの文字列をバッファ付きでそのまま書き出す
         gb4e_file = output_path / 'sentences_gb4e.tex'
-        with open(gb4e_file, 'w', encoding='utf-8') as f:
-            f.write(gb4e_content)
+        with open(gb4e_file, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+            f.writelines(self._gb4e_chunks(sentences))
         print(f"GB4E保存: {gb4e_file}")
         
         # TXT形式保存
-        txt_content = self.create_txt(sentences)
         txt_file = output_path / 'sentences.txt'
-        with open(txt_file, 'w', encoding='utf-8') as f:
-            f.write(txt_content)
+        with open(txt_file, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+            f.writelines(self._txt_chunks(sentences))
         print(f"TXT保存: {txt_file}")
         
         # 音声ファイル保存
         saved_audio_files = []
         if self.audio_available:
             print("音声ファイル分割中...")
+            jobs = []  # (ファイル名, 保存先, 開始ms, 終了ms)
+            output_prefix = str(output_path) + os.sep  # 文ごとにPathを作らず文字列連結で保存先を作る
             for i, sentence in enumerate(sentences, 1):
                 if not sentence.get('start_time') or not sentence.get('end_time'):
                     print(f"⚠️ 文 {i} に時間情報がありません")
                     continue
                 
                 # 安全なファイル名生成
-                safe_word = re.sub(r'[^\w\s-]', '', sentence['word'][:30])
-                safe_word = re.sub(r'\s+', '_', safe_word.strip())
+                safe_word = _UNSAFE_FILENAME_RE.sub('', sentence['word'][:30])
+                safe_word = _WHITESPACE_RE.sub('_', safe_word.strip())
                 if not safe_word:
                     safe_word = f"sentence_{i}"
                 
                 filename = f"{i:03d}_{safe_word}.wav"
-                audio_file = output_path / filename
-                
-                success = self.save_audio_segment(
-                    sentence['start_time'],
-                    sentence['end_time'],
-                    str(audio_file)
-                )
-                
+                jobs.append((filename, output_prefix + filename, sentence['start_time'], sentence['end_time']))
+            
+            # 各ファイルの書き出しは独立しており、libsndfile/ディスクI/O中はGILが解放されるのでスレッドで並列化
+            with ThreadPoolExecutor(max_workers=_SEGMENT_WRITE_WORKERS) as executor:
+                if AUDIO_LIBRARY in _ARRAY_AUDIO_LIBRARIES and jobs:
+                    # 全文のサンプル範囲を一度に計算し、配列のビューをそのまま書き出す
+                    sample_ranges = self._segment_sample_ranges([(start, end) for _, _, start, end in jobs], padding_ms=100)
+                    results = list(executor.map(
+                        self._write_samples,
+                        [start_sample for start_sample, _ in sample_ranges],
+                        [end_sample for _, end_sample in sample_ranges],
+                        [audio_file for _, audio_file, _, _ in jobs]
+                    ))
+                else:
+                    results = list(executor.map(
+                        self.save_audio_segment,
+                        [start for _, _, start, _ in jobs],
+                        [end for _, _, _, end in jobs],
+                        [audio_file for _, audio_file, _, _ in jobs]
+                    ))
+            
+            for (filename, audio_file, _, _), success in zip(jobs, results):
                 if success:
-                    saved_audio_files.append(str(audio_file))
+                    saved_audio_files.append(audio_file)
                     print(f"✅ 音声保存: {filename}")
                 else:
                     print(f"❌ 音声保存失敗: {filename}")
@@ -506,17 +612,21 @@ def convert_eaf_simple(eaf_filename, wav_filename=None, tier_names=None):
     if not converter.parse_eaf():
         return None
     
-    # 音声ファイルがある場合は読み込み
-    if wav_filename:
-        converter.load_audio()
-    
-    sentences = converter.extract_sentences(tier_names)
-    
-    if not sentences:
-        print("変換可能な文が見つかりませんでした")
-        return None
-    
-    result = converter.save_to_desktop(sentences)
+    try:
+        # 音声ファイルがある場合は読み込み
+        if wav_filename:
+            converter.load_audio()
+        
+        sentences = converter.extract_sentences(tier_names)
+        
+        if not sentences:
+            print("変換可能な文が見つかりませんでした")
+            return None
+        
+        result = converter.save_to_desktop(sentences)
+    finally:
+        # 区間の読み出し用に開いたままの音声ファイルを閉じる
+        converter.close()
     
     print(f"\n🎉 変換完了!")
     print(f"📊 抽出文数: {len(sentences)}")